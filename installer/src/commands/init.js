@@ -390,6 +390,9 @@ secrets/
 *.engine
 checkpoints/
 
+# Local caches (rebuilt automatically, never commit)
+cache/
+
 # Local state (optional - uncomment if you want to track state)
 # pipeline-state.yaml
 
@@ -7,11 +7,19 @@ An agentic framework for object detection model development.
 __version__ = "1.0.0-alpha"
 __author__ = "vfrog.ai"
 
-from croak.core.state import PipelineState
-from croak.core.config import CroakConfig
-
 __all__ = [
     "__version__",
     "PipelineState",
     "CroakConfig",
 ]
+
+
+def __getattr__(name):
+    # Deferred so `croak --version` and other light commands skip importing pydantic
+    if name == "PipelineState":
+        from croak.core.state import PipelineState
+        return PipelineState
+    if name == "CroakConfig":
+        from croak.core.config import CroakConfig
+        return CroakConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,22 +1,115 @@
 """Agent definition loader and router."""
 
+import hashlib
+import os
+import pickle
+import re
+import sys
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from typing import Any, Dict, FrozenSet, Optional, List, Tuple, Type, TypeVar
 import yaml
-from pydantic import BaseModel, Field
 
+from croak.core._yaml import atomic_write, cache_dir
 
-class AgentCapability(BaseModel):
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Agent YAMLs are author-controlled and checked by `make validate-agents`,
+# so the runtime loader skips per-field validation unless told otherwise.
+_TRUSTED = os.environ.get("CROAK_TRUST_YAML", "1") == "1"
+
+# Warm starts reuse a pickled copy of the loaded agents (see AgentLoader).
+_CACHE_ENABLED = os.environ.get("CROAK_AGENT_CACHE", "1") == "1"
+
+_T = TypeVar("_T")
+
+
+@lru_cache(maxsize=None)
+def _init_fields(cls: type) -> FrozenSet[str]:
+    """Names of a dataclass's constructor fields."""
+    return frozenset(f.name for f in fields(cls) if f.init)
+
+
+def _build(cls: Type[_T], data: Dict[str, Any], validate: bool = not _TRUSTED) -> _T:
+    """Build an agent dataclass from YAML data, validating only when requested.
+
+    Unknown keys are ignored so newer agent YAMLs still load.
+
+    Args:
+        cls: Dataclass to build.
+        data: Field values keyed by field name.
+        validate: Check field types with Pydantic (imported only in this mode).
+
+    Returns:
+        Dataclass instance.
+    """
+    known = _init_fields(cls)
+    values = {k: v for k, v in data.items() if k in known}
+    if validate:
+        return _type_adapter(cls).validate_python(values)
+    return cls(**values)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(cls: type):
+    """Pydantic TypeAdapter for an agent dataclass, built once per class."""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(cls)
+
+
+@lru_cache(maxsize=256)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse an agent YAML file, memoized per path and modification time.
+
+    The returned mapping is shared between callers and must not be mutated
+    beyond interning its string values.
+
+    Args:
+        path: File path.
+        mtime_ns: Modification time; part of the cache key only.
+
+    Returns:
+        Parsed YAML mapping.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _intern(data: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Intern short, frequently repeated string values in a YAML mapping.
+
+    Args:
+        data: Mapping parsed from YAML; updated in place.
+        keys: Keys whose string values repeat across agents.
+
+    Returns:
+        The same mapping.
+    """
+    for key in keys:
+        value = data.get(key)
+        if isinstance(value, str):
+            data[key] = sys.intern(value)
+    return data
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AgentCapability:
     """Single agent capability."""
     id: str
     name: str
     description: str
 
 
-class AgentCommand(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AgentCommand:
     """Agent menu command."""
     trigger: str
-    aliases: List[str] = Field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
     cli: Optional[str] = None
     description: str
     capability: str
@@ -26,7 +119,8 @@ class AgentCommand(BaseModel):
     mutates_state: bool = False
 
 
-class CriticalAction(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CriticalAction:
     """Critical action rule."""
     id: str
     rule: str
@@ -34,7 +128,8 @@ class CriticalAction(BaseModel):
     violation: str = "warning"  # warning, error, block
 
 
-class Guardrail(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Guardrail:
     """Guardrail check."""
     id: str
     name: str
@@ -45,15 +140,17 @@ class Guardrail(BaseModel):
     error_message: str = ""
 
 
-class HandoffSpec(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HandoffSpec:
     """Handoff specification."""
     agent: str  # from or to agent
     contract: str
-    schema_path: str = Field(alias="schema")
-    required_fields: List[str] = Field(default_factory=list)
+    schema_path: str  # "schema" in agent YAML
+    required_fields: List[str] = field(default_factory=list)
 
 
-class KnowledgeFile(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class KnowledgeFile:
     """Knowledge file reference."""
     id: str
     path: str
@@ -61,7 +158,17 @@ class KnowledgeFile(BaseModel):
     description: str = ""
 
 
-class AgentDefinition(BaseModel):
+# (heading, attribute) pairs for the persona part of the system prompt
+_PROMPT_PERSONA_SECTIONS = (
+    ("## Role", "role"),
+    ("## Identity", "identity"),
+    ("## Communication Style", "communication_style"),
+    ("## Principles", "principles"),
+)
+
+
+@dataclass(slots=True, kw_only=True)
+class AgentDefinition:
     """Loaded agent definition."""
     id: str
     name: str
@@ -79,64 +186,57 @@ class AgentDefinition(BaseModel):
 
     # Capabilities and commands
     capabilities_summary: str = ""
-    capabilities: List[AgentCapability] = Field(default_factory=list)
-    commands: List[AgentCommand] = Field(default_factory=list)
+    capabilities: List[AgentCapability] = field(default_factory=list)
+    commands: List[AgentCommand] = field(default_factory=list)
 
     # Rules and guardrails
-    critical_actions: List[CriticalAction] = Field(default_factory=list)
-    guardrails: List[Guardrail] = Field(default_factory=list)
+    critical_actions: List[CriticalAction] = field(default_factory=list)
+    guardrails: List[Guardrail] = field(default_factory=list)
 
     # Handoffs
-    receives_from: List[HandoffSpec] = Field(default_factory=list)
-    sends_to: List[HandoffSpec] = Field(default_factory=list)
+    receives_from: List[HandoffSpec] = field(default_factory=list)
+    sends_to: List[HandoffSpec] = field(default_factory=list)
 
     # Knowledge and templates
-    knowledge_files: List[KnowledgeFile] = Field(default_factory=list)
-    template_files: List[str] = Field(default_factory=list)
+    knowledge_files: List[KnowledgeFile] = field(default_factory=list)
+    template_files: List[str] = field(default_factory=list)
+
+    # Derived once per agent; see get_system_prompt() and get_command()
+    _system_prompt: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _command_index: Dict[str, AgentCommand] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _router_fragment: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def get_system_prompt(self) -> str:
         """Generate system prompt for AI assistant.
 
+        The prompt is built on first use and cached on the instance.
+
         Returns:
             Formatted system prompt string.
         """
-        caps_list = "\n".join(
-            f"- **{c.name}**: {c.description}"
-            for c in self.capabilities
-        )
-        cmds_list = "\n".join(
-            f"- `{c.cli}` - {c.description}"
-            for c in self.commands
-            if c.cli
-        )
-        rules_list = "\n".join(
-            f"- {a.rule}"
-            for a in self.critical_actions
-        )
-
-        return f"""You are **{self.name}**, the CROAK {self.title}. {self.icon}
-
-## Role
-{self.role}
-
-## Identity
-{self.identity}
-
-## Communication Style
-{self.communication_style}
-
-## Principles
-{self.principles}
-
-## Capabilities
-{caps_list}
-
-## Available Commands
-{cmds_list}
-
-## Critical Rules
-{rules_list}
-"""
+        if self._system_prompt is None:
+            self._system_prompt = self._build_system_prompt()
+        return self._system_prompt
+
+    def _build_system_prompt(self) -> str:
+        """Render the system prompt from the agent's fields."""
+        parts = [f"You are **{self.name}**, the CROAK {self.title}. {self.icon}", ""]
+        for heading, attr in _PROMPT_PERSONA_SECTIONS:
+            parts += [heading, getattr(self, attr), ""]
+        parts += [
+            "## Capabilities",
+            "\n".join([f"- **{c.name}**: {c.description}" for c in self.capabilities]),
+            "",
+            "## Available Commands",
+            "\n".join([f"- `{c.cli}` - {c.description}" for c in self.commands if c.cli]),
+            "",
+            "## Critical Rules",
+            "\n".join([f"- {a.rule}" for a in self.critical_actions]),
+            "",
+        ]
+        return "\n".join(parts)
 
     def get_command(self, trigger: str) -> Optional[AgentCommand]:
         """Get command by trigger or alias.
@@ -147,13 +247,33 @@ class AgentDefinition(BaseModel):
         Returns:
             AgentCommand if found, None otherwise.
         """
-        trigger_lower = trigger.lower()
+        if not self._command_index:
+            self._command_index = self._build_command_index()
+        return self._command_index.get(trigger.lower())
+
+    def _build_command_index(self) -> Dict[str, AgentCommand]:
+        """Map lowercased triggers and aliases to commands.
+
+        The first command claiming a name wins, matching declaration order.
+        """
+        index: Dict[str, AgentCommand] = {}
         for cmd in self.commands:
-            if cmd.trigger.lower() == trigger_lower:
-                return cmd
-            if trigger_lower in [a.lower() for a in cmd.aliases]:
-                return cmd
-        return None
+            index.setdefault(cmd.trigger.lower(), cmd)
+            for alias in cmd.aliases:
+                index.setdefault(alias.lower(), cmd)
+        return index
+
+    def get_router_fragment(self) -> str:
+        """Describe this agent and its commands for the router.
+
+        Returns:
+            Markdown fragment, cached after the first call.
+        """
+        if self._router_fragment is None:
+            self._router_fragment = f"**{self.name}** ({self.title}):\n" + "\n".join(
+                [f"  - {c.trigger}: {c.description}" for c in self.commands]
+            )
+        return self._router_fragment
 
     def get_capability(self, capability_id: str) -> Optional[AgentCapability]:
         """Get capability by ID.
@@ -170,39 +290,180 @@ class AgentDefinition(BaseModel):
         return None
 
 
-class AgentLoader:
-    """Load and manage agent definitions."""
+@dataclass(slots=True, kw_only=True)
+class AgentStub:
+    """Lightweight agent index entry, read without building the full definition."""
+    name: str
+    title: str
+    path: Path
+    triggers: List[str] = field(default_factory=list)  # lowercased triggers and aliases
 
-    def __init__(self, agents_dir: Path):
+
+class AgentLoader:
+    """Load and manage agent definitions.
+
+    Agents can be loaded eagerly with load_all(), or progressively: load_index()
+    records only names and command triggers, and get_agent()/route_command()
+    build a full AgentDefinition the first time that agent is needed.
+    """
+
+    def __init__(
+        self,
+        agents_dir: Path,
+        validate: Optional[bool] = None,
+        cache_path: Optional[Path] = None,
+    ):
         """Initialize agent loader.
 
         Args:
             agents_dir: Directory containing agent definitions.
+            validate: Fully validate agent YAML. Defaults to the inverse of
+                the CROAK_TRUST_YAML environment flag.
+            cache_path: Pickle file caching loaded agents between runs.
+                Defaults to .croak/cache/agents.pkl when agents_dir lives in
+                a project's .croak directory. Disabled by CROAK_AGENT_CACHE=0.
         """
         self.agents_dir = agents_dir
+        self.validate = (not _TRUSTED) if validate is None else validate
+        if cache_path is None and agents_dir.parent.name == ".croak":
+            cache_path = agents_dir.parent / "cache" / "agents.pkl"
+        self.cache_path = cache_path if _CACHE_ENABLED else None
         self._agents: Dict[str, AgentDefinition] = {}
         self._command_map: Dict[str, Tuple[str, AgentCommand]] = {}
+        self._stubs: Dict[str, AgentStub] = {}
+        self._routes: Optional[Dict[str, str]] = None
+        self._dispatch_re: Optional[re.Pattern] = None
+        self._word_index: Dict[str, List[Tuple[int, str, str]]] = {}
+
+    def _cache_key(self) -> str:
+        """Fingerprint the agent YAML tree by path, mtime and size.
+
+        This module's own stat is included too: the pickled classes live
+        here, and an editable install changes them without a new version.
+        """
+        from croak import __version__
+
+        code = os.stat(__file__)
+        digest = hashlib.blake2b(
+            f"{__version__}:{code.st_mtime_ns}:{code.st_size}:{self.validate}".encode()
+        )
+        for path in sorted(self.agents_dir.rglob("*agent.yaml")):
+            st = path.stat()
+            digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}".encode())
+        return digest.hexdigest()
+
+    def _read_cache(self, key: str) -> bool:
+        """Restore agents from the cache file if its key matches.
+
+        The key is stored as a plain-text first line and compared before
+        anything is unpickled, so a cache file that was not written for the
+        current agent YAMLs is never loaded.
+
+        Returns:
+            True if the cache was used.
+        """
+        header = f"{key}\n".encode()
+        try:
+            with open(self.cache_path, "rb") as f:
+                if f.readline(len(header)) != header:
+                    return False
+                agents, command_map = pickle.load(f)
+        except Exception:
+            return False  # Any unreadable or stale cache is just a miss
+        self._agents.update(agents)
+        self._command_map.update(command_map)
+        self._invalidate_routes()
+        return True
+
+    def _write_cache(self, key: str) -> None:
+        """Persist loaded agents; failures only cost the next warm start."""
+        def write(f):
+            f.write(f"{key}\n".encode())
+            pickle.dump((self._agents, self._command_map), f)
+
+        try:
+            if self.cache_path.parent.name == "cache":
+                cache_dir(self.cache_path.parent.parent)
+            else:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Replaced whole, so a concurrent croak never reads a partial pickle
+            atomic_write(self.cache_path, write, binary=True)
+        except OSError:
+            pass
+
+    def _agent_files(self) -> List[Path]:
+        """Find one definition file per agent subdirectory."""
+        files = []
+        with os.scandir(self.agents_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                # Look for {name}.agent.yaml, falling back to agent.yaml
+                yaml_file = os.path.join(entry.path, f"{entry.name}.agent.yaml")
+                if not os.path.isfile(yaml_file):
+                    yaml_file = os.path.join(entry.path, "agent.yaml")
+                    if not os.path.isfile(yaml_file):
+                        continue
+                files.append(Path(yaml_file))
+        return files
+
+    def _invalidate_routes(self) -> None:
+        """Drop routing tables derived from the loaded agents and stubs."""
+        self._routes = None
+
+    def load_index(self) -> Dict[str, AgentStub]:
+        """Index agents by name and command triggers without loading them.
+
+        Returns:
+            Dict mapping agent name to stub.
+        """
+        if not self.agents_dir.exists():
+            return self._stubs
+
+        for yaml_file in self._agent_files():
+            data = _parse_yaml(str(yaml_file), yaml_file.stat().st_mtime_ns)
+
+            agent_data = data.get('agent', data)
+            metadata = agent_data.get('metadata', {})
+            triggers = []
+            for c in agent_data.get('menu', {}).get('commands', []):
+                triggers.append(c.get('trigger', '').lower())
+                triggers.extend(a.lower() for a in c.get('aliases', []))
+
+            stub = AgentStub(
+                name=metadata.get('name', ''),
+                title=metadata.get('title', ''),
+                path=yaml_file,
+                triggers=triggers,
+            )
+            self._stubs[stub.name.lower()] = stub
+
+        self._invalidate_routes()
+        return self._stubs
 
     def load_all(self) -> Dict[str, AgentDefinition]:
         """Load all agent definitions.
 
+        Reuses the on-disk cache when no agent YAML has changed since it
+        was written.
+
         Returns:
             Dict mapping agent name to definition.
         """
         if not self.agents_dir.exists():
             return self._agents
 
-        for agent_dir in self.agents_dir.iterdir():
-            if agent_dir.is_dir():
-                # Look for {name}.agent.yaml
-                yaml_file = agent_dir / f"{agent_dir.name}.agent.yaml"
-                if yaml_file.exists():
-                    self.load_agent(yaml_file)
-                else:
-                    # Fallback to agent.yaml
-                    yaml_file = agent_dir / "agent.yaml"
-                    if yaml_file.exists():
-                        self.load_agent(yaml_file)
+        key = None
+        if self.cache_path is not None:
+            key = self._cache_key()
+            if self._read_cache(key):
+                return self._agents
+
+        for yaml_file in self._agent_files():
+            self.load_agent(yaml_file)
+
+        if key is not None:
+            self._write_cache(key)
 
         return self._agents
 
@@ -215,8 +476,7 @@ class AgentLoader:
         Returns:
             Loaded AgentDefinition.
         """
-        with open(yaml_path) as f:
-            data = yaml.safe_load(f)
+        data = _parse_yaml(str(yaml_path), Path(yaml_path).stat().st_mtime_ns)
 
         # Handle nested 'agent' key
         agent_data = data.get('agent', data)
@@ -232,50 +492,56 @@ class AgentLoader:
 
         # Parse capabilities
         capabilities = [
-            AgentCapability(**c)
+            _build(AgentCapability, _intern(c, ('id',)), self.validate)
             for c in caps_data.get('items', [])
         ]
 
         # Parse commands
         commands = [
-            AgentCommand(**c)
+            _build(
+                AgentCommand,
+                _intern(c, ('trigger', 'type', 'capability', 'workflow')),
+                self.validate,
+            )
             for c in menu_data.get('commands', [])
         ]
 
         # Parse critical actions
         critical_actions = [
-            CriticalAction(**a)
+            _build(CriticalAction, _intern(a, ('violation',)), self.validate)
             for a in critical_data.get('items', [])
         ]
 
         # Parse guardrails
         guardrails = [
-            Guardrail(**g)
+            _build(Guardrail, _intern(g, ('severity', 'trigger')), self.validate)
             for g in guardrails_data.get('checks', [])
         ]
 
         # Parse handoffs
-        receives_from = []
-        for h in handoffs_data.get('receives', []):
-            receives_from.append(HandoffSpec(
-                agent=h.get('from', ''),
-                contract=h.get('contract', ''),
-                schema=h.get('schema', ''),
-                required_fields=h.get('required_fields', []),
-            ))
-
-        sends_to = []
-        for h in handoffs_data.get('sends', []):
-            sends_to.append(HandoffSpec(
-                agent=h.get('to', ''),
-                contract=h.get('contract', ''),
-                schema=h.get('schema', ''),
-                required_fields=h.get('required_fields', []),
-            ))
+        receives_from = [
+            _build(HandoffSpec, {
+                'agent': h.get('from', ''),
+                'contract': h.get('contract', ''),
+                'schema_path': h.get('schema', ''),
+                'required_fields': h.get('required_fields', []),
+            }, self.validate)
+            for h in handoffs_data.get('receives', [])
+        ]
+
+        sends_to = [
+            _build(HandoffSpec, {
+                'agent': h.get('to', ''),
+                'contract': h.get('contract', ''),
+                'schema_path': h.get('schema', ''),
+                'required_fields': h.get('required_fields', []),
+            }, self.validate)
+            for h in handoffs_data.get('sends', [])
+        ]
 
         # Parse knowledge files
         knowledge_files = [
-            KnowledgeFile(**k)
+            _build(KnowledgeFile, _intern(k, ('load',)), self.validate)
             for k in knowledge_data.get('files', [])
         ]
 
@@ -286,38 +552,46 @@ class AgentLoader:
             if t.get('path')
         ]
 
-        agent = AgentDefinition(
-            id=metadata.get('id', ''),
-            name=metadata.get('name', ''),
-            title=metadata.get('title', ''),
-            icon=metadata.get('icon', ''),
-            version=metadata.get('version', '1.0'),
-            agent_version=metadata.get('agent_version', '0.1.0'),
-            has_sidecar=metadata.get('has_sidecar', False),
-            role=persona.get('role', ''),
-            identity=persona.get('identity', ''),
-            communication_style=persona.get('communication_style', ''),
-            principles=persona.get('principles', ''),
-            capabilities_summary=caps_data.get('summary', ''),
-            capabilities=capabilities,
-            commands=commands,
-            critical_actions=critical_actions,
-            guardrails=guardrails,
-            receives_from=receives_from,
-            sends_to=sends_to,
-            knowledge_files=knowledge_files,
-            template_files=template_files,
-        )
+        agent = _build(AgentDefinition, {
+            'id': metadata.get('id', ''),
+            'name': metadata.get('name', ''),
+            'title': metadata.get('title', ''),
+            'icon': metadata.get('icon', ''),
+            'version': metadata.get('version', '1.0'),
+            'agent_version': metadata.get('agent_version', '0.1.0'),
+            'has_sidecar': metadata.get('has_sidecar', False),
+            'role': persona.get('role', ''),
+            'identity': persona.get('identity', ''),
+            'communication_style': persona.get('communication_style', ''),
+            'principles': persona.get('principles', ''),
+            'capabilities_summary': caps_data.get('summary', ''),
+            'capabilities': capabilities,
+            'commands': commands,
+            'critical_actions': critical_actions,
+            'guardrails': guardrails,
+            'receives_from': receives_from,
+            'sends_to': sends_to,
+            'knowledge_files': knowledge_files,
+            'template_files': template_files,
+        }, self.validate)
+
+        # Warm derived lookups so they are also carried by the disk cache
+        agent.get_system_prompt()
+        agent.get_router_fragment()
+        agent._command_index = agent._build_command_index()
 
         # Register agent
         agent_key = agent.name.lower()
         self._agents[agent_key] = agent
+        self._invalidate_routes()
 
-        # Register commands for routing
-        for cmd in commands:
-            self._command_map[cmd.trigger.lower()] = (agent_key, cmd)
-            for alias in cmd.aliases:
-                self._command_map[alias.lower()] = (agent_key, cmd)
+        # Register commands for routing; trigger and aliases share one entry
+        entries = [(agent_key, cmd) for cmd in commands]
+        self._command_map.update({
+            sys.intern(key.lower()): entry
+            for entry in entries
+            for key in (entry[1].trigger, *entry[1].aliases)
+        })
 
         return agent
 
@@ -330,7 +604,11 @@ class AgentLoader:
         Returns:
             AgentDefinition if found, None otherwise.
         """
-        return self._agents.get(name.lower())
+        agent_key = name.lower()
+        agent = self._agents.get(agent_key)
+        if agent is None and agent_key in self._stubs:
+            agent = self.load_agent(self._stubs[agent_key].path)
+        return agent
 
     def get_agent_by_role(self, role: str) -> Optional[AgentDefinition]:
         """Get agent by role/title.
@@ -349,7 +627,7 @@ class AgentLoader:
             'router': 'dispatcher',
         }
         agent_name = role_mapping.get(role.lower(), role.lower())
-        return self._agents.get(agent_name)
+        return self.get_agent(agent_name)
 
     def route_command(self, user_input: str) -> Optional[Tuple[AgentDefinition, AgentCommand]]:
         """Route user input to appropriate agent and command.
@@ -361,20 +639,71 @@ class AgentLoader:
             Tuple of (agent, command) if matched, None otherwise.
         """
         input_lower = user_input.lower().strip()
+        input_words = input_lower.split()
+        if not input_words:
+            return None
+        self._get_routes()
+
+        # Direct command match: longest trigger that prefixes the input as whole words
+        match = self._dispatch_re.match(input_lower) if self._dispatch_re else None
+        if match:
+            trigger = match.group(1)
+            return self._resolve_route(trigger, self._routes[trigger])
+
+        # Fuzzy match on keywords: earliest registered trigger sharing any word
+        best = None
+        for word in input_words:
+            hits = self._word_index.get(word)
+            if hits and (best is None or hits[0][0] < best[0]):
+                best = hits[0]
+        if best is not None:
+            return self._resolve_route(best[1], best[2])
 
-        # Direct command match
-        for trigger, (agent_key, cmd) in self._command_map.items():
-            if input_lower.startswith(trigger):
-                return (self._agents[agent_key], cmd)
+        return None
 
-        # Fuzzy match on keywords
-        for trigger, (agent_key, cmd) in self._command_map.items():
-            trigger_words = set(trigger.split())
-            input_words = set(input_lower.split())
-            if trigger_words & input_words:  # Any common words
-                return (self._agents[agent_key], cmd)
+    def _get_routes(self) -> Dict[str, str]:
+        """Map every known trigger to its agent, loaded or only indexed.
 
-        return None
+        Also rebuilds the dispatch regex and per-word index used by route_command().
+        """
+        if self._routes is None:
+            routes = {trigger: agent_key for trigger, (agent_key, _) in self._command_map.items()}
+            for agent_key, stub in self._stubs.items():
+                if agent_key not in self._agents:
+                    for trigger in stub.triggers:
+                        routes.setdefault(trigger, agent_key)
+
+            word_index: Dict[str, List[Tuple[int, str, str]]] = {}
+            for seq, (trigger, agent_key) in enumerate(routes.items()):
+                words = trigger.split()
+                if not words:
+                    continue
+                for word in set(words):
+                    word_index.setdefault(word, []).append((seq, trigger, agent_key))
+
+            self._routes = routes
+            # Longest first, so short triggers cannot mask longer ones
+            triggers = sorted((t for t in routes if t.strip()), key=len, reverse=True)
+            self._dispatch_re = None
+            if triggers:
+                self._dispatch_re = re.compile(
+                    "(" + "|".join(re.escape(t) for t in triggers) + r")(?:\s|$)"
+                )
+            self._word_index = word_index
+        return self._routes
+
+    def _resolve_route(
+        self, trigger: str, agent_key: str
+    ) -> Optional[Tuple[AgentDefinition, AgentCommand]]:
+        """Materialize the routed agent and look up the matched command."""
+        agent = self.get_agent(agent_key)
+        if agent is None:
+            return None
+        mapped = self._command_map.get(trigger)
+        if mapped is not None and mapped[0] == agent_key:
+            return (agent, mapped[1])
+        cmd = agent.get_command(trigger)
+        return (agent, cmd) if cmd is not None else None
 
     def get_all_commands(self) -> List[Tuple[str, str, str]]:
         """Get all available commands.
@@ -400,14 +729,4 @@ class AgentLoader:
         Returns:
             Formatted string describing all agents and commands.
         """
-        agents_info = []
-        for agent in self._agents.values():
-            commands = [
-                f"  - {c.trigger}: {c.description}"
-                for c in agent.commands
-            ]
-            agents_info.append(
-                f"**{agent.name}** ({agent.title}):\n" +
-                "\n".join(commands)
-            )
-        return "\n\n".join(agents_info)
+        return "\n\n".join([a.get_router_fragment() for a in self._agents.values()])
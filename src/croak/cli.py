@@ -1,32 +1,374 @@
 """CROAK Command Line Interface."""
 
+import contextlib
+import functools
+import os
 import sys
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from croak import __version__
-from croak.core.config import CroakConfig
-from croak.core.state import PipelineState, load_state
 
-console = Console()
+
+_console = None
+
+
+def _get_console():
+    """Return the shared rich Console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+        # Pin the detected size; otherwise every render queries the terminal
+        _console.size = _console.size
+    return _console
+
+
+class _ConsoleProxy:
+    """Module-level console that defers building rich's Console.
+
+    --help, --version and shell completion never print through rich, so they
+    skip importing rich.console entirely.
+    """
+
+    def __getattr__(self, name):
+        return getattr(_get_console(), name)
+
+
+console = _ConsoleProxy()
+
+# Display names for pipeline stages (status)
+_STAGE_DISPLAY = {
+    "uninitialized": "Not started",
+    "data_preparation": "Data Preparation",
+    "training": "Training",
+    "evaluation": "Evaluation",
+    "deployment": "Deployment",
+    "complete": "Complete",
+}
+
+# Rich markup for experiment statuses (history)
+_EXPERIMENT_STATUS_STYLE = {
+    "completed": "[green]completed[/green]",
+    "running": "[yellow]running[/yellow]",
+    "failed": "[red]failed[/red]",
+    "pending": "[dim]pending[/dim]",
+}
+
+# Section divider for doctor output
+_RULE = "[dim]" + "─" * 40 + "[/dim]"
+
+# (header, style) column specs for the history tables
+_STAGE_HISTORY_COLUMNS = (
+    ("Stage", "cyan"),
+    ("Completed At", "green"),
+    ("Duration", "yellow"),
+)
+_EXPERIMENT_COLUMNS = (
+    ("ID", "cyan"),
+    ("Status", "green"),
+    ("Architecture", "yellow"),
+    ("Started", "dim"),
+)
+
+
+_HELP_TEXT = """
+# CROAK Commands
+
+## Setup
+- `croak init` - Initialize new project
+- `croak vfrog setup` - Login and configure vfrog platform
+- `croak vfrog status` - Show vfrog connection status
+- `croak status` - Show pipeline state
+- `croak doctor` - Check environment and dependencies
+
+## Data Preparation
+- `croak scan <path>` - Discover images and annotations
+- `croak validate` - Run data quality checks
+- `croak annotate` - Annotate images (two methods):
+  - `--method vfrog` (default) - vfrog SSAT auto-annotation
+  - `--method classic` - Import from CVAT, Label Studio, etc.
+- `croak split` - Create train/val/test splits
+- `croak prepare` - Full data preparation pipeline
+
+## Training
+- `croak recommend` - Get architecture recommendation
+- `croak configure` - Generate training config
+- `croak estimate` - Estimate training time/cost
+- `croak train` - Start training (three providers):
+  - `--provider local` (default) - Train on local GPU
+  - `--provider modal` - Train on Modal.com serverless GPU
+  - `--provider vfrog` - Train on vfrog platform
+- `croak resume` - Resume from checkpoint
+
+## Evaluation
+- `croak evaluate` - Run full evaluation
+- `croak analyze` - Deep dive into failures
+- `croak diagnose` - Figure out why model isn't working
+- `croak report` - Generate evaluation report
+
+## Deployment
+- `croak export` - Export model (--format onnx|tensorrt|coreml|tflite)
+- `croak deploy modal` - Deploy to Modal.com endpoint
+- `croak deploy vfrog` - Test vfrog inference endpoint
+- `croak deploy edge` - Package for edge deployment
+
+## Utility
+- `croak next` - Show suggested next step
+- `croak history` - Show pipeline history
+- `croak help` - Show this help
+- `croak reset` - Reset pipeline state
+"""
+
+
+@functools.cache
+def _help_markdown():
+    """Parse the help text into a Rich renderable once per process."""
+    from rich.markdown import Markdown
+
+    return Markdown(_HELP_TEXT)
+
+
+def _make_table(columns, **kwargs):
+    """Build a fresh Rich table from a (header, style) column spec."""
+    from rich.table import Table
+
+    table = Table(**kwargs)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+# (cwd, root) of the last search, so misses are remembered too
+_ROOT_CACHE: Optional[Tuple[str, Optional[Path]]] = None
+# CROAK_ROOT value this process exported itself, as opposed to one set by the user
+_EXPORTED_ROOT: Optional[str] = None
 
 
 def get_croak_root() -> Optional[Path]:
-    """Find CROAK project root (directory containing .croak/)."""
-    current = Path.cwd()
-    while current != current.parent:
-        if (current / ".croak").exists():
-            return current
-        current = current.parent
-    return None
+    """Find CROAK project root (directory containing .croak/).
+
+    CROAK_ROOT in the environment skips the search. Otherwise the result of
+    walking up from cwd, found or not, is cached per cwd for the process, and
+    a found root is exported as CROAK_ROOT for child processes.
+    """
+    global _ROOT_CACHE, _EXPORTED_ROOT
+    env_root = os.environ.get("CROAK_ROOT")
+    if env_root and env_root != _EXPORTED_ROOT:
+        return Path(env_root)
+
+    cwd = os.getcwd()
+    if _ROOT_CACHE is not None and _ROOT_CACHE[0] == cwd:
+        return _ROOT_CACHE[1]
+
+    root = None
+    current, parent = cwd, os.path.dirname(cwd)
+    while current != parent:
+        if os.path.isdir(os.path.join(current, ".croak")):
+            root = Path(current)
+            break
+        current, parent = parent, os.path.dirname(parent)
+
+    _ROOT_CACHE = (cwd, root)
+    if root is not None:
+        os.environ["CROAK_ROOT"] = _EXPORTED_ROOT = current
+    elif _EXPORTED_ROOT is not None and env_root == _EXPORTED_ROOT:
+        # Left the project this process exported; stop advertising it
+        os.environ.pop("CROAK_ROOT", None)
+        _EXPORTED_ROOT = None
+    return root
+
+
+def _reset_croak_root() -> None:
+    """Forget the cached project root, e.g. after init creates .croak/."""
+    global _ROOT_CACHE, _EXPORTED_ROOT
+    if _EXPORTED_ROOT is not None and os.environ.get("CROAK_ROOT") == _EXPORTED_ROOT:
+        del os.environ["CROAK_ROOT"]
+    _ROOT_CACHE = _EXPORTED_ROOT = None
+
+
+def _has_any(path: Path) -> bool:
+    """Check whether a directory exists and has at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            # any(), not next(): the 'next' command below shadows the builtin
+            return any(True for _ in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+_RAW_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff")
+_RAW_IMAGE_EXT_TAIL = max(map(len, _RAW_IMAGE_EXTENSIONS))
+
+
+_ANNOTATION_EXTENSIONS = {"yolo": ".txt", "coco": ".json", "voc": ".xml"}
+
+
+def _collect_by_ext(root, ext: str) -> list:
+    """Collect string paths of files under root whose name ends with ext."""
+    from croak.data.scanner import walk_files
+
+    return [entry.path for entry in walk_files(root) if entry.name.endswith(ext)]
+
+
+def _is_image_name(name: str) -> bool:
+    """Check a file name against the raw image extensions, case-insensitively.
+
+    Only the tail that can hold an extension is lowercased, and the tuple
+    endswith runs the comparison in C. Bare dotfiles like ".png" are not
+    images, matching Path.suffix.
+    """
+    tail = name[-_RAW_IMAGE_EXT_TAIL:].lower()
+    return tail.endswith(_RAW_IMAGE_EXTENSIONS) and (
+        len(name) > _RAW_IMAGE_EXT_TAIL or tail not in _RAW_IMAGE_EXTENSIONS
+    )
+
+
+def _find_latest_file(root, name: str) -> Optional[str]:
+    """Return the most recently modified file called name under root.
+
+    Single scandir pass; only matching entries are stat'ed.
+    """
+    from croak.data.scanner import walk_files
+
+    latest, latest_mtime = None, None
+    for entry in walk_files(root):
+        if entry.name == name:
+            mtime = entry.stat().st_mtime
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = entry.path, mtime
+    return latest
+
+
+def _has_images(root) -> bool:
+    """Check for at least one image file under root, stopping at the first."""
+    from croak.data.scanner import walk_files
+
+    return any(_is_image_name(entry.name) for entry in walk_files(root))
+
+
+_FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+
+
+def _fast_copy(src, dst) -> None:
+    """Copy a file's data and metadata like shutil.copy2, avoiding userspace copies.
+
+    On Linux, first tries a copy-on-write reflink (btrfs, xfs), which shares
+    extents instead of moving bytes, then os.sendfile on the same open
+    descriptors, so each file costs one open per side and a single stat of
+    the destination. Hard links are deliberately not used: the imported copy
+    must not alias the user's source file.
+    """
+    import shutil
+
+    if sys.platform != "linux":
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+        return
+
+    import fcntl
+
+    with open(src, "rb") as fsrc:
+        src_stat = os.fstat(fsrc.fileno())
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            pass
+        else:
+            if os.path.samestat(src_stat, dst_stat):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+
+        with open(dst, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            except OSError:
+                _sendfile_all(fsrc, fdst, src_stat.st_size)
+
+    shutil.copystat(src, dst)
+
+
+def _sendfile_all(fsrc, fdst, size: int) -> None:
+    """Copy size bytes between open files in the kernel, with a read/write fallback."""
+    import shutil
+
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        # sendfile unsupported here; restart with a plain read/write copy
+        fsrc.seek(0)
+        fdst.seek(0)
+        fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst)
+
+
+@contextlib.contextmanager
+def _progress(description: str):
+    """Show a transient spinner with description while the block runs.
+
+    Yields a function that completes the current step and starts another,
+    so multi-step commands share one live display and refresh thread. The
+    last task is marked completed only if the block finishes without raising.
+
+    Args:
+        description: Text shown next to the spinner.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=_get_console(),
+    ) as progress:
+        tasks = [progress.add_task(description, total=None)]
+
+        def next_step(step_description: str) -> None:
+            progress.update(tasks[-1], completed=True)
+            tasks.append(progress.add_task(step_description, total=None))
+
+        yield next_step
+        progress.update(tasks[-1], completed=True)
+
+
+def _resolve_model(state, model: Optional[str]) -> Optional[str]:
+    """Return the given model path, or the trained model recorded in state.
+
+    Prints an error and returns None when neither is available.
+    """
+    model = model or state.artifacts.model.path
+    if not model:
+        console.print("[red]No model specified. Use --model or train a model first.[/red]")
+    return model or None
+
+
+def _load_and_banner(root: Path, title: str):
+    """Load pipeline state and config, and print the project banner.
+
+    Args:
+        root: CROAK project root.
+        title: Panel title for the calling command.
+
+    Returns:
+        Tuple of (PipelineState, CroakConfig).
+    """
+    from rich.panel import Panel
+    from croak.core.config import CroakConfig
+    from croak.core.state import load_state
+
+    state = load_state(root)
+    config = CroakConfig.load(root / ".croak" / "config.yaml")
+
+    console.print(Panel.fit(f"[cyan]{config.project_name}[/cyan]", title=title))
+    return state, config
 
 
 def ensure_initialized():
@@ -41,14 +383,17 @@ def ensure_initialized():
 
 @click.group()
 @click.version_option(version=__version__, prog_name="croak")
-def main():
+@click.option("--no-cache", is_flag=True, help="Bypass on-disk caches (agent definitions, vfrog config)")
+def main(no_cache):
     """CROAK - Computer Recognition Orchestration Agent Kit
 
     An agentic framework for object detection model development.
 
     https://github.com/vfrog-ai/croak
     """
-    pass
+    if no_cache:
+        os.environ["CROAK_AGENT_CACHE"] = "0"
+        os.environ["CROAK_VFROG_CACHE"] = "0"
 
 
 # ============================================================================
@@ -60,6 +405,10 @@ def main():
 @click.option("--name", "-n", prompt="Project name", help="Name for the project")
 def init(name: str):
     """Initialize CROAK in current directory."""
+    from rich.panel import Panel
+    from croak.core.config import CroakConfig
+    from croak.core.state import PipelineState, state_path, utc_now_iso
+
     croak_dir = Path.cwd() / ".croak"
 
     if croak_dir.exists():
@@ -93,21 +442,28 @@ def init(name: str):
         "exports",
     ]
 
-    for dir_path in directories:
-        (Path.cwd() / dir_path).mkdir(parents=True, exist_ok=True)
+    # Only leaves need creating; makedirs fills in their ancestors. Keep
+    # several mkdir calls in flight for slow (network, overlay) filesystems;
+    # exist_ok makes the shared-parent races harmless.
+    from concurrent.futures import ThreadPoolExecutor
+
+    leaves = [d for d in directories if not any(o.startswith(d + "/") for o in directories)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(functools.partial(os.makedirs, exist_ok=True), leaves))
 
     # Create config
     config = CroakConfig(
         project_name=name,
-        created_at=datetime.utcnow().isoformat(),
+        created_at=utc_now_iso(),
     )
     config.save(croak_dir / "config.yaml")
 
     # Create initial state
     state = PipelineState(
-        initialized_at=datetime.utcnow().isoformat(),
+        initialized_at=utc_now_iso(),
     )
-    state.save(croak_dir / "pipeline-state.yaml")
+    state.save(state_path(Path.cwd()))
+    _reset_croak_root()
 
     console.print(Panel.fit(
         f"[green]CROAK initialized![/green]\n\n"
@@ -125,26 +481,10 @@ def init(name: str):
 def status():
     """Show pipeline status."""
     root = ensure_initialized()
-    state = PipelineState.load(root / ".croak" / "pipeline-state.yaml")
-    config = CroakConfig.load(root / ".croak" / "config.yaml")
-
-    # Build status display
-    console.print(Panel.fit(
-        f"[cyan]{config.project_name}[/cyan]",
-        title="🐸 CROAK Pipeline Status"
-    ))
+    state, _ = _load_and_banner(root, "🐸 CROAK Pipeline Status")
 
     # Current stage
-    stage_display = {
-        "uninitialized": "Not started",
-        "data_preparation": "Data Preparation",
-        "training": "Training",
-        "evaluation": "Evaluation",
-        "deployment": "Deployment",
-        "complete": "Complete",
-    }
-
-    console.print(f"\n[bold]Current Stage:[/bold] {stage_display.get(state.current_stage, state.current_stage)}")
+    console.print(f"\n[bold]Current Stage:[/bold] {_STAGE_DISPLAY.get(state.current_stage, state.current_stage)}")
 
     # Completed stages
     if state.stages_completed:
@@ -173,11 +513,11 @@ def status():
     if state.current_stage == "uninitialized":
         console.print("  1. Add images to data/raw/")
         console.print("  2. Run: croak scan data/raw")
-    elif "data_preparation" not in state.stages_completed:
+    elif not state.is_stage_completed("data_preparation"):
         console.print("  Run: croak prepare")
-    elif "training" not in state.stages_completed:
+    elif not state.is_stage_completed("training"):
         console.print("  Run: croak train")
-    elif "evaluation" not in state.stages_completed:
+    elif not state.is_stage_completed("evaluation"):
         console.print("  Run: croak evaluate")
     else:
         console.print("  Run: croak deploy")
@@ -187,17 +527,36 @@ def status():
 @click.option("--fix", is_flag=True, help="Attempt automatic fixes for issues found")
 def doctor(fix):
     """Check environment and dependencies."""
+    from rich.panel import Panel
+
     console.print(Panel.fit(
         "[bold]Environment Check[/bold]",
         title="🔍 CROAK Doctor"
     ))
 
+    from concurrent.futures import ThreadPoolExecutor
+    from croak.integrations.vfrog import VfrogCLI
+
     issues = []
     warnings_list = []
 
+    # The external probes are independent subprocesses; start them all now and
+    # collect each result where its section is printed.
+    executor = ThreadPoolExecutor(max_workers=4)
+    probes = {
+        "gpu": executor.submit(
+            _doctor_probe,
+            ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+        ),
+        "modal": executor.submit(_doctor_probe, ["modal", "token", "show"]),
+        "vfrog_installed": executor.submit(VfrogCLI.check_installed),
+        "vfrog_config": executor.submit(VfrogCLI.get_config),
+    }
+    executor.shutdown(wait=False)
+
     # --- Python Environment ---
     console.print("\n[bold]Python Environment[/bold]")
-    console.print("[dim]" + "─" * 40 + "[/dim]")
+    console.print(_RULE)
 
     import platform
     py_version = platform.python_version()
@@ -206,15 +565,17 @@ def doctor(fix):
     if not py_ok:
         issues.append("Python 3.10+ required")
 
-    # Check key packages
-    for pkg_name, required in [
-        ("ultralytics", True), ("torch", True), ("modal", False),
-        ("pydantic", True), ("pyyaml", True), ("rich", True),
+    # Check key packages are installed without importing them
+    from importlib.util import find_spec
+
+    for pkg_name, module_name, required in [
+        ("ultralytics", "ultralytics", True), ("torch", "torch", True),
+        ("modal", "modal", False), ("pydantic", "pydantic", True),
+        ("pyyaml", "yaml", True), ("rich", "rich", True),
     ]:
-        try:
-            __import__(pkg_name.replace("-", "_"))
+        if find_spec(module_name) is not None:
             _doctor_check(f"  {pkg_name}", True)
-        except ImportError:
+        else:
             label = "required" if required else "optional"
             _doctor_check(f"  {pkg_name}", False, label)
             if required:
@@ -224,60 +585,47 @@ def doctor(fix):
 
     # --- GPU ---
     console.print("\n[bold]GPU & Compute[/bold]")
-    console.print("[dim]" + "─" * 40 + "[/dim]")
-
-    try:
-        import subprocess
-        gpu_result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=10
-        )
-        if gpu_result.returncode == 0:
-            parts = gpu_result.stdout.strip().split(", ")
-            gpu_name = parts[0].strip() if parts else "Unknown"
-            vram_mb = int(parts[1].strip()) if len(parts) > 1 else 0
-            vram_gb = vram_mb / 1024
-            _doctor_check(f"NVIDIA GPU ({gpu_name})", True)
-            _doctor_check(f"  VRAM: {vram_gb:.1f}GB", vram_gb >= 8)
-            if vram_gb < 8:
-                warnings_list.append("GPU VRAM < 8GB -- may need cloud GPU for larger models")
-        else:
-            _doctor_check("Local NVIDIA GPU", False, "optional")
-            console.print("[dim]    Will use Modal.com or vfrog for GPU training[/dim]")
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    console.print(_RULE)
+
+    gpu_result = probes["gpu"].result()
+    if gpu_result is not None and gpu_result.returncode == 0:
+        parts = gpu_result.stdout.strip().split(", ")
+        gpu_name = parts[0].strip() if parts else "Unknown"
+        vram_mb = int(parts[1].strip()) if len(parts) > 1 else 0
+        vram_gb = vram_mb / 1024
+        _doctor_check(f"NVIDIA GPU ({gpu_name})", True)
+        _doctor_check(f"  VRAM: {vram_gb:.1f}GB", vram_gb >= 8)
+        if vram_gb < 8:
+            warnings_list.append("GPU VRAM < 8GB -- may need cloud GPU for larger models")
+    else:
         _doctor_check("Local NVIDIA GPU", False, "optional")
         console.print("[dim]    Will use Modal.com or vfrog for GPU training[/dim]")
 
     # Modal
-    try:
-        import subprocess
-        modal_result = subprocess.run(
-            ["modal", "token", "show"], capture_output=True, text=True, timeout=10
-        )
+    modal_result = probes["modal"].result()
+    if modal_result is not None:
         modal_ok = "Token" in modal_result.stdout or "authenticated" in modal_result.stdout
         _doctor_check("Modal.com configured", modal_ok)
         if not modal_ok:
             warnings_list.append("Modal.com not configured. Run `modal setup` for cloud GPU.")
-    except (FileNotFoundError, subprocess.TimeoutExpired):
+    else:
         _doctor_check("Modal.com SDK", False, "recommended")
         warnings_list.append("Modal.com not available. Run `pip install modal && modal setup`.")
 
     # --- vfrog CLI ---
     console.print("\n[bold]vfrog Integration[/bold]")
-    console.print("[dim]" + "─" * 40 + "[/dim]")
-
-    from croak.integrations.vfrog import VfrogCLI
+    console.print(_RULE)
 
-    vfrog_installed = VfrogCLI.check_installed()
+    vfrog_installed = probes["vfrog_installed"].result()
     if vfrog_installed:
         _doctor_check("vfrog CLI", True)
 
-        vfrog_auth = VfrogCLI.check_authenticated()
+        config_result = probes["vfrog_config"].result()
+        vfrog_auth = VfrogCLI.check_authenticated(config_result)
         _doctor_check("  Authenticated", vfrog_auth)
         if not vfrog_auth:
             warnings_list.append("vfrog not authenticated. Run `croak vfrog setup`.")
 
-        config_result = VfrogCLI.get_config()
         if config_result["success"] and isinstance(config_result["output"], dict):
             cfg = config_result["output"]
             org_set = bool(cfg.get("organisation_id"))
@@ -291,7 +639,6 @@ def doctor(fix):
             warnings_list.append("Could not read vfrog config.")
 
         # API key for inference
-        import os
         api_key_set = bool(os.environ.get("VFROG_API_KEY"))
         _doctor_check("  API key (inference)", api_key_set, "optional")
         if not api_key_set:
@@ -302,20 +649,24 @@ def doctor(fix):
 
     # --- Project Status ---
     console.print("\n[bold]Project Status[/bold]")
-    console.print("[dim]" + "─" * 40 + "[/dim]")
+    console.print(_RULE)
 
     root = get_croak_root()
     if root:
         _doctor_check("CROAK initialized", True)
-        config_exists = (root / ".croak" / "config.yaml").exists()
+        croak_dir = os.path.join(root, ".croak")
+        config_exists = os.path.exists(os.path.join(croak_dir, "config.yaml"))
         _doctor_check("  Configuration file", config_exists)
         if not config_exists:
             issues.append("Missing config.yaml")
-        state_exists = (root / ".croak" / "pipeline-state.yaml").exists()
+        state_exists = os.path.exists(os.path.join(croak_dir, "pipeline-state.yaml"))
         _doctor_check("  Pipeline state file", state_exists)
         if not state_exists:
             warnings_list.append("Missing pipeline-state.yaml")
-        agents_exist = (root / ".croak" / "agents").exists() or (root / "agents").exists()
+        agents_exist = (
+            os.path.exists(os.path.join(croak_dir, "agents"))
+            or os.path.exists(os.path.join(root, "agents"))
+        )
         _doctor_check("  Agent definitions", agents_exist)
         if not agents_exist:
             issues.append("Missing agents directory")
@@ -325,7 +676,7 @@ def doctor(fix):
 
     # --- Summary ---
     console.print("\n[bold]Summary[/bold]")
-    console.print("[dim]" + "─" * 40 + "[/dim]")
+    console.print(_RULE)
 
     if not issues and not warnings_list:
         console.print("\n[green]All checks passed! Your environment is ready.[/green]\n")
@@ -358,6 +709,30 @@ def doctor(fix):
         sys.exit(1)
 
 
+@functools.cache
+def _which(name: str) -> Optional[str]:
+    """Resolve an executable on PATH once per process."""
+    import shutil
+
+    return shutil.which(name)
+
+
+def _doctor_probe(cmd: list):
+    """Run a doctor probe command, returning None if it is missing or hangs."""
+    import subprocess
+
+    executable = _which(cmd[0])
+    if executable is None:
+        return None
+    try:
+        return subprocess.run(
+            [executable, *cmd[1:]], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, timeout=10,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+
+
 def _doctor_check(label: str, passed: bool, optional: str = None):
     """Print a doctor check result."""
     if passed:
@@ -373,67 +748,25 @@ def _doctor_check(label: str, passed: bool, optional: str = None):
 @main.command()
 def help():
     """Show available commands."""
-    help_text = """
-# CROAK Commands
-
-## Setup
-- `croak init` - Initialize new project
-- `croak vfrog setup` - Login and configure vfrog platform
-- `croak vfrog status` - Show vfrog connection status
-- `croak status` - Show pipeline state
-- `croak doctor` - Check environment and dependencies
-
-## Data Preparation
-- `croak scan <path>` - Discover images and annotations
-- `croak validate` - Run data quality checks
-- `croak annotate` - Annotate images (two methods):
-  - `--method vfrog` (default) - vfrog SSAT auto-annotation
-  - `--method classic` - Import from CVAT, Label Studio, etc.
-- `croak split` - Create train/val/test splits
-- `croak prepare` - Full data preparation pipeline
-
-## Training
-- `croak recommend` - Get architecture recommendation
-- `croak configure` - Generate training config
-- `croak estimate` - Estimate training time/cost
-- `croak train` - Start training (three providers):
-  - `--provider local` (default) - Train on local GPU
-  - `--provider modal` - Train on Modal.com serverless GPU
-  - `--provider vfrog` - Train on vfrog platform
-- `croak resume` - Resume from checkpoint
-
-## Evaluation
-- `croak evaluate` - Run full evaluation
-- `croak analyze` - Deep dive into failures
-- `croak diagnose` - Figure out why model isn't working
-- `croak report` - Generate evaluation report
-
-## Deployment
-- `croak export` - Export model (--format onnx|tensorrt|coreml|tflite)
-- `croak deploy modal` - Deploy to Modal.com endpoint
-- `croak deploy vfrog` - Test vfrog inference endpoint
-- `croak deploy edge` - Package for edge deployment
-
-## Utility
-- `croak next` - Show suggested next step
-- `croak history` - Show pipeline history
-- `croak help` - Show this help
-- `croak reset` - Reset pipeline state
-    """
-    console.print(Markdown(help_text))
+    console.print(_help_markdown())
 
 
 @main.command()
 @click.confirmation_option(prompt="This will reset all pipeline state. Continue?")
 def reset():
     """Reset pipeline state."""
+    from croak.core.state import PipelineState, state_path, utc_now_iso
+
     root = ensure_initialized()
 
     # Reset state
     state = PipelineState(
-        initialized_at=datetime.utcnow().isoformat(),
+        initialized_at=utc_now_iso(),
     )
-    state.save(root / ".croak" / "pipeline-state.yaml")
+    state.save(state_path(root))
+
+    # Drop the evaluation result cached for 'croak report'
+    (root / ".croak" / "evaluations" / "last.json").unlink(missing_ok=True)
 
     console.print("[green]Pipeline state reset.[/green]")
 
@@ -442,13 +775,7 @@ def reset():
 def next():
     """Suggest the next step based on pipeline state."""
     root = ensure_initialized()
-    state = PipelineState.load(root / ".croak" / "pipeline-state.yaml")
-    config = CroakConfig.load(root / ".croak" / "config.yaml")
-
-    console.print(Panel.fit(
-        f"[cyan]{config.project_name}[/cyan]",
-        title="🐸 CROAK - Next Step"
-    ))
+    state, _ = _load_and_banner(root, "🐸 CROAK - Next Step")
 
     # Determine next step based on current stage
     if state.current_stage == "uninitialized":
@@ -457,9 +784,9 @@ def next():
         console.print("2. Run: [cyan]croak scan data/raw[/cyan]")
         console.print("\nThis will discover your images and detect any existing annotations.")
 
-    elif state.current_stage == "data_preparation" or "data_preparation" not in state.stages_completed:
+    elif state.current_stage == "data_preparation" or not state.is_stage_completed("data_preparation"):
         # Check what's been done in data preparation
-        has_scan = (root / "data" / "raw").exists() and any((root / "data" / "raw").iterdir()) if (root / "data" / "raw").exists() else False
+        has_scan = _has_any(root / "data" / "raw")
 
         if not has_scan:
             console.print("\n[bold]Your next step:[/bold] Scan your data\n")
@@ -472,7 +799,7 @@ def next():
             console.print("\n[bold]Your next step:[/bold] Start training\n")
             console.print("Run: [cyan]croak train[/cyan]")
 
-    elif state.current_stage == "training" or "training" not in state.stages_completed:
+    elif state.current_stage == "training" or not state.is_stage_completed("training"):
         if state.artifacts.model.path:
             console.print("\n[bold]Your next step:[/bold] Evaluate your model\n")
             console.print("Run: [cyan]croak evaluate[/cyan]")
@@ -485,12 +812,12 @@ def next():
             console.print("   • Modal.com: [cyan]croak train --provider modal[/cyan]")
             console.print("   • vfrog platform: [cyan]croak train --provider vfrog[/cyan]")
 
-    elif state.current_stage == "evaluation" or "evaluation" not in state.stages_completed:
+    elif state.current_stage == "evaluation" or not state.is_stage_completed("evaluation"):
         console.print("\n[bold]Your next step:[/bold] Evaluate your model\n")
         console.print("Run: [cyan]croak evaluate[/cyan]")
         console.print("\nThis will compute metrics like mAP, precision, and recall.")
 
-    elif state.current_stage == "deployment" or "deployment" not in state.stages_completed:
+    elif state.current_stage == "deployment" or not state.is_stage_completed("deployment"):
         console.print("\n[bold]Your next step:[/bold] Deploy your model\n")
         console.print("Options:")
         console.print("  • Export model: [cyan]croak export --format onnx[/cyan]")
@@ -512,13 +839,7 @@ def next():
 def history():
     """Show completed pipeline stages and timestamps."""
     root = ensure_initialized()
-    state = PipelineState.load(root / ".croak" / "pipeline-state.yaml")
-    config = CroakConfig.load(root / ".croak" / "config.yaml")
-
-    console.print(Panel.fit(
-        f"[cyan]{config.project_name}[/cyan]",
-        title="🐸 CROAK - Pipeline History"
-    ))
+    state, _ = _load_and_banner(root, "🐸 CROAK - Pipeline History")
 
     if state.initialized_at:
         console.print(f"\n[bold]Initialized:[/bold] {state.initialized_at}")
@@ -529,10 +850,7 @@ def history():
     # Show stage history if available
     if state.stage_history:
         console.print("\n[bold]Stage History:[/bold]")
-        table = Table()
-        table.add_column("Stage", style="cyan")
-        table.add_column("Completed At", style="green")
-        table.add_column("Duration", style="yellow")
+        table = _make_table(_STAGE_HISTORY_COLUMNS)
 
         for entry in state.stage_history:
             duration = ""
@@ -559,19 +877,10 @@ def history():
     # Show experiments if any
     if state.experiments:
         console.print("\n[bold]Experiments:[/bold]")
-        table = Table()
-        table.add_column("ID", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Architecture", style="yellow")
-        table.add_column("Started", style="dim")
+        table = _make_table(_EXPERIMENT_COLUMNS)
 
         for exp in state.experiments:
-            status_style = {
-                "completed": "[green]completed[/green]",
-                "running": "[yellow]running[/yellow]",
-                "failed": "[red]failed[/red]",
-                "pending": "[dim]pending[/dim]",
-            }.get(exp.status, exp.status)
+            status_style = _EXPERIMENT_STATUS_STYLE.get(exp.status, exp.status)
 
             table.add_row(
                 exp.id,
@@ -594,6 +903,8 @@ def history():
 @click.argument("path", type=click.Path(exists=True))
 def scan(path: str):
     """Scan directory for images and annotations."""
+    from rich.table import Table
+
     root = ensure_initialized()
 
     from croak.data.scanner import scan_directory
@@ -624,7 +935,9 @@ def scan(path: str):
 
 @main.command()
 @click.option("--path", "-p", default="data/processed", help="Dataset path to validate")
-def validate(path: str):
+@click.option("--workers", "-j", type=click.IntRange(min=1), default=None,
+              help="Processes for image checks (default: CPU count; 1 = serial)")
+def validate(path: str, workers: Optional[int]):
     """Validate data quality."""
     root = ensure_initialized()
 
@@ -632,20 +945,12 @@ def validate(path: str):
 
     console.print(f"Validating dataset at [cyan]{path}[/cyan]...")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Running validation checks...", total=None)
-
-        validator = DataValidator(root / path)
+    with _progress("Running validation checks..."):
+        validator = DataValidator(root / path, workers=workers or os.cpu_count() or 1)
         result = validator.validate_all()
 
-        progress.update(task, completed=True)
-
     # Display results
-    if result.is_valid:
+    if result.passed:
         console.print("\n[green]✓ Dataset validation passed![/green]")
     else:
         console.print("\n[red]✗ Dataset validation failed[/red]")
@@ -670,10 +975,17 @@ def validate(path: str):
             console.print(f"  Total images: {stats['total_images']}")
         if "total_annotations" in stats:
             console.print(f"  Total annotations: {stats['total_annotations']}")
-        if "class_distribution" in stats:
-            console.print("  Class distribution:")
+        if stats.get("class_distribution"):
+            from rich.table import Table
+
+            # One table renders in a single pass however many classes there are;
+            # the validator already orders classes most frequent first
+            table = Table(title="Class Distribution")
+            table.add_column("Class", style="cyan")
+            table.add_column("Count", style="green", justify="right")
             for cls, count in stats["class_distribution"].items():
-                console.print(f"    {cls}: {count}")
+                table.add_row(str(cls), str(count))
+            console.print(table)
 
     console.print("\nNext: [cyan]croak split[/cyan]")
 
@@ -686,12 +998,14 @@ def validate(path: str):
 @click.option("--random", "random_count", type=int, default=20,
               help="Random dataset images for SSAT (vfrog only)")
 @click.option("--status", "check_status", is_flag=True, help="Check annotation status only")
+@click.option("--limit", type=click.IntRange(min=1), default=None,
+              help="Show at most this many iterations with --status (vfrog only)")
 @click.option("--halo", is_flag=True, help="Open HALO URL for review (vfrog only)")
 @click.option("--format", "ann_format", type=click.Choice(["yolo", "coco", "voc"]),
               default="yolo", help="Annotation format (classic only)")
 @click.option("--annotations-path", default=None, type=click.Path(),
               help="Path to annotation files (classic only)")
-def annotate(method, iteration_id, object_id, random_count, check_status, halo,
+def annotate(method, iteration_id, object_id, random_count, check_status, limit, halo,
              ann_format, annotations_path):
     """Annotate dataset images.
 
@@ -708,13 +1022,17 @@ def annotate(method, iteration_id, object_id, random_count, check_status, halo,
     root = ensure_initialized()
 
     if method == "vfrog":
-        _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, halo)
+        _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, halo, limit)
     else:
         _annotate_classic(root, ann_format, annotations_path)
 
 
-def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, halo):
+def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, halo, limit=None):
     """vfrog SSAT annotation workflow."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from croak.core.state import pipeline_state
+
     from croak.integrations.vfrog import VfrogCLI
 
     # 1. Verify vfrog CLI is installed and authenticated
@@ -723,13 +1041,14 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
         console.print("Install from: [cyan]https://github.com/vfrog-ai/vfrog-cli/releases[/cyan]")
         return
 
-    if not VfrogCLI.check_authenticated():
+    # One 'vfrog config show' answers both the auth and the context checks
+    config_result = VfrogCLI.get_config_cached()
+    if not VfrogCLI.check_authenticated(config_result):
         console.print("[red]Not logged in to vfrog.[/red]")
         console.print("Run: [cyan]croak vfrog setup[/cyan]")
         return
 
     # 2. Verify context is set
-    config_result = VfrogCLI.get_config()
     if config_result['success'] and isinstance(config_result['output'], dict):
         cfg = config_result['output']
         if not cfg.get('project_id'):
@@ -747,9 +1066,7 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
             return
         result = VfrogCLI.get_halo_url(iteration_id)
         if result['success']:
-            url = result['output'] if isinstance(result['output'], str) else result.get('raw', '')
-            if isinstance(result['output'], dict):
-                url = result['output'].get('url', result['output'].get('halo_url', str(result['output'])))
+            url = VfrogCLI.extract_halo_url(result)
             console.print(f"\nHALO Review URL: [cyan]{url}[/cyan]")
             console.print("Open this URL in your browser to review and correct annotations.")
         else:
@@ -766,14 +1083,22 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
             table.add_column("Status", style="yellow")
             table.add_column("Trained", style="dim")
 
-            for it in iters_result['output']:
-                table.add_row(
+            iterations = iters_result['output']
+            shown = iterations[:limit] if limit else iterations
+            rows = [
+                (
                     str(it.get('id', '')),
                     str(it.get('iteration_number', '')),
                     str(it.get('status', '')),
                     str(it.get('trained_status', '-')),
                 )
+                for it in shown
+            ]
+            for row in rows:
+                table.add_row(*row)
             console.print(table)
+            if len(shown) < len(iterations):
+                console.print(f"[dim]…and {len(iterations) - len(shown)} more[/dim]")
         else:
             console.print(f"[yellow]No iterations found or error: {iters_result.get('error')}[/yellow]")
         return
@@ -790,18 +1115,14 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
     # If resuming an existing iteration
     if iteration_id:
         console.print(f"\nResuming iteration: [cyan]{iteration_id}[/cyan]")
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-            task = progress.add_task("Running SSAT auto-annotation...", total=None)
+        with _progress("Running SSAT auto-annotation..."):
             result = VfrogCLI.run_ssat(iteration_id, random_count=random_count)
-            progress.update(task, completed=True)
 
         if result['success']:
             console.print("[green]✓ SSAT complete[/green]")
             halo_result = VfrogCLI.get_halo_url(iteration_id)
             if halo_result['success']:
-                url = halo_result['output']
-                if isinstance(url, dict):
-                    url = url.get('url', url.get('halo_url', str(url)))
+                url = VfrogCLI.extract_halo_url(halo_result)
                 console.print(f"\nReview annotations in HALO: [cyan]{url}[/cyan]")
         else:
             console.print(f"[red]SSAT failed: {result.get('error')}[/red]")
@@ -809,10 +1130,7 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
 
     # New annotation workflow
     # Step 1: Check for dataset images
-    images_result = VfrogCLI.list_dataset_images()
-    image_count = 0
-    if images_result['success'] and isinstance(images_result['output'], list):
-        image_count = len(images_result['output'])
+    image_count = VfrogCLI.count_dataset_images()
 
     if image_count == 0:
         # Check for local images in data/raw/
@@ -824,16 +1142,12 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
         if local_images:
             console.print(f"\n[yellow]No dataset images uploaded yet, but found {len(local_images)} local images in data/raw/[/yellow]")
             if click.confirm("Upload local images from data/raw/ to vfrog?", default=True):
-                with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-                    task = progress.add_task("Uploading local images...", total=None)
+                with _progress("Uploading local images..."):
                     upload_result = VfrogCLI.upload_dataset_images(directory=str(raw_dir))
-                    progress.update(task, completed=True)
                 if upload_result['success']:
                     console.print("[green]✓ Images uploaded[/green]")
                     # Re-check count
-                    images_result = VfrogCLI.list_dataset_images()
-                    if images_result['success'] and isinstance(images_result['output'], list):
-                        image_count = len(images_result['output'])
+                    image_count = VfrogCLI.count_dataset_images()
                 else:
                     console.print(f"[red]Upload failed: {upload_result.get('error')}[/red]")
                     return
@@ -849,19 +1163,19 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
     console.print(f"\n[green]✓[/green] {image_count} dataset images found")
 
     # Step 2: Check for objects or create one
-    objects_result = VfrogCLI.list_objects()
-    objects = objects_result['output'] if objects_result['success'] and isinstance(objects_result['output'], list) else []
-
-    if not objects and not object_id:
-        console.print("\n[yellow]No objects (product images) found.[/yellow]")
-        console.print("Create an object first with:")
-        console.print("  [cyan]vfrog objects create <product_image_url> --label <name>[/cyan]")
-        console.print("\nThe object is the reference image of what you want to detect.")
-        return
-
     if object_id:
         target_object_id = object_id
     else:
+        objects_result = VfrogCLI.list_objects()
+        objects = objects_result['output'] if objects_result['success'] and isinstance(objects_result['output'], list) else []
+
+        if not objects:
+            console.print("\n[yellow]No objects (product images) found.[/yellow]")
+            console.print("Create an object first with:")
+            console.print("  [cyan]vfrog objects create <product_image_url> --label <name>[/cyan]")
+            console.print("\nThe object is the reference image of what you want to detect.")
+            return
+
         target_object_id = objects[0].get('id', '')
         label = objects[0].get('label', 'unknown')
         console.print(f"Using object: [cyan]{label}[/cyan] ({target_object_id[:8]}...)")
@@ -879,10 +1193,8 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
     console.print(f"[green]✓[/green] Iteration created: {new_iteration_id[:8]}...")
 
     # Step 4: Run SSAT
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task("Running SSAT auto-annotation...", total=None)
+    with _progress("Running SSAT auto-annotation..."):
         ssat_result = VfrogCLI.run_ssat(new_iteration_id)
-        progress.update(task, completed=True)
 
     if not ssat_result['success']:
         console.print(f"[red]SSAT failed: {ssat_result.get('error')}[/red]")
@@ -899,9 +1211,7 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
     # Step 5: Show HALO URL
     halo_result = VfrogCLI.get_halo_url(new_iteration_id)
     if halo_result['success']:
-        url = halo_result['output']
-        if isinstance(url, dict):
-            url = url.get('url', url.get('halo_url', str(url)))
+        url = VfrogCLI.extract_halo_url(halo_result)
         console.print(f"\n[bold]Review your annotations in HALO:[/bold]")
         console.print(f"  [cyan]{url}[/cyan]")
         console.print("\nAfter reviewing, you can:")
@@ -909,16 +1219,18 @@ def _annotate_vfrog(root, iteration_id, object_id, random_count, check_status, h
         console.print(f"  • Next iteration: [cyan]croak annotate --iteration-id {new_iteration_id}[/cyan]")
 
     # Update pipeline state
-    state = load_state(root)
-    state.annotation.source = "vfrog"
-    state.annotation.method = "ssat"
-    state.annotation.vfrog_iteration_id = new_iteration_id
-    state.annotation.vfrog_object_id = target_object_id
-    state.save(root / ".croak" / "pipeline-state.yaml")
+    with pipeline_state(root) as state:
+        state.annotation.source = "vfrog"
+        state.annotation.method = "ssat"
+        state.annotation.vfrog_iteration_id = new_iteration_id
+        state.annotation.vfrog_object_id = target_object_id
 
 
 def _annotate_classic(root, ann_format, annotations_path):
     """Classic annotation import workflow."""
+    from rich.panel import Panel
+    from croak.core.state import pipeline_state
+
     console.print(Panel.fit(
         "[bold]Classic Annotation Import[/bold]\n\n"
         "Import annotations from external tools in YOLO, COCO, or VOC format.\n"
@@ -929,17 +1241,12 @@ def _annotate_classic(root, ann_format, annotations_path):
     # Check for images
     data_dir = root / "data"
     raw_dir = data_dir / "raw"
-    if raw_dir.exists():
-        image_count = sum(1 for f in raw_dir.rglob("*") if f.suffix.lower() in {'.jpg', '.jpeg', '.png', '.bmp', '.tif', '.tiff'})
-    else:
-        image_count = 0
-
-    if image_count == 0:
+    if not _has_images(raw_dir):
         console.print("\n[yellow]No images found in data/raw/[/yellow]")
         console.print("Add images first, then annotate them with your preferred tool.")
         return
 
-    console.print(f"\n[green]✓[/green] {image_count} images found in data/raw/")
+    console.print("\n[green]✓[/green] Images found in data/raw/")
 
     # Guide user to annotation path
     if not annotations_path:
@@ -963,14 +1270,8 @@ def _annotate_classic(root, ann_format, annotations_path):
         return
 
     # Count annotation files
-    if ann_format == "yolo":
-        ann_files = list(ann_path.rglob("*.txt"))
-    elif ann_format == "coco":
-        ann_files = list(ann_path.rglob("*.json"))
-    elif ann_format == "voc":
-        ann_files = list(ann_path.rglob("*.xml"))
-    else:
-        ann_files = []
+    ext = _ANNOTATION_EXTENSIONS.get(ann_format)
+    ann_files = _collect_by_ext(ann_path, ext) if ext else []
 
     if not ann_files:
         console.print(f"[red]No {ann_format.upper()} annotation files found in {annotations_path}[/red]")
@@ -978,24 +1279,33 @@ def _annotate_classic(root, ann_format, annotations_path):
 
     console.print(f"[green]✓[/green] Found {len(ann_files)} {ann_format.upper()} annotation files")
 
-    # Copy annotations to data/annotations/
-    import shutil
+    # Copy annotations to data/annotations/. Each copy is small and syscall
+    # bound, so overlap them on a thread pool.
+    from concurrent.futures import ThreadPoolExecutor
     dest = data_dir / "annotations"
     dest.mkdir(parents=True, exist_ok=True)
 
-    copied = 0
-    for f in ann_files:
-        shutil.copy2(f, dest / f.name)
-        copied += 1
+    # Same-named files from different folders would race onto one
+    # destination; the last one in path order wins
+    copies = {}
+    for f in sorted(ann_files):
+        copies[os.path.join(dest, os.path.basename(f))] = f
+    if len(copies) < len(ann_files):
+        console.print(
+            f"[yellow]Warning: {len(ann_files) - len(copies)} annotation files "
+            "share a name with a later one and were skipped[/yellow]"
+        )
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(_fast_copy, copies.values(), copies.keys()))
+    copied = len(copies)
 
     console.print(f"[green]✓[/green] Copied {copied} annotation files to data/annotations/")
 
     # Update state
-    state = load_state(root)
-    state.annotation.source = "classic"
-    state.annotation.method = "manual"
-    state.annotation.format = ann_format
-    state.save(root / ".croak" / "pipeline-state.yaml")
+    with pipeline_state(root) as state:
+        state.annotation.source = "classic"
+        state.annotation.method = "manual"
+        state.annotation.format = ann_format
 
     console.print(Panel.fit(
         "[green]Annotations imported![/green]\n\n"
@@ -1018,19 +1328,15 @@ def _annotate_classic(root, ann_format, annotations_path):
 @click.option("--input", "-i", default="data/processed", help="Input dataset path")
 def split(train: float, val: float, test: float, seed: int, stratify: bool, input: str):
     """Create train/val/test splits."""
+    from rich.table import Table
+
     root = ensure_initialized()
 
     from croak.data.splitter import DatasetSplitter
 
     console.print(f"Creating splits: [cyan]{train}/{val}/{test}[/cyan]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Splitting dataset...", total=None)
-
+    with _progress("Splitting dataset..."):
         splitter = DatasetSplitter(root / input)
         result = splitter.split(
             train_ratio=train,
@@ -1040,8 +1346,6 @@ def split(train: float, val: float, test: float, seed: int, stratify: bool, inpu
             stratify=stratify,
         )
 
-        progress.update(task, completed=True)
-
     if result.get("success"):
         console.print("\n[green]✓ Dataset split complete![/green]")
 
@@ -1065,48 +1369,56 @@ def split(train: float, val: float, test: float, seed: int, stratify: bool, inpu
 @main.command()
 def prepare():
     """Run full data preparation workflow."""
+    from rich.panel import Panel
+    from croak.core.state import pipeline_state
+
     root = ensure_initialized()
 
     console.print("[bold]Starting full data preparation workflow...[/bold]\n")
 
-    # Run validation
-    console.print("[cyan]Step 1: Validating dataset...[/cyan]")
+    from croak.data.index import DatasetIndex
     from croak.data.validator import DataValidator
+    from croak.data.splitter import DatasetSplitter
+
+    data_dir = root / "data/processed"
+    split_result, split_error = None, None
+
+    # Both steps run under one live display
+    with _progress("Step 1: Validating dataset...") as next_step:
+        # One directory walk shared by validation and splitting
+        index = DatasetIndex.from_dir(data_dir)
+        result = DataValidator(data_dir, index=index).validate_all()
 
-    validator = DataValidator(root / "data/processed")
-    result = validator.validate_all()
+        if result.passed:
+            next_step("Step 2: Creating data splits...")
+            try:
+                split_result = DatasetSplitter(data_dir, index=index).split()
+            except ValueError as e:
+                split_error = str(e)
 
-    if not result.is_valid:
+    if not result.passed:
         console.print("[red]Validation failed. Please fix errors before continuing.[/red]")
         for error in result.errors:
             console.print(f"  • {error}")
         return
 
-    console.print("[green]✓ Validation passed[/green]\n")
-
-    # Run split
-    console.print("[cyan]Step 2: Creating data splits...[/cyan]")
-    from croak.data.splitter import DatasetSplitter
-
-    splitter = DatasetSplitter(root / "data/processed")
-    split_result = splitter.split()
+    console.print("[green]✓ Validation passed[/green]")
 
-    if not split_result.get("success"):
-        console.print(f"[red]Split failed: {split_result.get('error')}[/red]")
+    if split_result is None:
+        console.print(f"[red]Split failed: {split_error}[/red]")
         return
 
     console.print("[green]✓ Splits created[/green]\n")
 
     # Update state
-    state = load_state(root)
-    state.current_stage = "training"
-    state.stages_completed.append("data_preparation")
-    state.data_yaml_path = split_result.get("data_yaml_path")
-    state.save(root / ".croak" / "pipeline-state.yaml")
+    with pipeline_state(root) as state:
+        state.current_stage = "training"
+        state.complete_stage("data_preparation")
+        state.data_yaml_path = split_result["data_yaml"]
 
     console.print(Panel.fit(
         "[green]Data preparation complete![/green]\n\n"
-        f"data.yaml: [cyan]{split_result.get('data_yaml_path')}[/cyan]\n\n"
+        f"data.yaml: [cyan]{split_result['data_yaml']}[/cyan]\n\n"
         "Next: [cyan]croak train[/cyan]",
         title="🐸 CROAK"
     ))
@@ -1120,6 +1432,9 @@ def prepare():
 @main.command()
 def recommend():
     """Get architecture recommendation."""
+    from rich.panel import Panel
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
@@ -1127,7 +1442,7 @@ def recommend():
 
     console.print("Analyzing dataset for architecture recommendation...\n")
 
-    orchestrator = TrainingOrchestrator(root)
+    orchestrator = TrainingOrchestrator(root, state=state)
     config = orchestrator.prepare_training()
 
     if not config.get("success", True):
@@ -1169,6 +1484,8 @@ def configure():
 @click.option("--gpu", "-g", default="T4", help="GPU type for cost estimation")
 def estimate(gpu: str):
     """Estimate training time and cost."""
+    from rich.table import Table
+
     root = ensure_initialized()
 
     from croak.training.trainer import TrainingOrchestrator
@@ -1221,6 +1538,9 @@ def train(provider: str, gpu: str, epochs: Optional[int], architecture: Optional
 
 def _train_vfrog(root, iteration_id):
     """Train on vfrog platform."""
+    from rich.panel import Panel
+    from croak.core.state import load_state, pipeline_state
+
     from croak.integrations.vfrog import VfrogCLI
 
     if not VfrogCLI.check_installed():
@@ -1228,7 +1548,7 @@ def _train_vfrog(root, iteration_id):
         console.print("Install from: [cyan]https://github.com/vfrog-ai/vfrog-cli/releases[/cyan]")
         return
 
-    if not VfrogCLI.check_authenticated():
+    if not VfrogCLI.check_authenticated(VfrogCLI.get_config_cached()):
         console.print("[red]Not logged in to vfrog.[/red]")
         console.print("Run: [cyan]croak vfrog setup[/cyan]")
         return
@@ -1254,21 +1574,17 @@ def _train_vfrog(root, iteration_id):
         title="🐸 CROAK Training"
     ))
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task("Training on vfrog platform...", total=None)
+    with _progress("Training on vfrog platform..."):
         result = VfrogCLI.train_iteration(iteration_id)
-        progress.update(task, completed=True)
 
     if result['success']:
         console.print("\n[green]✓ Training complete![/green]")
 
         # Update state
-        state = load_state(root)
-        state.current_stage = "evaluation"
-        if "training" not in state.stages_completed:
-            state.stages_completed.append("training")
-        state.training_state.provider = "vfrog"
-        state.save(root / ".croak" / "pipeline-state.yaml")
+        with pipeline_state(root) as state:
+            state.current_stage = "evaluation"
+            state.complete_stage("training")
+            state.training_state.provider = "vfrog"
 
         console.print("\nNext steps:")
         console.print("  • Test inference: [cyan]croak deploy vfrog --image <test-image>[/cyan]")
@@ -1279,9 +1595,14 @@ def _train_vfrog(root, iteration_id):
 
 def _train_classic(root, provider, gpu, epochs, architecture):
     """Train locally or on Modal (classic pipeline)."""
+    from rich.panel import Panel
+    from croak.core.state import load_state
+
     from croak.training.trainer import TrainingOrchestrator
 
-    orchestrator = TrainingOrchestrator(root)
+    # One state object for the whole run; training records into it too
+    state = load_state(root)
+    orchestrator = TrainingOrchestrator(root, state=state)
 
     # Prepare configuration
     config = orchestrator.prepare_training(architecture=architecture, epochs=epochs)
@@ -1314,14 +1635,12 @@ def _train_classic(root, provider, gpu, epochs, architecture):
             console.print(f"Model saved: [cyan]{result['model_path']}[/cyan]")
 
         # Update state
-        state = load_state(root)
         state.current_stage = "evaluation"
-        if "training" not in state.stages_completed:
-            state.stages_completed.append("training")
+        state.complete_stage("training")
         state.artifacts.model.path = result.get("model_path")
         state.artifacts.model.architecture = config.get("architecture")
         state.training_state.provider = provider
-        state.save(root / ".croak" / "pipeline-state.yaml")
+        state.save()
 
         console.print("\nNext: [cyan]croak evaluate[/cyan]")
     else:
@@ -1336,18 +1655,19 @@ def resume(checkpoint: Optional[str]):
 
     from croak.training.trainer import TrainingOrchestrator
 
+    orchestrator = TrainingOrchestrator(root)
+
     if not checkpoint:
-        # Find latest checkpoint
-        checkpoints_dir = root / "training" / "experiments"
-        checkpoints = list(checkpoints_dir.glob("**/last.pt"))
-        if not checkpoints:
+        # Find latest checkpoint; projects trained before the index existed are walked
+        checkpoint = orchestrator.latest_checkpoint() or _find_latest_file(
+            root / "training" / "experiments", "last.pt"
+        )
+        if checkpoint is None:
             console.print("[red]No checkpoints found to resume from.[/red]")
             return
-        checkpoint = str(max(checkpoints, key=lambda p: p.stat().st_mtime))
 
     console.print(f"Resuming training from [cyan]{checkpoint}[/cyan]...")
 
-    orchestrator = TrainingOrchestrator(root)
     result = orchestrator.train_local({"resume": checkpoint})
 
     if result.get("success"):
@@ -1369,28 +1689,22 @@ def resume(checkpoint: Optional[str]):
 @click.option("--split", default="test", help="Dataset split to evaluate")
 def evaluate(model: Optional[str], data: Optional[str], conf: float, iou: float, split: str):
     """Run model evaluation."""
+    from rich.table import Table
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
     from croak.evaluation.evaluator import ModelEvaluator
 
-    # Get model path
+    model = _resolve_model(state, model)
     if not model:
-        model = state.artifacts.model.path
-        if not model:
-            console.print("[red]No model specified. Use --model or train a model first.[/red]")
-            return
+        return
 
     console.print(f"Evaluating model: [cyan]{model}[/cyan]")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Running evaluation...", total=None)
-
-        evaluator = ModelEvaluator(root)
+    with _progress("Running evaluation..."):
+        evaluator = ModelEvaluator(root, state=state)
         result = evaluator.evaluate(
             model_path=model,
             data_yaml=data,
@@ -1399,8 +1713,6 @@ def evaluate(model: Optional[str], data: Optional[str], conf: float, iou: float,
             split=split,
         )
 
-        progress.update(task, completed=True)
-
     if result.get("success"):
         metrics = result.get("metrics", {})
 
@@ -1425,8 +1737,11 @@ def evaluate(model: Optional[str], data: Optional[str], conf: float, iou: float,
 
         # Update state
         state.current_stage = "deployment"
-        state.stages_completed.append("evaluation")
-        state.save(root / ".croak" / "pipeline-state.yaml")
+        state.complete_stage("evaluation")
+        state.artifacts.evaluation.metrics = metrics
+        state.artifacts.evaluation.deployment_ready = result.get("deployment_ready", False)
+        state.artifacts.evaluation.recommended_threshold = result.get("recommended_threshold")
+        state.save()
 
         console.print("\nNext: [cyan]croak report[/cyan] or [cyan]croak export[/cyan]")
     else:
@@ -1439,23 +1754,23 @@ def evaluate(model: Optional[str], data: Optional[str], conf: float, iou: float,
 @click.option("--samples", "-n", default=20, help="Number of error samples to analyze")
 def analyze(model: Optional[str], data: Optional[str], samples: int):
     """Analyze model errors."""
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
     from croak.evaluation.evaluator import ModelEvaluator
 
+    model = _resolve_model(state, model)
     if not model:
-        model = state.artifacts.model.path
-        if not model:
-            console.print("[red]No model specified.[/red]")
-            return
+        return
 
     if not data:
         data = state.data_yaml_path
 
     console.print(f"Analyzing errors for model: [cyan]{model}[/cyan]")
 
-    evaluator = ModelEvaluator(root)
+    evaluator = ModelEvaluator(root, state=state)
     result = evaluator.analyze_errors(model, data, num_samples=samples)
 
     if result.get("success"):
@@ -1472,6 +1787,8 @@ def analyze(model: Optional[str], data: Optional[str], samples: int):
 @main.command()
 def diagnose():
     """Diagnose model performance issues."""
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
@@ -1488,7 +1805,7 @@ def diagnose():
         issues.append("No trained model found - run 'croak train' first")
 
     # Check evaluation
-    if "evaluation" not in state.stages_completed:
+    if not state.is_stage_completed("evaluation"):
         issues.append("Model not evaluated - run 'croak evaluate' first")
 
     if issues:
@@ -1503,23 +1820,28 @@ def diagnose():
 @main.command()
 @click.option("--model", "-m", default=None, help="Model path")
 @click.option("--output", "-o", default="evaluation/reports", help="Output directory")
-def report(model: Optional[str], output: str):
+@click.option("--force", is_flag=True, help="Re-run evaluation even if a matching result is cached")
+def report(model: Optional[str], output: str, force: bool):
     """Generate evaluation report."""
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
     from croak.evaluation.evaluator import ModelEvaluator
 
+    model = _resolve_model(state, model)
     if not model:
-        model = state.artifacts.model.path
-        if not model:
-            console.print("[red]No model specified.[/red]")
-            return
+        return
 
     console.print("Generating evaluation report...")
 
-    evaluator = ModelEvaluator(root)
-    eval_result = evaluator.evaluate(model)
+    evaluator = ModelEvaluator(root, state=state)
+    # Reuse the last 'croak evaluate' run if it matches what evaluate(model)
+    # would run now (same data, thresholds and split), unless forced
+    eval_result = None if force else evaluator.last_result(model)
+    if eval_result is None:
+        eval_result = evaluator.evaluate(model)
 
     if eval_result.get("success"):
         report_md = evaluator.generate_report_md(eval_result)
@@ -1527,10 +1849,13 @@ def report(model: Optional[str], output: str):
         # Save report
         output_dir = root / output
         output_dir.mkdir(parents=True, exist_ok=True)
-        report_path = output_dir / f"evaluation-report-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.md"
+        report_path = output_dir / f"evaluation-report-{time.strftime('%Y%m%d-%H%M%S', time.gmtime())}.md"
+
+        # Fixed encoding and newlines, so reports are identical across platforms
+        report_path.write_text(report_md, encoding="utf-8", newline="\n")
 
-        with open(report_path, "w") as f:
-            f.write(report_md)
+        state.artifacts.evaluation.report_path = str(report_path)
+        state.save()
 
         console.print(f"\n[green]✓ Report saved:[/green] {report_path}")
         console.print("\nNext: [cyan]croak export[/cyan]")
@@ -1547,28 +1872,34 @@ def report(model: Optional[str], output: str):
 @click.option("--format", "-f", type=click.Choice(["onnx", "torchscript", "coreml", "tflite", "engine", "openvino"]), default="onnx")
 @click.option("--model", "-m", default=None, help="Model path")
 @click.option("--output", "-o", default=None, help="Output directory")
-@click.option("--half/--no-half", default=False, help="Use FP16 precision")
-def export(format: str, model: Optional[str], output: Optional[str], half: bool):
+@click.option("--half/--no-half", default=None,
+              help="Use FP16 precision [default: on for engine, coreml, tflite]")
+@click.option("--int8", is_flag=True, help="Quantize to INT8 (engine, openvino, tflite)")
+@click.option("--data", "-d", default=None, help="data.yaml for INT8 calibration [default: project data]")
+def export(format: str, model: Optional[str], output: Optional[str], half: Optional[bool],
+           int8: bool, data: Optional[str]):
     """Export model to deployment format."""
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
     from croak.deployment.deployer import ModelDeployer
 
+    model = _resolve_model(state, model)
     if not model:
-        model = state.artifacts.model.path
-        if not model:
-            console.print("[red]No model specified.[/red]")
-            return
+        return
 
     console.print(f"Exporting model to [cyan]{format}[/cyan]...")
 
-    deployer = ModelDeployer(root)
+    deployer = ModelDeployer(root, state=state)
     result = deployer.export_model(
         model_path=model,
         format=format,
         output_dir=output,
         half=half,
+        int8=int8,
+        data_yaml=data,
     )
 
     if result.get("success"):
@@ -1590,20 +1921,20 @@ def deploy():
 @click.option("--gpu", "-g", default="T4", help="GPU type")
 def deploy_modal(model: Optional[str], name: str, gpu: str):
     """Deploy to Modal.com serverless endpoint."""
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
     from croak.deployment.deployer import ModelDeployer
 
+    model = _resolve_model(state, model)
     if not model:
-        model = state.artifacts.model.path
-        if not model:
-            console.print("[red]No model specified.[/red]")
-            return
+        return
 
     console.print(f"Deploying to Modal.com as [cyan]{name}[/cyan]...")
 
-    deployer = ModelDeployer(root)
+    deployer = ModelDeployer(root, state=state)
     result = deployer.deploy_modal(
         model_path=model,
         app_name=name,
@@ -1644,14 +1975,12 @@ def deploy_vfrog(image, image_url, api_key):
 
     console.print("Testing vfrog inference endpoint...")
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task("Running inference...", total=None)
+    with console.status("Running inference..."):
         result = VfrogCLI.run_inference(
             image_path=image,
             image_url=image_url,
             api_key=api_key,
         )
-        progress.update(task, completed=True)
 
     if result['success']:
         console.print("\n[green]✓ Inference endpoint working![/green]")
@@ -1680,22 +2009,22 @@ def deploy_vfrog(image, image_url, api_key):
 @click.option("--formats", "-f", default="onnx", help="Export formats (comma-separated)")
 def deploy_edge(model: Optional[str], formats: str):
     """Prepare edge deployment package."""
+    from croak.core.state import load_state
+
     root = ensure_initialized()
     state = load_state(root)
 
     from croak.deployment.deployer import ModelDeployer
 
+    model = _resolve_model(state, model)
     if not model:
-        model = state.artifacts.model.path
-        if not model:
-            console.print("[red]No model specified.[/red]")
-            return
+        return
 
     format_list = [f.strip() for f in formats.split(",")]
 
     console.print(f"Creating edge deployment package...")
 
-    deployer = ModelDeployer(root)
+    deployer = ModelDeployer(root, state=state)
     result = deployer.generate_deployment_package(
         model_path=model,
         include_formats=format_list,
@@ -1720,9 +2049,24 @@ def vfrog():
     pass
 
 
+def _print_choices(labels) -> None:
+    """Print a numbered selection menu as a single borderless table."""
+    from rich.table import Table
+
+    table = Table(show_header=False, box=None, padding=(0, 1), collapse_padding=True)
+    table.add_column(justify="right")
+    table.add_column()
+    for idx, label in enumerate(labels, 1):
+        table.add_row(f"[{idx}]", label)
+    console.print(table)
+
+
 @vfrog.command()
 def setup():
     """Interactive vfrog CLI setup (login, select org/project)."""
+    from rich.panel import Panel
+    from croak.core.config import CroakConfig
+
     from croak.integrations.vfrog import VfrogCLI
 
     # 1. Check CLI is installed
@@ -1758,9 +2102,7 @@ def setup():
         return
 
     console.print("[bold]Organisations:[/bold]")
-    for idx, org in enumerate(orgs):
-        name = org.get('name', org.get('id', 'Unknown'))
-        console.print(f"  [{idx + 1}] {name}")
+    _print_choices(org.get('name', org.get('id', 'Unknown')) for org in orgs)
 
     choice = click.prompt("Select organisation", type=int, default=1)
     if choice < 1 or choice > len(orgs):
@@ -1783,10 +2125,10 @@ def setup():
 
     if projects:
         console.print("[bold]Projects:[/bold]")
-        for idx, proj in enumerate(projects):
-            title = proj.get('title', proj.get('id', 'Unknown'))
-            console.print(f"  [{idx + 1}] {title}")
-        console.print(f"  [{len(projects) + 1}] Create new project")
+        _print_choices(
+            [proj.get('title', proj.get('id', 'Unknown')) for proj in projects]
+            + ["Create new project"]
+        )
 
         choice = click.prompt("Select project", type=int, default=1)
         if choice == len(projects) + 1:
@@ -1841,6 +2183,8 @@ def setup():
 @vfrog.command()
 def status():
     """Show vfrog CLI config and auth status."""
+    from rich.table import Table
+
     from croak.integrations.vfrog import VfrogCLI
 
     if not VfrogCLI.check_installed():
@@ -1891,14 +2235,12 @@ def vfrog_upload(directory, file_path, urls):
         console.print("  [cyan]croak vfrog upload https://example.com/img.jpg[/cyan]")
         return
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task("Uploading images...", total=None)
+    with _progress("Uploading images..."):
         result = VfrogCLI.upload_dataset_images(
             urls=list(urls) if urls else None,
             file_path=file_path,
             directory=directory,
         )
-        progress.update(task, completed=True)
 
     if result['success']:
         console.print("[green]✓ Upload complete![/green]")
@@ -1924,10 +2266,8 @@ def vfrog_export(iteration_id, output):
 
     console.print(f"Exporting YOLO annotations to [cyan]{output}[/cyan]...")
 
-    with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-        task = progress.add_task("Exporting annotations...", total=None)
+    with _progress("Exporting annotations..."):
         result = VfrogCLI.export_yolo(iteration_id, output_dir=output)
-        progress.update(task, completed=True)
 
     if result['success']:
         console.print(f"[green]✓ Export complete![/green]")
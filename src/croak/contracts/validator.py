@@ -1,10 +1,21 @@
 """Handoff contract validation between agents."""
 
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from datetime import datetime, timezone
+import copy
 import json
-import yaml
+import os
+
+from yaml import YAMLError
+
+from croak.core._yaml import safe_load
+
+try:
+    import orjson  # Optional: croak-cv[fast]
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 try:
     import jsonschema
@@ -12,27 +23,182 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    from referencing import Registry, Resource  # Ships with jsonschema>=4.18
+    from referencing.jsonschema import DRAFT7
+    HAS_REFERENCING = True
+except ImportError:
+    HAS_REFERENCING = False
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+VALIDATION_BACKENDS = ('jsonschema', 'fastjsonschema')
+
+# URI schemes whose $refs fastjsonschema resolves through the loaded contracts
+# instead of fetching them
+_REF_SCHEMES = ('', 'file', 'http', 'https')
+
+# Schema file extensions, in lookup precedence order
+SCHEMA_EXTENSIONS = ('.schema.yaml', '.schema.json', '.yaml', '.json')
+
+# Contract files loaded up front
+CONTRACT_SUFFIXES = SCHEMA_EXTENSIONS[:2]
+
 
 class ContractValidationError(Exception):
     """Raised when contract validation fails."""
     pass
 
 
+class ContractSchemaError(Exception):
+    """Raised when a contract schema file cannot be read or parsed."""
+    pass
+
+
+def _schema_error(error: Exception) -> Dict[str, Any]:
+    """Validation error entry for a contract whose schema is unusable."""
+    return {
+        'path': [],
+        'message': f"Schema error: {error}",
+        'value': None,
+    }
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy arrays and scalars for the json fallback, as orjson does."""
+    if type(obj).__module__ == 'numpy' and hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class HandoffValidator:
     """Validate handoff data against JSON Schema contracts.
 
     Ensures data passed between agents conforms to defined contracts,
     preventing data corruption and miscommunication between pipeline stages.
+
+    All ``*.schema.yaml``/``*.schema.json`` contracts are loaded and compiled
+    on construction, and ``$ref``s between them (by file name or ``$id``)
+    resolve from memory. Other schema files are still loaded on first use.
+    Contracts edited on disk are picked up: a changed file mtime or size
+    reloads and recompiles them.
     """
 
-    def __init__(self, contracts_dir: Path):
+    def __init__(self, contracts_dir: Path, backend: str = 'jsonschema'):
         """Initialize handoff validator.
 
         Args:
             contracts_dir: Directory containing contract schema files.
+            backend: Schema validation library, 'jsonschema' or
+                'fastjsonschema'. fastjsonschema compiles each schema to
+                Python code, which is much faster for repeated validation
+                but reports only the first error.
+
+        Raises:
+            ValueError: If backend is unknown.
+            ImportError: If the fastjsonschema backend is not installed.
         """
+        if backend not in VALIDATION_BACKENDS:
+            raise ValueError(
+                f"Unknown validation backend: {backend}. "
+                f"Choose from: {', '.join(VALIDATION_BACKENDS)}"
+            )
+        if backend == 'fastjsonschema' and not HAS_FASTJSONSCHEMA:
+            raise ImportError(
+                "fastjsonschema not installed. Run: pip install fastjsonschema"
+            )
+
         self.contracts_dir = contracts_dir
-        self._schemas: Dict[str, dict] = {}
+        self.backend = backend
+        # contract name -> (path, (mtime_ns, size), schema)
+        self._schemas: Dict[str, Tuple[Path, Tuple[int, int], dict]] = {}
+        self._schema_files: Optional[Dict[str, Path]] = None
+        self._validators: Dict[str, Any] = {}
+        self._fast_validators: Dict[str, Callable[[Any], Any]] = {}
+        self._registry = None
+        # $ref target (file name or $id) -> schema, for fastjsonschema
+        self._ref_schemas: Dict[str, dict] = {}
+
+        self._load_contracts()
+
+    def _load_contracts(self) -> None:
+        """Load, cross-reference and compile every contract in contracts_dir."""
+        self._schema_files = self._scan_schema_files()
+
+        resources = []
+        self._ref_schemas = {}
+        for contract_name, schema_path in self._schema_files.items():
+            if schema_path.name[len(contract_name):] in CONTRACT_SUFFIXES:
+                try:
+                    schema = self._read_contract(contract_name)
+                except ContractSchemaError:
+                    continue  # Reported by validate() for this contract only
+                self._ref_schemas[schema_path.name] = schema
+                if isinstance(schema.get('$id'), str):
+                    self._ref_schemas[schema['$id']] = schema
+                if HAS_REFERENCING:
+                    resource = Resource.from_contents(schema, default_specification=DRAFT7)
+                    resources.append((schema_path.name, resource))
+                    if '$id' in schema:
+                        resources.append((schema['$id'], resource))
+
+        self._registry = Registry().with_resources(resources) if resources else None
+
+        # Invalid schemas are reported by validate() for that contract
+        for contract_name in list(self._schemas):
+            if self.backend == 'fastjsonschema':
+                try:
+                    self._get_fast_validator(contract_name)
+                except (fastjsonschema.JsonSchemaDefinitionException, ContractSchemaError):
+                    pass
+            elif HAS_JSONSCHEMA:
+                try:
+                    self._get_validator(contract_name)
+                except jsonschema.SchemaError:
+                    pass
+
+    def _scan_schema_files(self) -> Dict[str, Path]:
+        """Map every contract name in contracts_dir to its schema file.
+
+        One directory listing replaces probing each extension per contract;
+        where several files match a name, SCHEMA_EXTENSIONS order decides.
+        """
+        try:
+            with os.scandir(self.contracts_dir) as entries:
+                names = sorted(e.name for e in entries if e.is_file())
+        except OSError:
+            return {}
+
+        files: Dict[str, Path] = {}
+        for ext in SCHEMA_EXTENSIONS:
+            for name in names:
+                if name.endswith(ext):
+                    files.setdefault(name[:-len(ext)], self.contracts_dir / name)
+        return files
+
+    @staticmethod
+    def _read_schema(schema_path: Path) -> dict:
+        """Parse a JSON or YAML schema file.
+
+        Raises:
+            ContractSchemaError: If the file cannot be read, is not valid
+                JSON/YAML, or does not hold a mapping.
+        """
+        try:
+            with open(schema_path, encoding='utf-8') as f:
+                if schema_path.suffix == '.json':
+                    schema = json.load(f)
+                else:
+                    schema = safe_load(f)
+        except (OSError, ValueError, YAMLError) as e:
+            raise ContractSchemaError(f"Cannot load {schema_path.name}: {e}") from e
+        if not isinstance(schema, dict):
+            raise ContractSchemaError(f"{schema_path.name} does not contain a schema mapping")
+        return schema
 
     def load_schema(self, contract_name: str) -> dict:
         """Load JSON Schema for a contract.
@@ -45,82 +211,217 @@ class HandoffValidator:
 
         Raises:
             FileNotFoundError: If schema file not found.
+            ContractSchemaError: If the schema file cannot be parsed.
+        """
+        if self._contracts_changed():
+            # Others may $ref an edited contract, so reload all of them
+            self._schemas.clear()
+            self._validators.clear()
+            self._fast_validators.clear()
+            self._load_contracts()
+        cached = self._schemas.get(contract_name)
+        if cached is not None:
+            return cached[2]
+        return self._read_contract(contract_name)
+
+    def _contracts_changed(self) -> bool:
+        """Check whether any loaded schema file changed on disk.
+
+        Deleted files do not count: validation keeps using what was loaded.
+        """
+        for schema_path, stat_key, _ in self._schemas.values():
+            try:
+                st = os.stat(schema_path)
+            except OSError:
+                continue
+            if (st.st_mtime_ns, st.st_size) != stat_key:
+                return True
+        return False
+
+    def _read_contract(self, contract_name: str) -> dict:
+        """Read a contract's schema file from disk and cache it.
+
+        Raises:
+            FileNotFoundError: If schema file not found.
+            ContractSchemaError: If the schema file cannot be parsed.
         """
-        if contract_name in self._schemas:
-            return self._schemas[contract_name]
-
-        # Try multiple extensions
-        for ext in ['.schema.yaml', '.schema.json', '.yaml', '.json']:
-            schema_path = self.contracts_dir / f"{contract_name}{ext}"
-            if schema_path.exists():
-                with open(schema_path) as f:
-                    if ext.endswith('.json'):
-                        schema = json.load(f)
-                    else:
-                        schema = yaml.safe_load(f)
-
-                self._schemas[contract_name] = schema
-                return schema
+        if self._schema_files is None or contract_name not in self._schema_files:
+            self._schema_files = self._scan_schema_files()  # Pick up new files
+        schema_path = self._schema_files.get(contract_name)
+        if schema_path is not None:
+            try:
+                st = os.stat(schema_path)
+            except OSError as e:
+                raise ContractSchemaError(f"Cannot load {schema_path.name}: {e}") from e
+            schema = self._read_schema(schema_path)
+            self._schemas[contract_name] = (schema_path, (st.st_mtime_ns, st.st_size), schema)
+            return schema
 
         raise FileNotFoundError(
             f"Contract schema not found: {contract_name} "
             f"in {self.contracts_dir}"
         )
 
-    def validate(self, contract_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_validator(self, contract_name: str) -> Any:
+        """Return the compiled jsonschema validator for a contract.
+
+        The schema is checked and the validator built once per contract, then
+        reused for every handoff validated against it.
+
+        Raises:
+            FileNotFoundError: If schema file not found.
+            ContractSchemaError: If the schema file cannot be parsed.
+            jsonschema.SchemaError: If the schema itself is invalid.
+        """
+        schema = self.load_schema(contract_name)  # Drops compiled validators if edited
+        validator = self._validators.get(contract_name)
+        if validator is None:
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            if self._registry is not None:
+                validator = cls(schema, registry=self._registry)
+            else:
+                validator = cls(schema)
+            self._validators[contract_name] = validator
+        return validator
+
+    def _get_fast_validator(self, contract_name: str) -> Callable[[Any], Any]:
+        """Return the fastjsonschema function compiled for a contract.
+
+        Raises:
+            FileNotFoundError: If schema file not found.
+            ContractSchemaError: If the schema file cannot be parsed.
+            fastjsonschema.JsonSchemaDefinitionException: If the schema is invalid.
+        """
+        schema = self.load_schema(contract_name)  # Drops compiled validators if edited
+        validate_fn = self._fast_validators.get(contract_name)
+        if validate_fn is None:
+            # Compiling rewrites $refs in place, so it gets its own copy
+            validate_fn = fastjsonschema.compile(
+                copy.deepcopy(schema),
+                handlers=dict.fromkeys(_REF_SCHEMES, self._resolve_ref),
+            )
+            self._fast_validators[contract_name] = validate_fn
+        return validate_fn
+
+    def _resolve_ref(self, uri: str) -> dict:
+        """Resolve a fastjsonschema $ref from the loaded contracts.
+
+        Never fetches anything: a ref to any other document is a schema error.
+
+        Raises:
+            ContractSchemaError: If no loaded contract has this name or $id.
+        """
+        schema = self._ref_schemas.get(uri)
+        if schema is None:
+            raise ContractSchemaError(f"Unresolvable $ref: {uri}")
+        return copy.deepcopy(schema)
+
+    def validate(
+        self,
+        contract_name: str,
+        data: Dict[str, Any],
+        validated_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Validate data against contract schema.
 
         Args:
             contract_name: Name of the contract.
             data: Data to validate.
+            validated_at: ISO timestamp to record. Defaults to now (UTC).
 
         Returns:
             Dict with validation result.
         """
+        validated_at = validated_at or datetime.now(timezone.utc).isoformat()
+
+        if self.backend == 'fastjsonschema':
+            return self._fast_validate(contract_name, data, validated_at)
+
         if not HAS_JSONSCHEMA:
             # If jsonschema not installed, do basic validation
-            return self._basic_validate(contract_name, data)
-
-        schema = self.load_schema(contract_name)
+            return self._basic_validate(contract_name, data, validated_at)
 
         errors = []
         try:
-            jsonschema.validate(data, schema)
-        except jsonschema.ValidationError as e:
-            errors.append({
-                'path': list(e.absolute_path),
-                'message': e.message,
-                'value': str(e.instance)[:100],  # Truncate for display
-            })
+            validator = self._get_validator(contract_name)
+        except ContractSchemaError as e:
+            errors.append(_schema_error(e))
         except jsonschema.SchemaError as e:
             errors.append({
                 'path': [],
                 'message': f"Schema error: {e.message}",
                 'value': None,
             })
+        else:
+            # Report every violation, not just the first
+            for e in validator.iter_errors(data):
+                errors.append({
+                    'path': list(e.absolute_path),
+                    'message': e.message,
+                    'value': str(e.instance)[:100],  # Truncate for display
+                })
 
         return {
             'valid': len(errors) == 0,
             'contract': contract_name,
             'errors': errors,
-            'validated_at': datetime.utcnow().isoformat(),
+            'validated_at': validated_at,
         }
 
-    def _basic_validate(self, contract_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _fast_validate(
+        self, contract_name: str, data: Dict[str, Any], validated_at: str,
+    ) -> Dict[str, Any]:
+        """Validate with a fastjsonschema function compiled once per contract.
+
+        Args:
+            contract_name: Name of the contract.
+            data: Data to validate.
+            validated_at: ISO timestamp to record.
+
+        Returns:
+            Dict with validation result.
+        """
+        errors = []
+        try:
+            self._get_fast_validator(contract_name)(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            errors.append({
+                'path': list(e.path[1:]),  # Drop the leading 'data' root
+                'message': e.message,
+                'value': str(e.value)[:100],  # Truncate for display
+            })
+        except (ContractSchemaError, fastjsonschema.JsonSchemaDefinitionException) as e:
+            errors.append(_schema_error(e))
+
+        return {
+            'valid': len(errors) == 0,
+            'contract': contract_name,
+            'errors': errors,
+            'validated_at': validated_at,
+        }
+
+    def _basic_validate(
+        self, contract_name: str, data: Dict[str, Any], validated_at: str,
+    ) -> Dict[str, Any]:
         """Basic validation without jsonschema.
 
         Args:
             contract_name: Name of the contract.
             data: Data to validate.
+            validated_at: ISO timestamp to record.
 
         Returns:
             Dict with validation result.
         """
         errors = []
-        schema = self.load_schema(contract_name)
+        try:
+            required = self.load_schema(contract_name).get('required', [])
+        except ContractSchemaError as e:
+            errors.append(_schema_error(e))
+            required = []
 
         # Check required fields
-        required = schema.get('required', [])
         for field in required:
             if field not in data:
                 errors.append({
@@ -133,7 +434,7 @@ class HandoffValidator:
             'valid': len(errors) == 0,
             'contract': contract_name,
             'errors': errors,
-            'validated_at': datetime.utcnow().isoformat(),
+            'validated_at': validated_at,
             'note': 'Basic validation only (install jsonschema for full validation)',
         }
 
@@ -160,8 +461,12 @@ class HandoffValidator:
         Raises:
             ContractValidationError: If validation fails.
         """
+        # One timestamp for the validation, the document and its file name
+        now = datetime.now(timezone.utc)
+        created_at = now.isoformat()
+
         # Validate first
-        result = self.validate(contract_name, data)
+        result = self.validate(contract_name, data, validated_at=created_at)
         if not result['valid']:
             error_msgs = [e['message'] for e in result['errors']]
             raise ContractValidationError(
@@ -174,18 +479,30 @@ class HandoffValidator:
             'contract': contract_name,
             'from_agent': from_agent,
             'to_agent': to_agent,
-            'created_at': datetime.utcnow().isoformat(),
+            'created_at': created_at,
             'data': data,
         }
 
         # Save to file
         handoffs_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+        timestamp = now.strftime('%Y%m%d-%H%M%S')
         filename = f"{from_agent}-to-{to_agent}-{timestamp}.yaml"
         handoff_path = handoffs_dir / filename
 
-        with open(handoff_path, 'w') as f:
-            yaml.dump(handoff, f, default_flow_style=False, sort_keys=False)
+        # Stored as JSON, which is also valid YAML for anything reading it as such
+        if HAS_ORJSON:
+            handoff_path.write_bytes(orjson.dumps(
+                handoff,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ))
+        else:
+            handoff_path.write_text(
+                json.dumps(
+                    handoff, indent=2, ensure_ascii=False, default=_json_default,
+                ) + "\n",
+                encoding="utf-8",
+            )
 
         return handoff_path
 
@@ -198,8 +515,11 @@ class HandoffValidator:
         Returns:
             Handoff document with validation result.
         """
-        with open(handoff_path) as f:
-            handoff = yaml.safe_load(f)
+        raw = handoff_path.read_bytes()
+        try:
+            handoff = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+        except ValueError:  # Handoff written as YAML by an older version
+            handoff = safe_load(raw)
 
         # Re-validate
         result = self.validate(handoff['contract'], handoff['data'])
@@ -225,24 +545,33 @@ class HandoffValidator:
         Returns:
             Path to latest matching handoff, or None.
         """
-        if not handoffs_dir.exists():
-            return None
-
-        matching = []
-        for f in handoffs_dir.glob('*.yaml'):
-            name = f.stem
-            if from_agent and not name.startswith(f"{from_agent}-to-"):
-                continue
-            if to_agent and f"-to-{to_agent}-" not in name:
-                continue
-            matching.append(f)
+        from_prefix = f"{from_agent}-to-" if from_agent else None
+        to_infix = f"-to-{to_agent}-" if to_agent else None
 
-        if not matching:
+        # Single pass keeping the newest match; only matching files are stat'ed
+        latest = None
+        latest_mtime = None
+        try:
+            with os.scandir(handoffs_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.endswith('.yaml'):
+                        continue
+                    stem = name[:-len('.yaml')]
+                    if from_prefix and not stem.startswith(from_prefix):
+                        continue
+                    if to_infix and to_infix not in stem:
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue  # Removed while scanning
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest, latest_mtime = entry.path, mtime
+        except FileNotFoundError:
             return None
 
-        # Sort by modification time, newest first
-        matching.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return matching[0]
+        return Path(latest) if latest is not None else None
 
 
 # Convenience functions for common handoffs
@@ -1,6 +1,14 @@
 """Core CROAK functionality."""
 
-from croak.core.state import PipelineState
-from croak.core.config import CroakConfig
-
 __all__ = ["PipelineState", "CroakConfig"]
+
+
+def __getattr__(name):
+    # Deferred so importing croak.core.paths etc. does not pull in pydantic
+    if name == "PipelineState":
+        from croak.core.state import PipelineState
+        return PipelineState
+    if name == "CroakConfig":
+        from croak.core.config import CroakConfig
+        return CroakConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
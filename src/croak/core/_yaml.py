@@ -0,0 +1,179 @@
+"""YAML reading and writing for CROAK project files.
+
+Resolves the libyaml-backed loader/dumper once, and keeps a pickle sidecar
+(``cache/<file>.pkl`` beside each file, e.g. ``.croak/cache/``) so repeated
+CLI invocations can skip YAML parsing while the file is unchanged.
+Machine-written files may be stored as JSON (a YAML subset) and are parsed
+with the much faster json module.
+Writes go through a temp file and os.replace, so an interrupted command never
+leaves a truncated file behind, and are skipped when the data is unchanged.
+"""
+
+import json
+import os
+import pickle
+import struct
+import threading
+from pathlib import Path
+from typing import IO, Any, Callable, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+
+def safe_load(stream: Any) -> Any:
+    """Parse YAML from a string or file with the libyaml-backed safe loader."""
+    return yaml.load(stream, Loader=YamlLoader)
+
+
+# Sidecars start with the (mtime_ns, size) they were written for. The header
+# is compared before anything is unpickled, so a sidecar that does not belong
+# to the file as it is now (e.g. one committed into a cloned repo) is never
+# loaded.
+_SIDECAR_HEADER = struct.Struct("<qq")
+
+
+def cache_dir(parent: Path) -> Path:
+    """Return parent/cache, creating it with a .gitignore that ignores it all."""
+    directory = parent / "cache"
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / ".gitignore").write_text("*\n")
+    return directory
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.parent / "cache" / (path.name + ".pkl")
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _write_sidecar(path: Path, data: Any) -> None:
+    """Record parsed data for the file's current mtime and size."""
+    try:
+        cache_dir(path.parent)
+        with open(_sidecar_path(path), "wb") as f:
+            f.write(_SIDECAR_HEADER.pack(*_stat_key(path)))
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # Read-only project dirs just lose the fast path
+
+
+def _read_sidecar(path: Path, key: Tuple[int, int]) -> Optional[Tuple[Any]]:
+    """Return (data,) from the sidecar if it matches key, else None."""
+    try:
+        with open(_sidecar_path(path), "rb") as f:
+            if f.read(_SIDECAR_HEADER.size) != _SIDECAR_HEADER.pack(*key):
+                return None
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return (data,)
+
+
+def _unchanged(path: Path, data: Any) -> bool:
+    """Check whether path already holds data, going by its fresh sidecar."""
+    try:
+        key = _stat_key(path)
+    except OSError:
+        return False
+    cached = _read_sidecar(path, key)
+    return cached is not None and cached[0] == data
+
+
+def atomic_write(path: Path, write: Callable[[IO], None], binary: bool = False) -> None:
+    """Write a UTF-8 text file through a temp sibling and os.replace.
+
+    An interrupted or failing write leaves the previous file untouched, and
+    concurrent readers see either the old or the new file, never a partial
+    one. The encoding is fixed rather than taken from the locale, as the
+    dumpers write non-ASCII text as-is. With binary, write gets a binary
+    file instead.
+    """
+    # Plain open (not mkstemp) so the file gets the usual umask-based mode
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with (open(tmp, "wb") if binary else open(tmp, "w", encoding="utf-8")) as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_yaml(path: Path) -> Any:
+    """Load a YAML file, using its pickle sidecar when still fresh.
+
+    Args:
+        path: YAML file to read.
+
+    Returns:
+        Parsed YAML data.
+    """
+    key = _stat_key(path)
+    cached = _read_sidecar(path, key)
+    if cached is not None:
+        return cached[0]
+
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("{"):
+        try:
+            data = json.loads(text)
+        except ValueError:
+            data = yaml.load(text, Loader=YamlLoader)  # YAML flow mapping
+    else:
+        data = yaml.load(text, Loader=YamlLoader)
+    _write_sidecar(path, data)
+    return data
+
+
+def dump_yaml(data: Any, path: Path) -> None:
+    """Write data as block-style YAML and refresh its pickle sidecar.
+
+    Keys keep their insertion (model field) order, so saved files diff cleanly.
+    Skipped when the file is known to hold the same data already.
+
+    Args:
+        data: Plain data to serialize.
+        path: Destination YAML file.
+    """
+    if _unchanged(path, data):
+        return
+    atomic_write(path, lambda f: yaml.dump(
+        data, f, Dumper=YamlDumper,
+        default_flow_style=False, sort_keys=False, allow_unicode=True,
+    ))
+    _write_sidecar(path, data)
+
+
+def dump_json(data: Any, path: Path) -> None:
+    """Write data as JSON and refresh its pickle sidecar.
+
+    For files only written by CROAK itself. The output is still valid YAML,
+    so anything reading the file with a YAML parser keeps working. Skipped
+    when the file is known to hold the same data already.
+
+    Args:
+        data: Plain data to serialize.
+        path: Destination file.
+    """
+    if _unchanged(path, data):
+        return
+
+    def write(f: IO[str]) -> None:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+    atomic_write(path, write)
+    _write_sidecar(path, data)
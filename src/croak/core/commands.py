@@ -16,6 +16,11 @@ from typing import List, Optional, Dict, Any
 from croak.core.paths import safe_path, PathValidator
 from croak.core.secrets import SecretsManager
 
+try:
+    from orjson import loads as _json_loads  # Optional: croak-cv[fast]
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -312,8 +317,6 @@ class SecureRunner:
             Dict with keys: success, output (parsed JSON or raw string),
             raw (raw stdout), error (stderr on failure).
         """
-        import json
-
         cmd = ['vfrog'] + args
         if json_output:
             cmd.append('--json')
@@ -327,8 +330,8 @@ class SecureRunner:
             parsed = None
             if result.stdout and json_output:
                 try:
-                    parsed = json.loads(result.stdout)
-                except json.JSONDecodeError:
+                    parsed = _json_loads(result.stdout)
+                except ValueError:  # json and orjson decode errors both subclass it
                     parsed = None
 
             return {
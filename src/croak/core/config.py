@@ -2,9 +2,10 @@
 
 from pathlib import Path
 from typing import Any, Optional
-import yaml
 from pydantic import BaseModel, Field
 
+from croak.core._yaml import dump_yaml, load_yaml
+
 
 class VfrogConfig(BaseModel):
     """vfrog.ai integration configuration.
@@ -95,8 +96,7 @@ class CroakConfig(BaseModel):
         if not config_path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
+        data = load_yaml(config_path)
 
         return cls(**data)
 
@@ -104,8 +104,7 @@ class CroakConfig(BaseModel):
         """Save configuration to YAML file."""
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(config_path, "w") as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+        dump_yaml(self.model_dump(), config_path)
 
     @classmethod
     def find_config(cls, start_path: Optional[Path] = None) -> Optional[Path]:
@@ -1,10 +1,22 @@
 """CROAK pipeline state management."""
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
-from datetime import datetime
-import yaml
-from pydantic import BaseModel, Field
+from typing import Any, Iterator, Optional
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
+
+from croak.core._yaml import dump_json, load_yaml
+
+
+def state_path(project_root: Path) -> Path:
+    """Return the pipeline state file of a project."""
+    return Path(project_root) / ".croak" / "pipeline-state.yaml"
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 class AnnotationState(BaseModel):
@@ -141,27 +153,45 @@ class PipelineState(BaseModel):
     workflow_progress: dict[str, list[str]] = Field(default_factory=dict)
     workflow_artifacts: dict[str, dict] = Field(default_factory=dict)
 
+    # File the state was loaded from or last saved to; not serialized
+    _path: Optional[Path] = PrivateAttr(default=None)
+
     @classmethod
     def load(cls, state_path: Path) -> "PipelineState":
-        """Load state from YAML file."""
-        if not state_path.exists():
-            return cls()
+        """Load state from file (JSON, or YAML written by older versions).
 
-        with open(state_path) as f:
-            data = yaml.safe_load(f)
+        The path is remembered, so save() can be called without one.
+        """
+        data = load_yaml(state_path) if state_path.exists() else None
+        state = cls(**data) if data is not None else cls()
+        state._path = state_path
+        return state
 
-        if data is None:
-            return cls()
+    def save(self, state_path: Optional[Path] = None) -> None:
+        """Save state to file as JSON.
 
-        return cls(**data)
+        Args:
+            state_path: Destination file. Defaults to the file the state was
+                loaded from or last saved to.
+
+        Raises:
+            ValueError: If no path is given and none is remembered.
+        """
+        state_path = state_path or self._path
+        if state_path is None:
+            raise ValueError("No state file: pass a path or load the state from one")
 
-    def save(self, state_path: Path) -> None:
-        """Save state to YAML file."""
-        self.last_updated = datetime.utcnow().isoformat()
+        self.last_updated = utc_now_iso()
         state_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(state_path, "w") as f:
-            yaml.dump(self.model_dump(), f, default_flow_style=False)
+        dump_json(self.model_dump(), state_path)
+        self._path = state_path
+
+    @field_validator("stages_completed")
+    @classmethod
+    def _dedupe_stages(cls, stages: list[str]) -> list[str]:
+        """Drop repeats left by older versions, keeping first-completion order."""
+        return list(dict.fromkeys(stages))
 
     def complete_stage(self, stage: str) -> None:
         """Mark a stage as completed."""
@@ -225,9 +255,9 @@ class PipelineState(BaseModel):
         current = start_path or Path.cwd()
 
         while current != current.parent:
-            state_path = current / ".croak" / "pipeline-state.yaml"
-            if state_path.exists():
-                return state_path
+            path = state_path(current)
+            if path.exists():
+                return path
             current = current.parent
 
         return None
@@ -302,5 +332,22 @@ def load_state(project_root: Path) -> PipelineState:
     Returns:
         PipelineState instance.
     """
-    state_path = project_root / ".croak" / "pipeline-state.yaml"
-    return PipelineState.load(state_path)
+    return PipelineState.load(state_path(project_root))
+
+
+@contextmanager
+def pipeline_state(project_root: Path) -> Iterator[PipelineState]:
+    """Load pipeline state for a block of updates and save it once at the end.
+
+    The state is written only if the block exits normally, so a failing
+    command leaves the file on disk untouched.
+
+    Args:
+        project_root: Path to project root directory.
+
+    Yields:
+        PipelineState instance to modify.
+    """
+    state = PipelineState.load(state_path(project_root))
+    yield state
+    state.save()
@@ -0,0 +1,64 @@
+"""Authoring-time validation of agent definition YAML files.
+
+The runtime loader builds agent models without validation (see
+``CROAK_TRUST_YAML``), so this module is the place where agent YAMLs are
+checked field by field. Run it with ``make validate-agents`` or::
+
+    python -m croak.core.validate_agents agents/
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+from pydantic import ValidationError
+from yaml import YAMLError
+
+from croak.agents.loader import AgentLoader
+
+
+def validate_agents(agents_dir: Path) -> List[Tuple[Path, str]]:
+    """Fully validate every agent definition in a directory.
+
+    Args:
+        agents_dir: Directory containing agent subdirectories.
+
+    Returns:
+        List of (yaml_path, error message) tuples. Empty if all agents are valid.
+    """
+    loader = AgentLoader(agents_dir, validate=True)
+    errors = []
+
+    # Same file lookup as the runtime loader, so the two cannot disagree
+    for yaml_file in sorted(loader._agent_files()):
+        try:
+            loader.load_agent(yaml_file)
+        except (ValidationError, ValueError, AttributeError, TypeError, YAMLError, OSError) as e:
+            errors.append((yaml_file, str(e)))
+
+    return errors
+
+
+def main(argv: List[str]) -> int:
+    """Validate agents and report errors.
+
+    Args:
+        argv: Command-line arguments; the first is the agents directory.
+
+    Returns:
+        Process exit code.
+    """
+    agents_dir = Path(argv[0]) if argv else Path("agents")
+    if not agents_dir.is_dir():
+        print(f"Agents directory not found: {agents_dir}", file=sys.stderr)
+        return 1
+
+    errors = validate_agents(agents_dir)
+    for yaml_file, message in errors:
+        print(f"{yaml_file}:\n{message}\n", file=sys.stderr)
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
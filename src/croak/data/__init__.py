@@ -1,6 +1,7 @@
 """CROAK data handling utilities."""
 
 from croak.data.scanner import scan_directory, find_duplicates, validate_images
+from croak.data.index import DatasetIndex
 from croak.data.validator import DataValidator, ValidationResult
 from croak.data.splitter import DatasetSplitter
 
@@ -8,6 +9,7 @@ __all__ = [
     "scan_directory",
     "find_duplicates",
     "validate_images",
+    "DatasetIndex",
     "DataValidator",
     "ValidationResult",
     "DatasetSplitter",
@@ -0,0 +1,105 @@
+"""Shared file inventory for a CROAK data directory."""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from croak.data.scanner import SUPPORTED_IMAGE_FORMATS, walk_files
+
+
+def _class_ids(lines: Iterable[str]) -> Iterator[int]:
+    """Yield the class ID of each YOLO label line, skipping blank or malformed lines."""
+    for line in lines:
+        parts = line.split(None, 1)
+        if parts:
+            try:
+                yield int(parts[0])
+            except ValueError:
+                continue
+
+
+@dataclass
+class DatasetIndex:
+    """Image and label files of a data directory, listed once.
+
+    Lets DataValidator and DatasetSplitter share a single directory walk
+    instead of each globbing raw/ and annotations/ on its own.
+
+    Attributes:
+        images: Sorted paths of supported images anywhere under raw/.
+        labels: Map of stem to path for YOLO .txt files directly in annotations/.
+    """
+    images: List[str] = field(default_factory=list)
+    labels: Dict[str, str] = field(default_factory=dict)
+    _class_ids: Optional[Dict[str, List[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def label_class_ids(self, stems: Optional[Iterable[str]] = None) -> Dict[str, List[int]]:
+        """Class IDs of each label file's lines, keyed by stem.
+
+        Every label file is read once on first call and the result is kept,
+        so the validator's class counts and the splitter's stratification
+        share one pass. Blank and malformed lines are skipped; unreadable
+        files keep whatever was parsed before the error.
+
+        Args:
+            stems: Only these label files. They are taken from the full
+                result if it was already built, otherwise parsed on their
+                own without reading (or keeping) the rest.
+        """
+        if stems is not None and self._class_ids is None:
+            return {
+                stem: self._parse_label(self.labels[stem])
+                for stem in stems if stem in self.labels
+            }
+        if self._class_ids is None:
+            self._class_ids = {
+                stem: self._parse_label(path) for stem, path in self.labels.items()
+            }
+        if stems is not None:
+            return {stem: self._class_ids[stem] for stem in stems if stem in self._class_ids}
+        return self._class_ids
+
+    @staticmethod
+    def _parse_label(path: str) -> List[int]:
+        """Class IDs of one label file, keeping what was read before any error."""
+        ids: List[int] = []
+        try:
+            with open(path) as f:
+                ids.extend(_class_ids(f))
+        except (OSError, ValueError):
+            pass
+        return ids
+
+    @classmethod
+    def from_dir(cls, data_dir: Path) -> "DatasetIndex":
+        """Build an index for data_dir/raw and data_dir/annotations.
+
+        Args:
+            data_dir: Path to data directory.
+
+        Returns:
+            DatasetIndex for the directory. Missing subdirectories are empty.
+        """
+        data_dir = os.fspath(data_dir)
+
+        images = [
+            entry.path
+            for entry in walk_files(os.path.join(data_dir, "raw"))
+            if os.path.splitext(entry.name)[1].lower() in SUPPORTED_IMAGE_FORMATS
+        ]
+        images.sort()
+
+        labels = {}
+        try:
+            with os.scandir(os.path.join(data_dir, "annotations")) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext == ".txt" and entry.is_file():
+                        labels[stem] = entry.path
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+
+        return cls(images=images, labels=dict(sorted(labels.items())))
@@ -1,20 +1,102 @@
 """Data directory scanning utilities."""
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 from collections import defaultdict
 
 from PIL import Image
 
 
-SUPPORTED_IMAGE_FORMATS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff"}
+SUPPORTED_IMAGE_FORMATS = frozenset({".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff"})
 
+# Below this many images a process pool costs more to start than it saves
+PARALLEL_MIN_IMAGES = 256
 
-def scan_directory(directory: Path) -> dict:
+
+# Threads for walk_files in scans: directory reads mostly wait on the filesystem
+WALK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _scan_dir(path: str) -> list[os.DirEntry]:
+    """List a directory's entries. Missing or unreadable directories are empty."""
+    try:
+        with os.scandir(path) as entries:
+            return list(entries)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return []
+
+
+def walk_files(root, workers: int = 0) -> Iterator[os.DirEntry]:
+    """Yield non-directory entries under root using scandir.
+
+    No Path object is built per entry and file types come from the cached
+    DirEntry data. Symlinked directories are yielded, not descended into.
+    A missing root yields nothing.
+
+    Args:
+        root: Directory to walk.
+        workers: Read directories on a thread pool of this many threads, so
+            on network or high-latency filesystems many listings are in
+            flight at once. 0 walks in the calling thread.
+    """
+    root = os.fspath(root)
+    if workers <= 0:
+        pending = [root]
+        while pending:
+            for entry in _scan_dir(pending.pop()):
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                else:
+                    yield entry
+        return
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {executor.submit(_scan_dir, root)}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                for entry in future.result():
+                    if entry.is_dir(follow_symlinks=False):
+                        running.add(executor.submit(_scan_dir, entry.path))
+                    else:
+                        yield entry
+
+
+def _inspect_image(path: str) -> tuple[Optional[tuple[int, int]], Optional[str]]:
+    """Verify an image and read its size.
+
+    Module-level so process pool workers can run it.
+
+    Returns:
+        Tuple of (size, None) for a readable image, or (None, error).
+    """
+    try:
+        with Image.open(path) as img:
+            img.verify()
+        # Re-open to get size (verify closes the file)
+        with Image.open(path) as img:
+            return img.size, None
+    except Exception as e:
+        return None, str(e)
+
+
+def scan_directory(
+    directory: Path,
+    image_paths: Optional[list[str]] = None,
+    workers: int = 1,
+) -> dict:
     """Scan a directory for images and annotations.
 
     Args:
         directory: Path to scan for images.
+        image_paths: Candidate image files already listed under directory.
+            Skips the recursive walk when given.
+        workers: Processes used to verify images. Images are checked
+            serially when 1, or when there are fewer than
+            PARALLEL_MIN_IMAGES of them.
 
     Returns:
         Dict with scan results including counts and formats.
@@ -30,24 +112,42 @@ def scan_directory(directory: Path) -> dict:
     }
 
     # Scan for images
-    for path in directory.rglob("*"):
-        if path.suffix.lower() in SUPPORTED_IMAGE_FORMATS:
-            # Try to open and verify
-            try:
-                with Image.open(path) as img:
-                    img.verify()
-                # Re-open to get size (verify closes the file)
-                with Image.open(path) as img:
-                    results["sizes"].append(img.size)
-                    results["images"].append(str(path))
-                    results["formats"][path.suffix.lower()] += 1
-                    results["total_images"] += 1
-            except Exception as e:
-                results["corrupt"].append((str(path), str(e)))
+    all_files = (
+        sorted(entry.path for entry in walk_files(directory, WALK_WORKERS))
+        if image_paths is None else None
+    )
+    paths = [
+        p for p in (all_files if all_files is not None else map(str, image_paths))
+        if os.path.splitext(p)[1].lower() in SUPPORTED_IMAGE_FORMATS
+    ]
+
+    # Try to open and verify, sharded across processes for large datasets.
+    # Workers are spawned rather than forked: callers may be running other
+    # threads (e.g. a progress display), which a fork could deadlock on.
+    if workers > 1 and len(paths) >= PARALLEL_MIN_IMAGES:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+        ) as executor:
+            inspected = list(executor.map(_inspect_image, paths, chunksize=chunksize))
+    else:
+        inspected = map(_inspect_image, paths)
+
+    for path, (size, error) in zip(paths, inspected):
+        if error is not None:
+            results["corrupt"].append((path, error))
+            continue
+        results["sizes"].append(size)
+        results["images"].append(path)
+        results["formats"][Path(path).suffix.lower()] += 1
+        results["total_images"] += 1
 
     # Check for existing annotations
     results["has_annotations"], results["annotation_format"] = _detect_annotations(
-        directory, results["images"]
+        directory, results["images"], files=all_files
     )
 
     # Compute size statistics
@@ -66,34 +166,46 @@ def scan_directory(directory: Path) -> dict:
     return dict(results)
 
 
-def _detect_annotations(directory: Path, images: list[str]) -> tuple[bool, Optional[str]]:
+def _detect_annotations(
+    directory: Path,
+    images: list[str],
+    files: Optional[list[str]] = None,
+) -> tuple[bool, Optional[str]]:
     """Detect if annotations exist and their format.
 
     Args:
         directory: Directory to check.
         images: List of image paths found.
+        files: Every file under directory, if already listed. Avoids
+            re-walking the tree for each format.
 
     Returns:
         Tuple of (has_annotations, format_name).
     """
+    from fnmatch import fnmatchcase
+
+    if files is None:
+        files = sorted(entry.path for entry in walk_files(directory, WALK_WORKERS))
+    file_set = set(files)
+
     # Check for YOLO format (.txt files alongside images)
-    yolo_count = 0
-    for img_path in images:
-        txt_path = Path(img_path).with_suffix(".txt")
-        if txt_path.exists():
-            yolo_count += 1
+    yolo_count = sum(
+        1 for img_path in images if os.path.splitext(img_path)[0] + ".txt" in file_set
+    )
 
     if yolo_count > len(images) * 0.5:  # More than 50% have labels
         return True, "yolo"
 
+    names = [os.path.basename(f) for f in files]
+
     # Check for COCO format (annotations.json or instances_*.json)
     coco_patterns = ["annotations.json", "instances_*.json", "*_annotations.json"]
     for pattern in coco_patterns:
-        if list(directory.rglob(pattern)):
+        if any(fnmatchcase(name, pattern) for name in names):
             return True, "coco"
 
     # Check for Pascal VOC format (.xml files)
-    xml_count = len(list(directory.rglob("*.xml")))
+    xml_count = sum(1 for name in names if name.endswith(".xml"))
     if xml_count > len(images) * 0.5:
         return True, "voc"
 
@@ -2,12 +2,14 @@
 
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import random
+import os
 import shutil
-from collections import defaultdict
 import yaml
 import hashlib
 
+from croak.core._yaml import YamlDumper, atomic_write
+from croak.data.index import DatasetIndex
+
 
 class DatasetSplitter:
     """Split dataset into train/val/test sets.
@@ -19,16 +21,26 @@ class DatasetSplitter:
     - Generates data.yaml for training
     """
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, index: Optional[DatasetIndex] = None):
         """Initialize dataset splitter.
 
         Args:
             data_dir: Path to data directory.
+            index: Pre-built file inventory of data_dir. Built on first use
+                if not given.
         """
         self.data_dir = Path(data_dir)
         self.images_dir = self.data_dir / "raw"
         self.labels_dir = self.data_dir / "annotations"
         self.output_dir = self.data_dir / "processed"
+        self._index = index
+
+    @property
+    def index(self) -> DatasetIndex:
+        """File inventory of the data directory."""
+        if self._index is None:
+            self._index = DatasetIndex.from_dir(self.data_dir)
+        return self._index
 
     def split(
         self,
@@ -57,7 +69,9 @@ class DatasetSplitter:
         if abs(total - 1.0) > 0.001:
             raise ValueError(f"Ratios must sum to 1.0, got {total}")
 
-        random.seed(seed)
+        import numpy as np
+
+        rng = np.random.default_rng(seed)
 
         # Find all image-label pairs
         pairs = self._find_pairs()
@@ -70,9 +84,9 @@ class DatasetSplitter:
 
         # Split data
         if stratify and len(pairs) > 10:
-            splits = self._stratified_split(pairs, train_ratio, val_ratio, test_ratio)
+            splits = self._stratified_split(pairs, train_ratio, val_ratio, test_ratio, rng)
         else:
-            splits = self._random_split(pairs, train_ratio, val_ratio, test_ratio)
+            splits = self._random_split(pairs, train_ratio, val_ratio, test_ratio, rng)
 
         # Create output directories and copy files
         self._setup_output_dirs()
@@ -105,13 +119,16 @@ class DatasetSplitter:
             List of (image_path, label_path) tuples.
         """
         pairs = []
-        image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff'}
+        images_dir = os.fspath(self.images_dir)
+        labels = self.index.labels
 
-        for img_path in self.images_dir.glob('*'):
-            if img_path.suffix.lower() in image_extensions:
-                label_path = self.labels_dir / f"{img_path.stem}.txt"
-                if label_path.exists():
-                    pairs.append((img_path, label_path))
+        for img in self.index.images:
+            # Only top-level images are split; nested ones could collide by name
+            if os.path.dirname(img) != images_dir:
+                continue
+            label = labels.get(os.path.splitext(os.path.basename(img))[0])
+            if label is not None:
+                pairs.append((Path(img), Path(label)))
 
         return pairs
 
@@ -149,16 +166,12 @@ class DatasetSplitter:
                 pass
 
         # Otherwise, generate from class IDs
+        sample = self.index.label_class_ids(
+            label_path.stem for _, label_path in pairs[:100]  # Sample first 100
+        )
         class_ids = set()
-        for _, label_path in pairs[:100]:  # Sample first 100
-            try:
-                with open(label_path) as f:
-                    for line in f:
-                        parts = line.strip().split()
-                        if parts:
-                            class_ids.add(int(parts[0]))
-            except Exception:
-                continue
+        for ids in sample.values():
+            class_ids.update(ids)
 
         return [f"class_{i}" for i in sorted(class_ids)]
 
@@ -168,51 +181,52 @@ class DatasetSplitter:
         train_ratio: float,
         val_ratio: float,
         test_ratio: float,
+        rng,
     ) -> Dict[str, List[Tuple[Path, Path]]]:
         """Split maintaining class proportions.
 
+        Works on index arrays: pairs are grouped by class with one stable
+        argsort and each group is permuted and sliced, so no per-class
+        lists of pairs are built.
+
         Args:
             pairs: Image-label pairs.
             train_ratio: Training ratio.
             val_ratio: Validation ratio.
             test_ratio: Test ratio.
+            rng: numpy Generator used for shuffling.
 
         Returns:
             Dict with 'train', 'val', 'test' lists.
         """
-        # Group by primary (first) class
-        by_class = defaultdict(list)
-        for img, label in pairs:
-            try:
-                with open(label) as f:
-                    first_line = f.readline().strip()
-                    if first_line:
-                        class_id = int(first_line.split()[0])
-                        by_class[class_id].append((img, label))
-                    else:
-                        # Empty annotation - put in special group
-                        by_class[-1].append((img, label))
-            except Exception:
-                by_class[-1].append((img, label))
+        import numpy as np
+
+        # Primary (first) class of each pair; empty or unreadable labels are -1
+        label_class_ids = self.index.label_class_ids()
+        primary = (label_class_ids.get(label.stem) or [-1] for _, label in pairs)
+        labels = np.fromiter((ids[0] for ids in primary), dtype=np.int64, count=len(pairs))
 
-        splits = {'train': [], 'val': [], 'test': []}
+        # Group pair indices by class: contiguous runs of the sorted labels
+        order = np.argsort(labels, kind="stable")
+        _, starts = np.unique(labels[order], return_index=True)
 
-        for class_id, class_pairs in by_class.items():
-            random.shuffle(class_pairs)
-            n = len(class_pairs)
+        parts = {'train': [], 'val': [], 'test': []}
+        for group in np.split(order, starts[1:]):
+            group = rng.permutation(group)
+            n = len(group)
 
             train_end = int(n * train_ratio)
             val_end = train_end + int(n * val_ratio)
 
-            splits['train'].extend(class_pairs[:train_end])
-            splits['val'].extend(class_pairs[train_end:val_end])
-            splits['test'].extend(class_pairs[val_end:])
+            parts['train'].append(group[:train_end])
+            parts['val'].append(group[train_end:val_end])
+            parts['test'].append(group[val_end:])
 
-        # Shuffle each split
-        for split in splits.values():
-            random.shuffle(split)
-
-        return splits
+        # Shuffle each split so classes are interleaved
+        return {
+            name: [pairs[i] for i in rng.permutation(np.concatenate(chunks))]
+            for name, chunks in parts.items()
+        }
 
     def _random_split(
         self,
@@ -220,6 +234,7 @@ class DatasetSplitter:
         train_ratio: float,
         val_ratio: float,
         test_ratio: float,
+        rng,
     ) -> Dict[str, List[Tuple[Path, Path]]]:
         """Simple random split.
 
@@ -228,12 +243,12 @@ class DatasetSplitter:
             train_ratio: Training ratio.
             val_ratio: Validation ratio.
             test_ratio: Test ratio.
+            rng: numpy Generator used for shuffling.
 
         Returns:
             Dict with 'train', 'val', 'test' lists.
         """
-        pairs = pairs.copy()
-        random.shuffle(pairs)
+        pairs = [pairs[i] for i in rng.permutation(len(pairs))]
         n = len(pairs)
 
         train_end = int(n * train_ratio)
@@ -254,16 +269,29 @@ class DatasetSplitter:
     def _copy_splits(self, splits: Dict[str, List[Tuple[Path, Path]]]) -> None:
         """Copy files to split directories.
 
+        Copies run on a thread pool; they are I/O bound and shutil releases
+        the GIL while copying. Destination directories must already exist.
+        Images sharing a stem (img.jpg, img.png) share a label destination;
+        each destination is copied once, from the last pair naming it.
+
         Args:
             splits: Dict of splits with file pairs.
         """
+        from concurrent.futures import ThreadPoolExecutor
+
+        copies: Dict[Path, Path] = {}
         for split_name, pairs in splits.items():
             img_dir = self.output_dir / "images" / split_name
             label_dir = self.output_dir / "labels" / split_name
 
             for img_path, label_path in pairs:
-                shutil.copy2(img_path, img_dir / img_path.name)
-                shutil.copy2(label_path, label_dir / f"{img_path.stem}.txt")
+                copies[img_dir / img_path.name] = img_path
+                copies[label_dir / f"{img_path.stem}.txt"] = label_path
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Drain the results so a failed copy raises here
+            for _ in executor.map(shutil.copy2, copies.values(), copies.keys()):
+                pass
 
     def _create_data_yaml(
         self,
@@ -288,12 +316,15 @@ class DatasetSplitter:
             'nc': len(class_names),
         }
 
-        yaml_path = self.output_dir / 'data.yaml'
-        with open(yaml_path, 'w') as f:
+        def write(f) -> None:
             f.write("# CROAK Dataset Configuration\n")
             f.write(f"# Generated with seed for reproducibility\n")
             f.write(f"# Train: {len(splits['train'])}, Val: {len(splits['val'])}, Test: {len(splits['test'])}\n\n")
-            yaml.dump(data_yaml, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data_yaml, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
+
+        # Training reads this file; a failed write keeps the previous one
+        yaml_path = self.output_dir / 'data.yaml'
+        atomic_write(yaml_path, write)
 
         return yaml_path
 
@@ -1,11 +1,15 @@
 """Data validation for CROAK."""
 
+import os
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 
 from PIL import Image
 
+from croak.data.index import DatasetIndex
 from croak.data.scanner import scan_directory, SUPPORTED_IMAGE_FORMATS
 
 
@@ -57,16 +61,33 @@ class DataValidator:
     MAX_IMAGE_SIZE = 4096
     MIN_ANNOTATION_COVERAGE = 0.9  # 90%
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        index: Optional[DatasetIndex] = None,
+        workers: int = 1,
+    ):
         """Initialize data validator.
 
         Args:
             data_dir: Path to data directory.
+            index: Pre-built file inventory of data_dir. Built on first use
+                if not given.
+            workers: Processes used to verify images. 1 checks serially.
         """
         self.data_dir = Path(data_dir)
         self.images_dir = self.data_dir / "raw"
         self.labels_dir = self.data_dir / "annotations"
         self.processed_dir = self.data_dir / "processed"
+        self._index = index
+        self.workers = workers
+
+    @property
+    def index(self) -> DatasetIndex:
+        """File inventory of the data directory."""
+        if self._index is None:
+            self._index = DatasetIndex.from_dir(self.data_dir)
+        return self._index
 
     def validate_all(self) -> ValidationResult:
         """Run all validation checks.
@@ -98,7 +119,9 @@ class DataValidator:
             result.add_error(f"Images directory not found: {self.images_dir}")
             return
 
-        scan = scan_directory(self.images_dir)
+        scan = scan_directory(
+            self.images_dir, image_paths=self.index.images, workers=self.workers
+        )
         result.statistics['images'] = scan
 
         # Check count
@@ -172,10 +195,9 @@ class DataValidator:
         if not images:
             return
 
-        # Check annotation coverage
-        image_stems = {Path(p).stem for p in images}
-        label_files = list(self.labels_dir.glob('*.txt'))
-        label_stems = {p.stem for p in label_files}
+        # Check annotation coverage with set operations on file stems
+        image_stems = {os.path.splitext(os.path.basename(p))[0] for p in images}
+        label_stems = self.index.labels.keys()
 
         matched = image_stems & label_stems
         missing = image_stems - label_stems
@@ -203,7 +225,7 @@ class DataValidator:
             )
 
         # Validate annotation format (sample)
-        sample_labels = label_files[:min(100, len(label_files))]
+        sample_labels = [Path(p) for p in islice(self.index.labels.values(), 100)]
         self._validate_yolo_format(result, sample_labels)
 
     def _validate_yolo_format(self, result: ValidationResult, label_files: List[Path]) -> None:
@@ -287,25 +309,16 @@ class DataValidator:
         if not self.labels_dir.exists():
             return
 
-        class_counts: Dict[int, int] = {}
-        for label_file in self.labels_dir.glob('*.txt'):
-            try:
-                with open(label_file) as f:
-                    for line in f:
-                        parts = line.strip().split()
-                        if len(parts) >= 1:
-                            try:
-                                class_id = int(parts[0])
-                                class_counts[class_id] = class_counts.get(class_id, 0) + 1
-                            except ValueError:
-                                continue
-            except Exception:
-                continue
+        # Counter.update counts in C; the parsed ids are shared with the splitter
+        class_counts: Counter = Counter()
+        for ids in self.index.label_class_ids().values():
+            class_counts.update(ids)
 
         if not class_counts:
             return
 
-        result.statistics['class_distribution'] = class_counts
+        # Plain dict, most frequent class first
+        result.statistics['class_distribution'] = dict(class_counts.most_common())
         result.statistics['num_classes'] = len(class_counts)
 
         # Check minimums
@@ -14,7 +14,21 @@ except ImportError:
 
 from croak.core.paths import PathValidator
 from croak.core.commands import SecureRunner
-from croak.core.state import load_state
+from croak.core.state import PipelineState, load_state
+
+
+def _export_format(
+    project_dir: Path,
+    state: PipelineState,
+    model_path: str,
+    format: str,
+    output_dir: str,
+    record_input: str,
+) -> Dict[str, Any]:
+    """Export one format. Module-level so process pool workers can run it."""
+    return ModelDeployer(project_dir, state=state).export_model(
+        model_path, format, output_dir=output_dir, record_input=record_input
+    )
 
 
 class ModelDeployer:
@@ -24,43 +38,63 @@ class ModelDeployer:
     Modal.com serverless inference endpoints.
     """
 
-    # Supported export formats
+    # Supported export formats. 'half' is the default precision choice for
+    # the format (FP16 where the target runtime executes it natively);
+    # 'int8' marks formats Ultralytics can quantize with calibration data.
     EXPORT_FORMATS = {
         'onnx': {
             'description': 'ONNX format for cross-platform inference',
             'suffix': '.onnx',
+            'half': False,
+            'int8': False,
         },
         'torchscript': {
             'description': 'TorchScript for PyTorch deployment',
             'suffix': '.torchscript',
+            'half': False,
+            'int8': False,
         },
         'coreml': {
             'description': 'CoreML for iOS/macOS deployment',
             'suffix': '.mlpackage',
+            'half': True,
+            'int8': False,
         },
         'tflite': {
             'description': 'TFLite for mobile/edge devices',
             'suffix': '.tflite',
+            'half': True,
+            'int8': True,
         },
         'engine': {
             'description': 'TensorRT for NVIDIA GPUs',
             'suffix': '.engine',
+            'half': True,
+            'int8': True,
         },
         'openvino': {
             'description': 'OpenVINO for Intel hardware',
             'suffix': '_openvino_model',
+            'half': False,
+            'int8': True,
         },
     }
 
-    def __init__(self, project_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        project_dir: Optional[Path] = None,
+        state: Optional[PipelineState] = None,
+    ):
         """Initialize model deployer.
 
         Args:
             project_dir: Project directory. Uses current if not specified.
+            state: Already loaded pipeline state of the project. Loaded from
+                disk if not given.
         """
         self.project_dir = Path(project_dir) if project_dir else Path.cwd()
         self.path_validator = PathValidator(self.project_dir)
-        self.state = load_state(self.project_dir)
+        self.state = state if state is not None else load_state(self.project_dir)
 
     def export_model(
         self,
@@ -68,9 +102,12 @@ class ModelDeployer:
         format: str,
         output_dir: Optional[str] = None,
         imgsz: int = 640,
-        half: bool = False,
+        half: Optional[bool] = None,
         dynamic: bool = False,
         simplify: bool = True,
+        int8: bool = False,
+        data_yaml: Optional[str] = None,
+        record_input: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Export model to specified format.
 
@@ -79,9 +116,15 @@ class ModelDeployer:
             format: Export format (onnx, torchscript, coreml, tflite, engine, openvino).
             output_dir: Output directory for exported model.
             imgsz: Input image size.
-            half: Use FP16 precision.
+            half: Use FP16 precision. Defaults to FP16 for formats whose
+                runtimes execute it natively (engine, coreml, tflite).
             dynamic: Enable dynamic input shapes (ONNX).
             simplify: Simplify ONNX model.
+            int8: Quantize to INT8 (engine, openvino, tflite). Overrides half.
+            data_yaml: Dataset used to calibrate INT8 quantization. Uses
+                state if not provided.
+            record_input: Model path to record as the export's input, when
+                exporting from a copy of the weights. Defaults to model_path.
 
         Returns:
             Dict with export results.
@@ -98,6 +141,23 @@ class ModelDeployer:
                 'error': f'Unsupported format: {format}. Supported: {list(self.EXPORT_FORMATS.keys())}',
             }
 
+        if int8:
+            if not self.EXPORT_FORMATS[format]['int8']:
+                supported = [f for f, info in self.EXPORT_FORMATS.items() if info['int8']]
+                return {
+                    'success': False,
+                    'error': f'INT8 export not supported for {format}. Supported: {supported}',
+                }
+            data_yaml = data_yaml or self.state.data_yaml_path
+            if not data_yaml:
+                return {
+                    'success': False,
+                    'error': 'INT8 export needs calibration data: pass a data.yaml or run croak split',
+                }
+            half = False
+        elif half is None:
+            half = self.EXPORT_FORMATS[format]['half']
+
         # Validate model path
         model_path = self.path_validator.validate_within_project(Path(model_path))
         if not model_path.exists():
@@ -126,6 +186,10 @@ class ModelDeployer:
             export_kwargs['dynamic'] = dynamic
             export_kwargs['simplify'] = simplify
 
+        if int8:
+            export_kwargs['int8'] = True
+            export_kwargs['data'] = str(data_yaml)
+
         try:
             exported_path = model.export(**export_kwargs)
 
@@ -143,9 +207,10 @@ class ModelDeployer:
                 'success': True,
                 'format': format,
                 'exported_path': str(exported_path),
-                'input_model': str(model_path),
+                'input_model': record_input or str(model_path),
                 'imgsz': imgsz,
                 'half': half,
+                'int8': int8,
                 'exported_at': datetime.utcnow().isoformat(),
             }
 
@@ -407,15 +472,15 @@ def main():
         shutil.copy2(model_path, package_dir / model_path.name)
 
         # Export to requested formats
-        exported = []
-        for fmt in include_formats:
-            result = self.export_model(
-                str(model_path),
-                fmt,
-                output_dir=str(package_dir / 'exports'),
-            )
-            if result.get('success'):
-                exported.append(result)
+        exports_dir = package_dir / 'exports'
+        if len(include_formats) > 1:
+            results = self._export_parallel(model_path, include_formats, package_dir)
+        else:
+            results = [
+                self.export_model(str(model_path), fmt, output_dir=str(exports_dir))
+                for fmt in include_formats
+            ]
+        exported = [result for result in results if result.get('success')]
 
         # Generate sample code
         if include_sample_code:
@@ -432,6 +497,63 @@ def main():
             'created_at': datetime.utcnow().isoformat(),
         }
 
+    def _export_parallel(
+        self,
+        model_path: Path,
+        formats: List[str],
+        package_dir: Path,
+    ) -> List[Dict[str, Any]]:
+        """Export several formats at once, one process per format.
+
+        Exporters write intermediate files next to the weights (engine and
+        tflite both go through ONNX), so each process exports from its own
+        copy of the weights. Workers are spawned rather than forked so no
+        CUDA state is inherited from this process.
+
+        Args:
+            model_path: Validated path to model weights.
+            formats: Export formats.
+            package_dir: Package directory; exports go to its exports/.
+
+        Returns:
+            Export result dicts, in the order of formats.
+        """
+        import multiprocessing
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        build_dir = package_dir / '.build'
+        weights = []
+        for fmt in formats:
+            work_dir = build_dir / fmt
+            work_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(model_path, work_dir / model_path.name)
+            weights.append(work_dir / model_path.name)
+
+        results = []
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(len(formats), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context('spawn'),
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _export_format, self.project_dir, self.state,
+                        str(copy), fmt, str(package_dir / 'exports'), str(model_path),
+                    )
+                    for copy, fmt in zip(weights, formats)
+                ]
+                for fmt, future in zip(formats, futures):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'success': False, 'error': str(e), 'format': fmt}
+                    results.append(result)
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+        return results
+
     def _generate_sample_code(self, package_dir: Path, model_name: str):
         """Generate sample inference code."""
         samples_dir = package_dir / 'samples'
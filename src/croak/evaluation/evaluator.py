@@ -3,7 +3,12 @@
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+import hashlib
 import json
+import os
+import random
+
+from yaml import YAMLError
 
 try:
     from ultralytics import YOLO
@@ -11,8 +16,19 @@ try:
 except ImportError:
     HAS_ULTRALYTICS = False
 
+from croak.core._yaml import atomic_write, safe_load
 from croak.core.paths import PathValidator
-from croak.core.state import load_state
+from croak.core.state import PipelineState, load_state
+from croak.data.scanner import SUPPORTED_IMAGE_FORMATS
+
+
+def _box_iou(a, b) -> float:
+    """IoU of two (x_center, y_center, width, height) boxes."""
+    ax1, ay1, ax2, ay2 = a[0] - a[2] / 2, a[1] - a[3] / 2, a[0] + a[2] / 2, a[1] + a[3] / 2
+    bx1, by1, bx2, by2 = b[0] - b[2] / 2, b[1] - b[3] / 2, b[0] + b[2] / 2, b[1] + b[3] / 2
+    inter = max(0.0, min(ax2, bx2) - max(ax1, bx1)) * max(0.0, min(ay2, by2) - max(ay1, by1))
+    union = a[2] * a[3] + b[2] * b[3] - inter
+    return inter / union if union > 0 else 0.0
 
 
 class ModelEvaluator:
@@ -22,15 +38,21 @@ class ModelEvaluator:
     and error pattern detection for model improvement.
     """
 
-    def __init__(self, project_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        project_dir: Optional[Path] = None,
+        state: Optional[PipelineState] = None,
+    ):
         """Initialize model evaluator.
 
         Args:
             project_dir: Project directory. Uses current if not specified.
+            state: Already loaded pipeline state of the project. Loaded from
+                disk if not given.
         """
         self.project_dir = Path(project_dir) if project_dir else Path.cwd()
         self.path_validator = PathValidator(self.project_dir)
-        self.state = load_state(self.project_dir)
+        self.state = state if state is not None else load_state(self.project_dir)
 
     def evaluate(
         self,
@@ -67,11 +89,8 @@ class ModelEvaluator:
             }
 
         # Get data.yaml path
-        if data_yaml:
-            data_yaml_path = self.path_validator.validate_within_project(Path(data_yaml))
-        elif self.state.data_yaml_path:
-            data_yaml_path = Path(self.state.data_yaml_path)
-        else:
+        data_yaml_path = self._data_yaml_path(data_yaml)
+        if data_yaml_path is None:
             return {
                 'success': False,
                 'error': 'No data.yaml specified and none in project state',
@@ -83,6 +102,10 @@ class ModelEvaluator:
                 'error': f'data.yaml not found: {data_yaml_path}',
             }
 
+        cache_key = self._cache_key(
+            model_path, data_yaml_path, conf_threshold, iou_threshold, split
+        )
+
         # Load model and run evaluation
         model = YOLO(str(model_path))
 
@@ -119,6 +142,7 @@ class ModelEvaluator:
 
         # Save evaluation results
         self._save_results(eval_result)
+        self._save_cached_result(cache_key, eval_result)
 
         return eval_result
 
@@ -191,6 +215,78 @@ class ModelEvaluator:
         with open(eval_path, 'w') as f:
             json.dump(eval_result, f, indent=2)
 
+    def _cache_key(
+        self,
+        model_path: Path,
+        data_yaml_path: Path,
+        conf_threshold: float,
+        iou_threshold: float,
+        split: str,
+    ) -> str:
+        """Identify an evaluation run by its inputs and their modification times."""
+        parts = [
+            str(model_path), str(os.stat(model_path).st_mtime_ns),
+            str(data_yaml_path), str(os.stat(data_yaml_path).st_mtime_ns),
+            repr(conf_threshold), repr(iou_threshold), split,
+        ]
+        return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+    def _data_yaml_path(self, data_yaml: Optional[str]) -> Optional[Path]:
+        """Resolve the data.yaml to evaluate on, or None if there is none."""
+        if data_yaml:
+            return self.path_validator.validate_within_project(Path(data_yaml))
+        if self.state.data_yaml_path:
+            return Path(self.state.data_yaml_path)
+        return None
+
+    def last_result(
+        self,
+        model_path: str,
+        data_yaml: Optional[str] = None,
+        conf_threshold: float = 0.25,
+        iou_threshold: float = 0.5,
+        split: str = "test",
+    ) -> Optional[Dict[str, Any]]:
+        """Return the latest evaluation if it is what evaluate() would produce.
+
+        Takes the same arguments as evaluate(). The saved result is reused
+        only if it was run with the same data.yaml, thresholds and split,
+        and neither the model nor the data.yaml changed since. Does not
+        need ultralytics.
+
+        Returns:
+            The cached evaluation result, or None if there is none for
+            these inputs or they were modified.
+        """
+        try:
+            with open(self.project_dir / '.croak' / 'evaluations' / 'last.json', encoding='utf-8') as f:
+                cached = json.load(f)
+            data_yaml_path = self._data_yaml_path(data_yaml)
+            if data_yaml_path is None:
+                return None
+            model = self.path_validator.validate_within_project(Path(model_path))
+            key = self._cache_key(model, data_yaml_path, conf_threshold, iou_threshold, split)
+            if cached.get('key') != key:
+                return None
+            return cached['result']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    def _save_cached_result(self, cache_key: str, eval_result: Dict[str, Any]):
+        """Keep the latest result for reuse by report.
+
+        Only a shortcut for report, so a failed write does not fail the
+        evaluation that produced the result.
+        """
+        eval_dir = self.project_dir / '.croak' / 'evaluations'
+        try:
+            eval_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write(eval_dir / 'last.json', lambda f: json.dump(
+                {'key': cache_key, 'result': eval_result}, f, indent=2,
+            ))
+        except OSError:
+            pass
+
     def analyze_errors(
         self,
         model_path: str,
@@ -217,10 +313,7 @@ class ModelEvaluator:
         data_yaml_path = self.path_validator.validate_within_project(Path(data_yaml))
 
         model = YOLO(str(model_path))
-
-        # Run prediction on test set to get per-image results
-        # This is a simplified analysis - full implementation would
-        # compare predictions to ground truth for each image
+        samples = self._sample_images(data_yaml_path, num_samples)
 
         error_patterns = {
             'false_positives': [],
@@ -229,11 +322,20 @@ class ModelEvaluator:
             'localization_errors': [],
         }
 
+        if samples:
+            # One batched predict call rather than a model call per image
+            results = model.predict(
+                [str(p) for p in samples], batch=min(len(samples), 16), verbose=False,
+            )
+            for image, result in zip(samples, results):
+                self._classify_errors(image, result, error_patterns)
+
         analysis = {
             'success': True,
             'model_path': str(model_path),
             'data_yaml': str(data_yaml_path),
             'num_samples': num_samples,
+            'images_analyzed': len(samples),
             'error_patterns': error_patterns,
             'recommendations': self._generate_recommendations(error_patterns),
             'analyzed_at': datetime.utcnow().isoformat(),
@@ -241,6 +343,91 @@ class ModelEvaluator:
 
         return analysis
 
+    def _sample_images(self, data_yaml_path: Path, num_samples: int) -> List[Path]:
+        """Pick up to num_samples images from the val (or test) split of data.yaml.
+
+        The sample is seeded, so repeated analyses look at the same images.
+        """
+        try:
+            with open(data_yaml_path, encoding='utf-8') as f:
+                data = safe_load(f) or {}
+        except (OSError, ValueError, YAMLError):
+            return []
+
+        base = Path(data.get('path') or data_yaml_path.parent)
+        if not base.is_absolute():
+            base = data_yaml_path.parent / base
+        split_dir = next(
+            (data[s] for s in ('val', 'test') if isinstance(data.get(s), str)), None
+        )
+        if split_dir is None or not (base / split_dir).is_dir():
+            return []
+
+        images = sorted(
+            p for p in (base / split_dir).iterdir()
+            if p.suffix.lower() in SUPPORTED_IMAGE_FORMATS
+        )
+        if len(images) > num_samples:
+            images = sorted(random.Random(0).sample(images, num_samples))
+        return images
+
+    def _classify_errors(
+        self,
+        image: Path,
+        result,
+        error_patterns: Dict[str, List],
+        iou_threshold: float = 0.5,
+    ) -> None:
+        """Match one image's predictions to its YOLO labels and record the errors.
+
+        Predictions arrive sorted by confidence and each claims the unmatched
+        ground-truth box it overlaps most. Overlaps below 0.1 count as false
+        positives, and below iou_threshold as localization errors.
+        """
+        # YOLO layout: .../images/<split>/x.jpg -> .../labels/<split>/x.txt
+        sa, sb = f'{os.sep}images{os.sep}', f'{os.sep}labels{os.sep}'
+        label_path = Path(sb.join(str(image).rsplit(sa, 1))).with_suffix('.txt')
+
+        truth = []
+        try:
+            with open(label_path) as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) >= 5:
+                        truth.append((int(parts[0]), tuple(map(float, parts[1:5]))))
+        except (OSError, ValueError):
+            pass  # No or unreadable labels: every prediction is a false positive
+
+        boxes = result.boxes
+        predictions = zip(map(int, boxes.cls.tolist()), map(tuple, boxes.xywhn.tolist()))
+        matched = set()
+        for cls, box in predictions:
+            best, best_iou = None, 0.0
+            for i, (_, true_box) in enumerate(truth):
+                if i not in matched:
+                    iou = _box_iou(box, true_box)
+                    if iou > best_iou:
+                        best, best_iou = i, iou
+
+            if best is None or best_iou < 0.1:
+                error_patterns['false_positives'].append({'image': str(image), 'class': cls})
+                continue
+
+            matched.add(best)
+            true_cls = truth[best][0]
+            if true_cls != cls:
+                error_patterns['misclassifications'].append({
+                    'image': str(image), 'predicted': cls, 'actual': true_cls,
+                })
+            elif best_iou < iou_threshold:
+                error_patterns['localization_errors'].append({
+                    'image': str(image), 'class': cls, 'iou': round(best_iou, 3),
+                })
+
+        for i, (true_cls, _) in enumerate(truth):
+            if i not in matched:
+                error_patterns['false_negatives'].append({'image': str(image), 'class': true_cls})
+
     def _generate_recommendations(self, error_patterns: Dict) -> List[str]:
         """Generate recommendations based on error patterns."""
         recommendations = []
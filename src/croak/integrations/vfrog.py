@@ -10,8 +10,12 @@ Context hierarchy (must be set in order):
 3. object_id (required for iteration commands)
 """
 
+import json
+import os
 import re
+import time
 import warnings
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 
 from pydantic import BaseModel
@@ -41,6 +45,84 @@ def _sanitize_url(url: str) -> str:
     return url
 
 
+# --- Config cache ---
+
+# Seconds a cached 'vfrog config show' result stays valid on disk
+CONFIG_CACHE_TTL = 60
+
+
+def _config_cache_enabled() -> bool:
+    return os.environ.get("CROAK_VFROG_CACHE", "1") != "0"
+
+
+def _config_cache_path() -> Path:
+    return Path.home() / ".croak" / "vfrog-config-cache.json"
+
+
+def _read_config_cache() -> Optional[Dict[str, Any]]:
+    """Return the on-disk config result if it is younger than the TTL."""
+    try:
+        with open(_config_cache_path()) as f:
+            cached = json.load(f)
+        if time.time() - cached['ts'] <= CONFIG_CACHE_TTL:
+            return cached['cfg']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_config_cache(result: Dict[str, Any]) -> None:
+    """Persist a config result for other croak processes, owner-readable only."""
+    path = _config_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'ts': time.time(), 'cfg': result}, f)
+    except OSError:
+        pass  # Caching is best effort
+
+
+# Successful config result memoized for this process
+_config_memo: Optional[Dict[str, Any]] = None
+
+
+def _cached_config() -> Dict[str, Any]:
+    global _config_memo
+    if _config_memo is not None:
+        return _config_memo
+    result = _read_config_cache()
+    if result is None:
+        result = VfrogCLI.get_config()
+        if not result['success']:
+            return result  # Failures are retried on the next call
+        _write_config_cache(result)
+    _config_memo = result
+    return result
+
+
+def _clear_config_memo() -> None:
+    global _config_memo
+    _config_memo = None
+
+
+# --- Dataset image count ---
+
+# Cleared once 'dataset_images list --limit 1 --page 1' fails to give a count
+_pagination_supported = True
+
+
+def _pagination_total(output: Any) -> Optional[int]:
+    """Read the total image count from a paginated list result, if present."""
+    if isinstance(output, dict):
+        for meta in (output.get('pagination'), output):
+            if isinstance(meta, dict):
+                total = meta.get('total')
+                if isinstance(total, int) and not isinstance(total, bool):
+                    return total
+    return None
+
+
 # --- Pydantic Models (matching real vfrog data structures) ---
 
 
@@ -89,9 +171,14 @@ class VfrogCLI:
         return SecureRunner.check_command_available('vfrog')
 
     @staticmethod
-    def check_authenticated() -> bool:
-        """Check if user is logged in by inspecting config."""
-        result = SecureRunner.run_vfrog(['config', 'show'])
+    def check_authenticated(config_result: Optional[Dict[str, Any]] = None) -> bool:
+        """Check if user is logged in by inspecting config.
+
+        Args:
+            config_result: Result of an earlier get_config() call to inspect
+                instead of running 'vfrog config show' again.
+        """
+        result = config_result if config_result is not None else VfrogCLI.get_config()
         if not result['success']:
             return False
         output = result['output']
@@ -110,16 +197,41 @@ class VfrogCLI:
         Returns:
             Dict with success status and output.
         """
-        return SecureRunner.run_vfrog(
+        result = SecureRunner.run_vfrog(
             ['login', '--email', email, '--password', password],
             json_output=False,
         )
+        VfrogCLI.clear_config_cache()
+        return result
 
     @staticmethod
     def get_config() -> Dict[str, Any]:
         """Get current CLI config (org, project, object, auth status)."""
         return SecureRunner.run_vfrog(['config', 'show'])
 
+    @staticmethod
+    def get_config_cached() -> Dict[str, Any]:
+        """Get CLI config, reusing a recent result instead of spawning vfrog.
+
+        Results are memoized for the process and shared across processes
+        through ~/.croak/vfrog-config-cache.json for CONFIG_CACHE_TTL
+        seconds. Login and context changes made through VfrogCLI clear the
+        cache. Set CROAK_VFROG_CACHE=0 (or pass croak --no-cache) to always
+        query the CLI.
+        """
+        if not _config_cache_enabled():
+            return VfrogCLI.get_config()
+        return _cached_config()
+
+    @staticmethod
+    def clear_config_cache() -> None:
+        """Drop in-process and on-disk cached config results."""
+        _clear_config_memo()
+        try:
+            _config_cache_path().unlink()
+        except OSError:
+            pass
+
     @staticmethod
     def set_organisation(org_id: str) -> Dict[str, Any]:
         """Set the active organisation. Clears project_id automatically.
@@ -127,9 +239,11 @@ class VfrogCLI:
         Args:
             org_id: Organisation UUID.
         """
-        return SecureRunner.run_vfrog(
+        result = SecureRunner.run_vfrog(
             ['config', 'set', 'organisation', '--organisation_id', org_id]
         )
+        VfrogCLI.clear_config_cache()
+        return result
 
     @staticmethod
     def set_project(project_id: str) -> Dict[str, Any]:
@@ -138,9 +252,11 @@ class VfrogCLI:
         Args:
             project_id: Project UUID.
         """
-        return SecureRunner.run_vfrog(
+        result = SecureRunner.run_vfrog(
             ['config', 'set', 'project', '--project_id', project_id]
         )
+        VfrogCLI.clear_config_cache()
+        return result
 
     @staticmethod
     def set_object(object_id: str) -> Dict[str, Any]:
@@ -149,9 +265,11 @@ class VfrogCLI:
         Args:
             object_id: Object UUID.
         """
-        return SecureRunner.run_vfrog(
+        result = SecureRunner.run_vfrog(
             ['config', 'set', 'object', '--object_id', object_id]
         )
+        VfrogCLI.clear_config_cache()
+        return result
 
     # --- Organisations ---
 
@@ -208,6 +326,38 @@ class VfrogCLI:
         """List dataset images in the active project."""
         return SecureRunner.run_vfrog(['dataset_images', 'list'])
 
+    @staticmethod
+    def count_dataset_images() -> int:
+        """Count dataset images in the active project.
+
+        Asks for a one-image page and reads the total from its pagination
+        metadata, so the full list is not transferred and parsed. The
+        paging flags are not documented: when the CLI rejects them or gives
+        no total, the whole list is counted instead, and the probe is not
+        retried for the rest of the process.
+
+        Returns:
+            Number of dataset images, or 0 if they cannot be listed.
+        """
+        global _pagination_supported
+        if _pagination_supported:
+            result = SecureRunner.run_vfrog(
+                ['dataset_images', 'list', '--limit', '1', '--page', '1']
+            )
+            if result['success']:
+                output = result['output']
+                total = _pagination_total(output)
+                if total is not None:
+                    return total
+                if isinstance(output, list) and len(output) != 1:
+                    return len(output)  # Flags ignored (whole list) or no images
+            _pagination_supported = False
+
+        result = VfrogCLI.list_dataset_images()
+        if result['success'] and isinstance(result['output'], list):
+            return len(result['output'])
+        return 0
+
     @staticmethod
     def delete_dataset_image(image_id: str) -> Dict[str, Any]:
         """Delete a dataset image by ID.
@@ -335,6 +485,23 @@ class VfrogCLI:
             ['iterations', 'halo', '--iteration_id', _sanitize_arg(iteration_id, 'iteration_id')]
         )
 
+    @staticmethod
+    def extract_halo_url(result: Dict[str, Any]) -> str:
+        """Pull the review URL out of a successful get_halo_url() result.
+
+        The CLI may answer with a JSON object ('url' or 'halo_url') or with
+        the bare URL as text.
+
+        Args:
+            result: Dict returned by get_halo_url().
+        """
+        output = result.get('output')
+        if isinstance(output, dict):
+            return output.get('url', output.get('halo_url', str(output)))
+        if isinstance(output, str):
+            return output
+        return result.get('raw') or ''
+
     @staticmethod
     def next_iteration(iteration_id: str) -> Dict[str, Any]:
         """Create the next iteration from the current one.
@@ -3,11 +3,14 @@
 from pathlib import Path
 from typing import Dict, Optional, Any
 from datetime import datetime
+import json
+import os
 import yaml
 import hashlib
 
+from croak.core._yaml import atomic_write
 from croak.core.config import CroakConfig
-from croak.core.state import PipelineState
+from croak.core.state import PipelineState, state_path
 
 
 class TrainingOrchestrator:
@@ -43,15 +46,19 @@ class TrainingOrchestrator:
         'rt-detr-x': 0.020,
     }
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, state: Optional[PipelineState] = None):
         """Initialize training orchestrator.
 
         Args:
             project_root: Path to project root directory.
+            state: Already loaded pipeline state of the project. Loaded from
+                disk if not given.
         """
         self.project_root = Path(project_root)
         self.config = CroakConfig.load(self.project_root / ".croak" / "config.yaml")
-        self.state = PipelineState.load(self.project_root / ".croak" / "pipeline-state.yaml")
+        if state is None:
+            state = PipelineState.load(state_path(self.project_root))
+        self.state = state
 
     def prepare_training(
         self,
@@ -184,6 +191,9 @@ class TrainingOrchestrator:
             model_file = f"{arch}.pt"
 
         try:
+            # Registered up front so an interrupted run can still be resumed
+            self._record_checkpoint(config)
+
             # Load model
             model = YOLO(model_file)
 
@@ -220,7 +230,7 @@ class TrainingOrchestrator:
             self.state.artifacts.model.experiment_id = config['experiment_id']
             self.state.artifacts.model.metrics = metrics
             self.state.complete_stage('training')
-            self.state.save(self.project_root / ".croak" / "pipeline-state.yaml")
+            self.state.save(state_path(self.project_root))
 
             return {
                 'success': True,
@@ -290,7 +300,7 @@ class TrainingOrchestrator:
 
         if result.get('success'):
             self.state.complete_stage('training')
-            self.state.save(self.project_root / ".croak" / "pipeline-state.yaml")
+            self.state.save(state_path(self.project_root))
 
         return result
 
@@ -335,6 +345,60 @@ class TrainingOrchestrator:
 
         return experiments
 
+    def _record_checkpoint(self, config: Dict[str, Any]) -> None:
+        """Add an experiment's last.pt to the checkpoint index.
+
+        Entries are keyed by path, so re-running an experiment replaces its
+        entry. The index is only a shortcut for resume, so a failed write is
+        ignored rather than failing the training run.
+        """
+        index_path = self.project_root / '.croak' / 'checkpoints.json'
+        checkpoint = str(Path(config['output_dir']) / 'weights' / 'last.pt')
+        entries = [
+            entry for entry in self._load_checkpoint_index() or []
+            if not (isinstance(entry, dict) and entry.get('path') == checkpoint)
+        ]
+        entries.append({
+            'path': checkpoint,
+            'experiment': config['experiment_id'],
+            'started': datetime.now().isoformat(),
+        })
+
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(index_path, lambda f: json.dump(entries, f, indent=2))
+        except OSError:
+            pass
+
+    def _load_checkpoint_index(self) -> Optional[list]:
+        """Read the checkpoint index, or None if it is missing or unreadable."""
+        try:
+            with open(self.project_root / '.croak' / 'checkpoints.json', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entries if isinstance(entries, list) else None
+
+    def latest_checkpoint(self) -> Optional[str]:
+        """Find the most recently written checkpoint from the checkpoint index.
+
+        Only the indexed paths are stat'ed, instead of walking every
+        experiment directory.
+
+        Returns:
+            Path to the newest existing last.pt, or None if there is no
+            index or none of its checkpoints exist.
+        """
+        latest, latest_mtime = None, None
+        for entry in self._load_checkpoint_index() or []:
+            try:
+                mtime = os.stat(entry['path']).st_mtime
+            except (OSError, KeyError, TypeError):
+                continue
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = entry['path'], mtime
+        return latest
+
     def resume_training(self, experiment_id: str) -> Dict[str, Any]:
         """Resume training from checkpoint.
 
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures for CROAK tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _fresh_croak_root(monkeypatch):
+    """Start and end every test without a cached or exported project root.
+
+    The CLI caches the project root per process and exports it as CROAK_ROOT,
+    so a root found by one test would otherwise leak into the next.
+    """
+    from croak import cli
+
+    monkeypatch.delenv("CROAK_ROOT", raising=False)
+    cli._reset_croak_root()
+    yield
+    cli._reset_croak_root()
@@ -1,5 +1,8 @@
 """Tests for CROAK agent system."""
 
+import os
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pathlib import Path
 import tempfile
@@ -59,6 +62,36 @@ class TestAgentDefinition:
         assert "Data Agent" in prompt
         assert "Data preparation" in prompt
         assert "validate" in prompt.lower()
+        assert agent.get_system_prompt() is prompt
+
+    def test_get_command_by_trigger_or_alias(self):
+        """Test command lookup is case-insensitive over triggers and aliases."""
+        agent = AgentDefinition(
+            id="data-agent",
+            name="data_agent",
+            title="Data Agent",
+            icon="D",
+            commands=[
+                AgentCommand(
+                    trigger="scan",
+                    aliases=["Discover", "find images"],
+                    description="Scan images",
+                    capability="discovery",
+                )
+            ],
+        )
+
+        assert agent.get_command("SCAN").trigger == "scan"
+        assert agent.get_command("discover").trigger == "scan"
+        assert agent.get_command("find images").trigger == "scan"
+        assert agent.get_command("train") is None
+
+    def test_command_is_immutable(self):
+        """Test agent commands are frozen once built."""
+        command = AgentCommand(trigger="scan", description="Scan", capability="discovery")
+
+        with pytest.raises(FrozenInstanceError):
+            command.trigger = "train"
 
 
 class TestAgentLoader:
@@ -188,3 +221,324 @@ class TestAgentLoader:
 
             result = loader.route_command("unknown command")
             assert result is None
+
+    def test_load_agent_validate_rejects_bad_command(self):
+        """Test full validation catches malformed agent YAML."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            yaml_path = self._create_agent_dir(
+                agents_dir,
+                agent_id="bad-agent",
+                agent_name="bad_agent",
+                title="Bad Agent",
+                role="Broken",
+                commands=[{"trigger": "broken"}],
+            )
+
+            loader = AgentLoader(agents_dir, validate=True)
+            with pytest.raises(ValueError):
+                loader.load_agent(yaml_path)
+
+    def test_validate_agents_reports_errors(self):
+        """Test authoring-time validation of an agents directory."""
+        from croak.core.validate_agents import validate_agents
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="good",
+                agent_name="good",
+                title="Good Agent",
+                role="Fine",
+            )
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="bad",
+                agent_name="bad",
+                title="Bad Agent",
+                role="Broken",
+                commands=[{"trigger": "broken"}],
+            )
+
+            (agents_dir / "malformed").mkdir()
+            (agents_dir / "malformed" / "agent.yaml").write_text("agent: [unclosed\n")
+
+            errors = validate_agents(agents_dir)
+
+            assert [path.name for path, _ in errors] == ["bad.agent.yaml", "agent.yaml"]
+
+    def test_load_all_uses_disk_cache(self):
+        """Test warm loads come from the cache until a YAML changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / ".croak" / "agents"
+
+            yaml_path = self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+            assert loader.cache_path == Path(tmpdir) / ".croak" / "cache" / "agents.pkl"
+            assert loader.cache_path.exists()
+
+            warm = AgentLoader(agents_dir)
+            warm.load_agent = None  # would fail if YAML were re-parsed
+            agents = warm.load_all()
+            assert agents["data_agent"].title == "Data Agent"
+
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Renamed Agent",
+                role="Data",
+            )
+            os.utime(yaml_path, ns=(0, 0))
+
+            agents = AgentLoader(agents_dir).load_all()
+            assert agents["data_agent"].title == "Renamed Agent"
+
+    def test_foreign_cache_never_unpickled(self):
+        """Test a cache file written for other YAMLs is rejected before unpickling."""
+        import pickle
+
+        class Explodes:
+            def __reduce__(self):
+                return (pytest.fail, ("cache was unpickled",))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / ".croak" / "agents"
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+            assert (loader.cache_path.parent / ".gitignore").read_text() == "*\n"
+
+            # E.g. committed to a cloned project
+            loader.cache_path.write_bytes(b"0" * 128 + b"\n" + pickle.dumps(Explodes()))
+
+            assert AgentLoader(agents_dir).load_all()["data_agent"].title == "Data Agent"
+
+    def test_broken_cache_is_a_miss(self):
+        """Test a truncated or stale cache with the right key falls back to the YAMLs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / ".croak" / "agents"
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+            content = loader.cache_path.read_bytes()
+            header = content[:content.index(b"\n") + 1]
+            assert sorted(p.name for p in loader.cache_path.parent.iterdir()) == [".gitignore", "agents.pkl"]
+
+            # Half-written, and pickled against a class that no longer exists
+            for payload in [content[:len(content) // 2], header + b"cno_such_module\nAgent\n."]:
+                loader.cache_path.write_bytes(payload)
+                assert AgentLoader(agents_dir).load_all()["data_agent"].title == "Data Agent"
+
+    def test_load_index_defers_full_load(self):
+        """Test routing through the index only builds the matched agent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            for name, trigger in [("data", "validate"), ("training", "train")]:
+                self._create_agent_dir(
+                    agents_dir,
+                    agent_id=f"{name}-agent",
+                    agent_name=f"{name}_agent",
+                    title=f"{name.title()} Agent",
+                    role=name,
+                    commands=[
+                        {
+                            "trigger": trigger,
+                            "description": f"{trigger} things",
+                            "capability": f"{trigger}-cap",
+                        }
+                    ],
+                )
+
+            loader = AgentLoader(agents_dir)
+            stubs = loader.load_index()
+
+            assert set(stubs) == {"data_agent", "training_agent"}
+            assert stubs["training_agent"].triggers == ["train"]
+            assert loader._agents == {}
+
+            agent, command = loader.route_command("train a model")
+
+            assert agent.id == "training-agent"
+            assert command.trigger == "train"
+            assert set(loader._agents) == {"training_agent"}
+            assert loader.get_agent("data_agent").title == "Data Agent"
+
+    def test_route_command_alias_and_keyword(self):
+        """Test routing by multi-word alias prefix and by shared keyword."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+                commands=[
+                    {
+                        "trigger": "scan",
+                        "aliases": ["find images"],
+                        "description": "Scan images",
+                        "capability": "discovery",
+                    },
+                    {
+                        "trigger": "split dataset",
+                        "description": "Split dataset",
+                        "capability": "splitting",
+                    },
+                ],
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+
+            _, command = loader.route_command("Find images in ./data")
+            assert command.trigger == "scan"
+
+            _, command = loader.route_command("please split it")
+            assert command.trigger == "split dataset"
+
+            assert loader.route_command("   ") is None
+
+    def test_reload_reuses_parsed_yaml(self):
+        """Test unchanged agent YAML is parsed once per modification time."""
+        from croak.agents.loader import _parse_yaml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            yaml_path = self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+            )
+
+            _parse_yaml.cache_clear()
+            AgentLoader(agents_dir).load_agent(yaml_path)
+            AgentLoader(agents_dir).load_agent(yaml_path)
+            assert _parse_yaml.cache_info().hits == 1
+
+            os.utime(yaml_path, ns=(0, 0))
+            AgentLoader(agents_dir).load_agent(yaml_path)
+            assert _parse_yaml.cache_info().misses == 2
+
+    def test_get_router_context(self):
+        """Test router context lists each agent with its commands."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+                commands=[
+                    {
+                        "trigger": "validate",
+                        "description": "Validate dataset",
+                        "capability": "validate-cap",
+                    }
+                ],
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+
+            assert loader.get_router_context() == (
+                "**data_agent** (Data Agent):\n  - validate: Validate dataset"
+            )
+
+    def test_route_command_keyword_prefers_earliest_trigger(self):
+        """Test keyword routing picks the first registered matching trigger."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+                commands=[
+                    {
+                        "trigger": "check images",
+                        "description": "Check images",
+                        "capability": "validation",
+                    },
+                    {
+                        "trigger": "split dataset",
+                        "description": "Split dataset",
+                        "capability": "splitting",
+                    },
+                ],
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+
+            _, command = loader.route_command("my dataset has images")
+            assert command.trigger == "check images"
+
+    def test_route_command_prefers_longest_trigger(self):
+        """Test direct routing matches the longest whole-word trigger."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agents_dir = Path(tmpdir) / "agents"
+
+            self._create_agent_dir(
+                agents_dir,
+                agent_id="data-agent",
+                agent_name="data_agent",
+                title="Data Agent",
+                role="Data",
+                commands=[
+                    {
+                        "trigger": "scan",
+                        "description": "Scan images",
+                        "capability": "discovery",
+                    },
+                    {
+                        "trigger": "scan report",
+                        "description": "Summarize last scan",
+                        "capability": "statistics",
+                    },
+                ],
+            )
+
+            loader = AgentLoader(agents_dir)
+            loader.load_all()
+
+            _, command = loader.route_command("scan report please")
+            assert command.trigger == "scan report"
+
+            _, command = loader.route_command("scan ./data")
+            assert command.trigger == "scan"
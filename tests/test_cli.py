@@ -0,0 +1,427 @@
+"""Tests for CROAK CLI module."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+class TestCliImports:
+    """Test the CLI module keeps heavy imports out of startup."""
+
+    def test_import_skips_heavy_modules(self):
+        """Test importing croak.cli does not load per-command dependencies."""
+        heavy = [
+            "pydantic", "yaml", "rich.console", "rich.markdown", "rich.table",
+            "rich.progress", "rich.panel", "croak.core.state", "croak.data", "croak.training",
+            "croak.integrations", "croak.evaluation", "croak.deployment", "croak.workflows",
+            "croak.agents",
+        ]
+        code = (
+            "import sys, croak.cli; "
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": str(SRC_DIR)},
+            check=True,
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_root_help_skips_heavy_modules(self):
+        """Test croak --help lists every command without loading their dependencies."""
+        code = (
+            "import sys, croak.cli; "
+            "croak.cli.main(['--help'], standalone_mode=False); "
+            "print('LOADED=' + ','.join(m for m in ['yaml', 'rich', 'croak.core.state', "
+            "'croak.data', 'croak.training', 'croak.evaluation', 'croak.deployment'] "
+            "if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env={"PYTHONPATH": str(SRC_DIR)},
+            check=True,
+        )
+
+        assert "validate" in result.stdout and "deploy" in result.stdout
+        assert result.stdout.rstrip().endswith("LOADED=")
+
+
+class TestHelp:
+    """Test the help command's pre-parsed Markdown."""
+
+    def test_help_markdown_parsed_once(self):
+        """Test help renders and reuses the same parsed Markdown object."""
+        from click.testing import CliRunner
+
+        from croak import cli
+
+        result = CliRunner().invoke(cli.main, ["help"])
+
+        assert result.exit_code == 0, result.output
+        assert "CROAK Commands" in result.output
+        assert cli._help_markdown() is cli._help_markdown()
+
+
+class TestConsole:
+    """Test the shared rich console."""
+
+    def test_terminal_size_detected_once(self, monkeypatch):
+        """Test rendering tables does not query the terminal size again."""
+        import os
+
+        from rich.table import Table
+
+        from croak import cli
+
+        monkeypatch.setattr(cli, "_console", None)
+        monkeypatch.setenv("COLUMNS", "100")
+        console = cli._get_console()
+        assert console.width == 100
+
+        def no_query(*args):
+            raise AssertionError("terminal size queried on render")
+
+        monkeypatch.setattr(os, "get_terminal_size", no_query)
+        table = Table("Class", "Count")
+        table.add_row("person", "3")
+        with console.capture():
+            for _ in range(3):
+                console.print(table)
+
+
+class TestProjectRoot:
+    """Test project root discovery and caching."""
+
+    def test_root_cached_per_cwd(self, tmp_path, monkeypatch):
+        """Test lookups are cached per cwd, including misses, and init resets them."""
+        import os
+
+        from croak import cli
+
+        project = tmp_path / "project"
+        (project / ".croak").mkdir(parents=True)
+        (project / "sub").mkdir()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+
+        monkeypatch.chdir(project / "sub")
+        assert cli.get_croak_root() == project
+        assert os.environ["CROAK_ROOT"] == str(project)
+
+        # Moving out of the project is noticed despite the exported CROAK_ROOT
+        monkeypatch.chdir(outside)
+        assert cli.get_croak_root() is None
+        assert "CROAK_ROOT" not in os.environ
+
+        # Misses are cached until init resets the lookup
+        (outside / ".croak").mkdir()
+        assert cli.get_croak_root() is None
+        cli._reset_croak_root()
+        assert cli.get_croak_root() == outside
+
+    def test_init_creates_layout_and_resets_root(self, tmp_path, monkeypatch):
+        """Test init creates the project tree and the new root is found afterwards."""
+        from click.testing import CliRunner
+
+        from croak import cli
+
+        monkeypatch.chdir(tmp_path)
+        assert cli.get_croak_root() is None
+
+        result = CliRunner().invoke(cli.main, ["init", "--name", "demo"])
+
+        assert result.exit_code == 0, result.output
+        for sub in [".croak/logs", "data/processed/labels/test", "deployment/edge", "exports"]:
+            assert (tmp_path / sub).is_dir()
+        assert cli.get_croak_root() == tmp_path
+
+    def test_user_croak_root_wins(self, tmp_path, monkeypatch):
+        """Test a CROAK_ROOT set by the user skips the search."""
+        from croak import cli
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CROAK_ROOT", str(tmp_path / "elsewhere"))
+
+        assert cli.get_croak_root() == tmp_path / "elsewhere"
+
+
+class TestValidate:
+    """Test the validate command's report."""
+
+    def test_class_distribution_table(self, tmp_path, monkeypatch):
+        """Test class counts render as one table, most frequent class first."""
+        from click.testing import CliRunner
+        from PIL import Image
+
+        from croak import cli
+
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        assert runner.invoke(cli.main, ["init", "--name", "demo"]).exit_code == 0
+
+        data = tmp_path / "dataset"
+        (data / "raw").mkdir(parents=True)
+        (data / "annotations").mkdir()
+        for i, class_id in enumerate([0, 7, 7]):
+            Image.new("RGB", (32, 32)).save(data / "raw" / f"img{i}.jpg")
+            (data / "annotations" / f"img{i}.txt").write_text(f"{class_id} 0.5 0.5 0.1 0.1\n")
+
+        result = runner.invoke(cli.main, ["validate", "--path", "dataset", "--workers", "1"])
+
+        assert result.exit_code == 0, result.output
+        assert "┃ Class ┃ Count ┃" in result.output
+        assert result.output.index("│ 7 ") < result.output.index("│ 0 ")
+
+
+class TestPrepare:
+    """Test the full data preparation workflow."""
+
+    def test_prepare_runs_under_one_live_display(self, tmp_path, monkeypatch):
+        """Test validate and split share one progress display and record data.yaml."""
+        from click.testing import CliRunner
+        from PIL import Image
+        from rich.progress import Progress
+
+        from croak import cli
+        from croak.core.state import load_state
+
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        assert runner.invoke(cli.main, ["init", "--name", "demo"]).exit_code == 0
+
+        data = tmp_path / "data" / "processed"
+        (data / "raw").mkdir()
+        (data / "annotations").mkdir()
+        for i in range(12):
+            Image.new("RGB", (32, 32)).save(data / "raw" / f"img{i}.jpg")
+            (data / "annotations" / f"img{i}.txt").write_text(f"{i % 2} 0.5 0.5 0.1 0.1\n")
+
+        starts = []
+        real_start = Progress.start
+        monkeypatch.setattr(Progress, "start", lambda self: starts.append(self) or real_start(self))
+
+        result = runner.invoke(cli.main, ["prepare"])
+
+        assert result.exit_code == 0, result.output
+        assert "Data preparation complete" in result.output
+        assert len(starts) == 1
+        assert [t.description for t in starts[0].tasks] == [
+            "Step 1: Validating dataset...", "Step 2: Creating data splits...",
+        ]
+        assert all(t.completed for t in starts[0].tasks)
+        assert load_state(tmp_path).data_yaml_path.endswith("data.yaml")
+
+
+class TestNext:
+    """Test the next command's suggestions."""
+
+    @pytest.mark.parametrize("has_images, expected", [
+        (False, "Scan your data"),
+        (True, "Prepare your data"),
+    ])
+    def test_data_preparation_stage(self, tmp_path, monkeypatch, has_images, expected):
+        """Test next checks data/raw for entries during data preparation."""
+        from click.testing import CliRunner
+
+        from croak import cli
+        from croak.core.state import pipeline_state
+
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        assert runner.invoke(cli.main, ["init", "--name", "demo"]).exit_code == 0
+        with pipeline_state(tmp_path) as state:
+            state.current_stage = "data_preparation"
+        (tmp_path / "data" / "raw").mkdir(parents=True, exist_ok=True)
+        if has_images:
+            (tmp_path / "data" / "raw" / "img0.jpg").write_bytes(b"")
+
+        result = runner.invoke(cli.main, ["next"])
+
+        assert result.exit_code == 0, result.output
+        assert expected in result.output
+
+
+class TestDoctorProbe:
+    """Test doctor's external tool probes."""
+
+    def test_missing_executable_skips_subprocess(self, monkeypatch):
+        """Test a probe for a binary not on PATH returns None without spawning."""
+        from croak import cli
+
+        def fail_run(*args, **kwargs):
+            raise AssertionError("subprocess.run should not be called")
+
+        monkeypatch.setattr(subprocess, "run", fail_run)
+
+        assert cli._doctor_probe(["croak-no-such-tool", "--version"]) is None
+
+
+class TestFileDiscovery:
+    """Test the scandir-based file helpers used by annotate."""
+
+    def test_has_images(self, tmp_path):
+        """Test images are found recursively by case-insensitive extension."""
+        from croak import cli
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a" / "b").mkdir()
+        for name in ["one.jpg", "a/two.PNG", "a/b/three.tiff", "notes.txt", "a/.png", "a/b/png"]:
+            (tmp_path / name).write_bytes(b"")
+
+        assert cli._has_images(tmp_path)
+        assert not cli._has_images(tmp_path / "missing")
+
+        for name in ["one.jpg", "a/two.PNG", "a/b/three.tiff"]:
+            (tmp_path / name).unlink()
+        assert not cli._has_images(tmp_path)
+
+    def test_fast_copy_preserves_content_and_mtime(self, tmp_path):
+        """Test _fast_copy copies bytes and metadata like shutil.copy2."""
+        import os
+
+        from croak import cli
+
+        src = tmp_path / "label.txt"
+        src.write_text("0 0.5 0.5 0.1 0.1\n")
+        os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+        dst = tmp_path / "copy.txt"
+
+        cli._fast_copy(src, dst)
+
+        assert dst.read_text() == "0 0.5 0.5 0.1 0.1\n"
+        assert dst.stat().st_mtime_ns == 1_000_000_000
+        assert not os.path.samefile(src, dst)
+
+    def test_fast_copy_refuses_same_file(self, tmp_path):
+        """Test copying a file onto itself raises instead of truncating it."""
+        import shutil
+
+        from croak import cli
+
+        src = tmp_path / "label.txt"
+        src.write_text("0 0.5 0.5 0.1 0.1\n")
+
+        with pytest.raises(shutil.SameFileError):
+            cli._fast_copy(src, tmp_path / "." / "label.txt")
+        assert src.read_text() == "0 0.5 0.5 0.1 0.1\n"
+
+    def test_fast_copy_falls_back_without_sendfile(self, tmp_path, monkeypatch):
+        """Test a sendfile failure mid-copy falls back to a clean read/write copy."""
+        import os
+
+        from croak import cli
+
+        data = os.urandom(300_000)
+        src = tmp_path / "big.txt"
+        src.write_bytes(data)
+        dst = tmp_path / "copy.txt"
+        dst.write_bytes(b"x" * 400_000)
+
+        real_sendfile = os.sendfile
+        calls = []
+
+        def flaky_sendfile(out_fd, in_fd, offset, count):
+            calls.append(offset)
+            if len(calls) > 1:
+                raise OSError("sendfile unavailable")
+            return real_sendfile(out_fd, in_fd, offset, min(count, 1000))
+
+        monkeypatch.setattr(os, "sendfile", flaky_sendfile)
+        monkeypatch.setattr(cli, "_FICLONE", -1)
+
+        cli._fast_copy(src, dst)
+
+        assert dst.read_bytes() == data
+
+    def test_collect_by_ext(self, tmp_path):
+        """Test annotation files are collected recursively as string paths."""
+        from croak import cli
+
+        (tmp_path / "sub").mkdir()
+        for name in ["a.txt", "sub/b.txt", "sub/c.json"]:
+            (tmp_path / name).write_text("")
+
+        found = cli._collect_by_ext(tmp_path, ".txt")
+
+        assert sorted(found) == [str(tmp_path / "a.txt"), str(tmp_path / "sub" / "b.txt")]
+
+    def test_classic_import_same_named_files_last_wins(self, tmp_path, monkeypatch):
+        """Test same-named annotations from different folders are copied once, last path wins."""
+        from click.testing import CliRunner
+
+        from croak import cli
+
+        monkeypatch.chdir(tmp_path)
+        runner = CliRunner()
+        assert runner.invoke(cli.main, ["init", "--name", "demo"]).exit_code == 0
+        (tmp_path / "data" / "raw").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "data" / "raw" / "img.jpg").write_bytes(b"")
+        for folder in ["b", "a", "c"]:
+            (tmp_path / "labels" / folder).mkdir(parents=True)
+            (tmp_path / "labels" / folder / "img.txt").write_text(f"{folder}\n")
+        (tmp_path / "labels" / "a" / "other.txt").write_text("other\n")
+
+        result = runner.invoke(cli.main, [
+            "annotate", "--method", "classic", "--format", "yolo",
+            "--annotations-path", str(tmp_path / "labels"),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "2 annotation files share a name" in result.output
+        annotations = tmp_path / "data" / "annotations"
+        assert sorted(p.name for p in annotations.iterdir()) == ["img.txt", "other.txt"]
+        assert (annotations / "img.txt").read_text() == "c\n"
+
+    def test_find_latest_file(self, tmp_path):
+        """Test the newest checkpoint by mtime is found across experiment dirs."""
+        import os
+
+        from croak import cli
+
+        for i, exp in enumerate(["exp1", "exp2", "exp3"]):
+            weights = tmp_path / exp / "weights"
+            weights.mkdir(parents=True)
+            ckpt = weights / "last.pt"
+            ckpt.write_bytes(b"")
+            os.utime(ckpt, (0, [100, 300, 200][i]))
+
+        assert cli._find_latest_file(tmp_path, "last.pt") == str(tmp_path / "exp2" / "weights" / "last.pt")
+        assert cli._find_latest_file(tmp_path / "missing", "last.pt") is None
+
+
+class TestAnnotateVfrog:
+    """Test the vfrog SSAT annotate workflow's CLI calls."""
+
+    def test_object_id_skips_object_listing(self, tmp_path):
+        """Test an explicit object ID is used without listing objects."""
+        from unittest.mock import patch
+
+        from croak import cli
+        from croak.integrations.vfrog import VfrogCLI
+
+        with patch.multiple(
+            VfrogCLI,
+            check_installed=lambda: True,
+            get_config_cached=lambda: {
+                "success": True,
+                "output": {"authenticated": True, "project_id": "proj-1"},
+            },
+            count_dataset_images=lambda: 3,
+            list_objects=lambda: pytest.fail("list_objects should not be called"),
+            create_iteration=lambda object_id, random_count: {
+                "success": False, "output": None, "error": f"stop at {object_id}",
+            },
+        ), patch.object(cli.console, "print") as mock_print:
+            cli._annotate_vfrog(tmp_path, None, "obj-1", 20, False, False)
+
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        assert "stop at obj-1" in printed
@@ -37,6 +37,48 @@ class TestCroakConfig:
             assert loaded.project_name == "test-project"
             assert loaded.task_type == "detection"
 
+    def test_save_skips_unchanged_content(self):
+        """Test re-saving identical config leaves the file untouched."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config = CroakConfig(project_name="test-project")
+            config.save(config_path)
+            os.utime(config_path, ns=(1_000_000_000, 1_000_000_000))
+            # Refresh the sidecar for the new mtime
+            CroakConfig.load(config_path)
+
+            config.save(config_path)
+            assert config_path.stat().st_mtime_ns == 1_000_000_000
+
+            config.project_name = "renamed"
+            config.save(config_path)
+            assert config_path.stat().st_mtime_ns != 1_000_000_000
+            assert CroakConfig.load(config_path).project_name == "renamed"
+
+    def test_round_trip_under_ascii_locale(self, tmp_path):
+        """Test a non-ASCII project name survives save and load in an ASCII locale."""
+        import os
+        import subprocess
+        import sys
+
+        src_dir = Path(__file__).resolve().parent.parent / "src"
+        code = (
+            "import shutil, sys; from pathlib import Path; "
+            "from croak.core.config import CroakConfig; "
+            "p = Path(sys.argv[1]); CroakConfig(project_name='d\\u00e9tection').save(p); "
+            "shutil.rmtree(p.parent / 'cache'); "
+            "assert CroakConfig.load(p).project_name == 'd\\u00e9tection'"
+        )
+        subprocess.run(
+            [sys.executable, "-X", "utf8=0", "-c", code, str(tmp_path / "config.yaml")],
+            env={**os.environ, "PYTHONPATH": str(src_dir), "LC_ALL": "C", "PYTHONCOERCECLOCALE": "0"},
+            check=True,
+        )
+
+        assert "détection" in (tmp_path / "config.yaml").read_bytes().decode("utf-8")
+
     def test_nested_config(self):
         """Test nested configuration objects."""
         config = CroakConfig(
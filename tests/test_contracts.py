@@ -1,5 +1,6 @@
 """Tests for CROAK handoff contract validation."""
 
+import json
 import pytest
 from pathlib import Path
 import tempfile
@@ -87,6 +88,216 @@ class TestHandoffValidator:
             assert result["valid"] is False
             assert len(result["errors"]) > 0
 
+    def test_validator_compiled_once_and_reports_all_errors(self, monkeypatch):
+        """Test the schema is checked once per contract and every error is collected."""
+        import jsonschema
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+
+            schema = {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "required": ["name", "value"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "value": {"type": "integer"},
+                },
+            }
+
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump(schema, f)
+
+            checks = []
+            monkeypatch.setattr(
+                jsonschema.Draft7Validator, "check_schema",
+                classmethod(lambda cls, s: checks.append(s)),
+            )
+
+            validator = HandoffValidator(contracts_dir)
+            assert validator.validate("test", {"name": "a", "value": 1})["valid"]
+            result = validator.validate("test", {"name": 1, "value": "x"})
+
+            assert len(checks) == 1
+            assert sorted(e["path"] for e in result["errors"]) == [["name"], ["value"]]
+
+    def test_invalid_schema_reported(self):
+        """Test a malformed contract schema is reported as a validation error."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump({"type": "not-a-type"}, f)
+
+            result = HandoffValidator(contracts_dir).validate("test", {})
+
+            assert result["valid"] is False
+            assert result["errors"][0]["message"].startswith("Schema error:")
+
+    def test_contracts_loaded_up_front_with_cross_refs(self):
+        """Test contracts are loaded on construction and $refs resolve between them."""
+        import shutil
+
+        tmpdir = tempfile.mkdtemp()
+        contracts_dir = Path(tmpdir)
+
+        common = {"definitions": {"score": {"type": "number", "minimum": 0, "maximum": 1}}}
+        with open(contracts_dir / "common.schema.json", "w") as f:
+            json.dump(common, f)
+        schema = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {"mAP50": {"$ref": "common.schema.json#/definitions/score"}},
+        }
+        with open(contracts_dir / "eval.schema.yaml", "w") as f:
+            yaml.dump(schema, f)
+
+        validator = HandoffValidator(contracts_dir)
+        assert set(validator._validators) == {"common", "eval"}
+
+        # Everything needed is in memory already
+        shutil.rmtree(tmpdir)
+        assert validator.validate("eval", {"mAP50": 0.5})["valid"] is True
+        result = validator.validate("eval", {"mAP50": 1.5})
+        assert result["valid"] is False
+        assert result["errors"][0]["path"] == ["mAP50"]
+
+    def test_unparsable_contract_only_fails_itself(self):
+        """Test a broken schema file is reported for its contract and no other."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+            good_path = contracts_dir / "good.schema.yaml"
+            with open(good_path, "w") as f:
+                yaml.dump({"type": "object", "required": ["name"]}, f)
+            (contracts_dir / "broken.schema.yaml").write_text("type: [object\n")
+
+            validator = HandoffValidator(contracts_dir)
+
+            assert validator.validate("good", {"name": "a"})["valid"] is True
+            result = validator.validate("broken", {})
+            assert result["valid"] is False
+            assert result["errors"][0]["message"].startswith("Schema error:")
+
+            # A typo saved over a loaded contract fails that contract only
+            good_path.write_text("required: [name\n")
+            os.utime(good_path, ns=(0, 0))
+            assert validator.validate("good", {})["errors"][0]["message"].startswith("Schema error:")
+
+    def test_edited_contract_reloaded(self):
+        """Test a contract is re-read only after its file changes on disk."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+            schema_path = contracts_dir / "test.schema.yaml"
+            # Lower precedence than test.schema.yaml, never picked
+            (contracts_dir / "test.json").write_text('{"type": "string"}')
+
+            with open(schema_path, "w") as f:
+                yaml.dump({"type": "object", "required": ["name"]}, f)
+
+            validator = HandoffValidator(contracts_dir)
+            assert validator.validate("test", {})["valid"] is False
+            assert validator.load_schema("test") is validator.load_schema("test")
+
+            with open(schema_path, "w") as f:
+                yaml.dump({"type": "object", "required": []}, f)
+            os.utime(schema_path, ns=(0, 0))
+
+            assert validator.validate("test", {})["valid"] is True
+
+    def test_edited_referenced_contract_reloaded(self):
+        """Test editing a $ref'd contract updates the validators that reference it."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+            base_path = contracts_dir / "base.schema.yaml"
+            with open(base_path, "w") as f:
+                yaml.dump({"definitions": {"pos": {"type": "integer", "minimum": 0}}}, f)
+            with open(contracts_dir / "use.schema.yaml", "w") as f:
+                yaml.dump({
+                    "type": "object",
+                    "properties": {"n": {"$ref": "base.schema.yaml#/definitions/pos"}},
+                }, f)
+
+            validator = HandoffValidator(contracts_dir)
+            assert validator.validate("use", {"n": 1})["valid"] is True
+
+            with open(base_path, "w") as f:
+                yaml.dump({"definitions": {"pos": {"type": "integer", "minimum": 5}}}, f)
+            os.utime(base_path, ns=(0, 0))
+
+            assert validator.validate("use", {"n": 1})["valid"] is False
+
+    def test_fastjsonschema_backend(self):
+        """Test the compiled fastjsonschema backend validates like jsonschema."""
+        pytest.importorskip("fastjsonschema")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+
+            schema = {
+                "$schema": "http://json-schema.org/draft-07/schema#",
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "name": {"type": "string"},
+                },
+            }
+
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump(schema, f)
+
+            validator = HandoffValidator(contracts_dir, backend="fastjsonschema")
+            assert validator.validate("test", {"name": "a"})["valid"] is True
+            result = validator.validate("test", {"name": 1})
+
+            assert result["valid"] is False
+            assert result["errors"][0]["path"] == ["name"]
+            assert len(validator._fast_validators) == 1
+
+    def test_fastjsonschema_resolves_refs_from_memory(self):
+        """Test the fastjsonschema backend resolves $refs between contracts without I/O."""
+        import shutil
+
+        pytest.importorskip("fastjsonschema")
+
+        tmpdir = tempfile.mkdtemp()
+        contracts_dir = Path(tmpdir)
+        with open(contracts_dir / "common.schema.json", "w") as f:
+            json.dump({"definitions": {"score": {"type": "number", "maximum": 1}}}, f)
+        with open(contracts_dir / "shared.schema.json", "w") as f:
+            json.dump({"$id": "https://croak.example/shared.json", "type": "string"}, f)
+        with open(contracts_dir / "eval.schema.yaml", "w") as f:
+            yaml.dump({
+                "type": "object",
+                "properties": {
+                    "mAP50": {"$ref": "common.schema.json#/definitions/score"},
+                    "model": {"$ref": "https://croak.example/shared.json"},
+                },
+            }, f)
+        with open(contracts_dir / "dangling.schema.yaml", "w") as f:
+            yaml.dump({"properties": {"x": {"$ref": "missing.schema.json"}}}, f)
+
+        validator = HandoffValidator(contracts_dir, backend="fastjsonschema")
+
+        shutil.rmtree(tmpdir)
+        assert validator.validate("eval", {"mAP50": 0.5, "model": "a"})["valid"] is True
+        result = validator.validate("eval", {"mAP50": 1.5})
+        assert result["valid"] is False and result["errors"][0]["path"] == ["mAP50"]
+        assert validator.validate("eval", {"model": 3})["valid"] is False
+
+        result = validator.validate("dangling", {"x": 1})
+        assert result["errors"][0]["message"].startswith("Schema error:")
+
+    def test_unknown_backend_rejected(self):
+        """Test an unknown validation backend fails at construction."""
+        with pytest.raises(ValueError):
+            HandoffValidator(Path("."), backend="nope")
+
     def test_create_handoff(self):
         """Test creating handoff file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -185,6 +396,87 @@ class TestHandoffValidator:
             assert handoff["data"]["value"] == 123
             assert handoff["validation"]["valid"] is True
 
+    def test_handoff_file_is_json(self):
+        """Test handoffs are written as JSON, readable as YAML, in field order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir) / "contracts"
+            contracts_dir.mkdir()
+
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump({"type": "object"}, f)
+
+            validator = HandoffValidator(contracts_dir)
+            handoff_path = validator.create_handoff(
+                "test", "source", "dest", {"b": [1, 2], "a": {"x": "é"}},
+                Path(tmpdir) / "handoffs",
+            )
+
+            text = handoff_path.read_text(encoding="utf-8")
+            assert json.loads(text) == yaml.safe_load(text)
+            assert list(json.loads(text)) == ["contract", "from_agent", "to_agent", "created_at", "data"]
+            assert list(json.loads(text)["data"]) == ["b", "a"]
+
+    def test_json_fallback_matches_orjson_for_numpy(self, monkeypatch):
+        """Test the json fallback writes numpy values and int keys as orjson does."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("orjson")
+        from croak.contracts import validator as validator_module
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir) / "contracts"
+            contracts_dir.mkdir()
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump({"type": "object"}, f)
+
+            validator = HandoffValidator(contracts_dir)
+            data = {"boxes": np.array([[1.5, 2.0]]), "count": np.int64(3), "names": {0: "a"}}
+            written = []
+            for has_orjson in (True, False):
+                monkeypatch.setattr(validator_module, "HAS_ORJSON", has_orjson)
+                path = validator.create_handoff(
+                    "test", "source", "dest", data, Path(tmpdir) / str(has_orjson),
+                )
+                written.append(json.loads(path.read_text(encoding="utf-8"))["data"])
+
+            assert written[0] == written[1] == {"boxes": [[1.5, 2.0]], "count": 3, "names": {"0": "a"}}
+
+    def test_handoff_timestamps_agree(self):
+        """Test the file name and created_at come from one UTC timestamp."""
+        from datetime import datetime
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump({"type": "object"}, f)
+
+            validator = HandoffValidator(contracts_dir)
+            handoff_path = validator.create_handoff("test", "a", "b", {}, Path(tmpdir) / "h")
+
+            created_at = datetime.fromisoformat(json.loads(handoff_path.read_text())["created_at"])
+            assert created_at.utcoffset().total_seconds() == 0
+            assert handoff_path.name == f"a-to-b-{created_at:%Y%m%d-%H%M%S}.yaml"
+            assert validator.validate("test", {}, validated_at="T")["validated_at"] == "T"
+
+    def test_reads_legacy_yaml_handoff(self):
+        """Test handoffs written as YAML by older versions still load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir)
+
+            with open(contracts_dir / "test.schema.yaml", "w") as f:
+                yaml.dump({"type": "object", "required": ["value"]}, f)
+
+            handoff_path = contracts_dir / "data-to-training-20240101-000000.yaml"
+            handoff_path.write_text(
+                "contract: test\nfrom_agent: data\nto_agent: training\n"
+                "created_at: '2024-01-01T00:00:00'\ndata:\n  value: 1\n"
+            )
+
+            handoff = HandoffValidator(contracts_dir).read_handoff(handoff_path)
+
+            assert handoff["data"] == {"value": 1}
+            assert handoff["validation"]["valid"] is True
+
     def test_find_latest_handoff(self):
         """Test finding latest handoff file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -222,6 +514,33 @@ class TestHandoffValidator:
             assert latest is not None
             assert "data-to-training" in latest.name
 
+    def test_find_latest_handoff_by_mtime_and_agents(self):
+        """Test the newest matching handoff wins, whatever its name."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            handoffs_dir = Path(tmpdir)
+            files = {
+                "data-to-training-20240103-000000.yaml": 100,
+                "data-to-training-20240101-000000.yaml": 300,
+                "training-to-evaluation-20240102-000000.yaml": 400,
+                "data-to-training-20240104-000000.json": 500,
+            }
+            for name, mtime in files.items():
+                (handoffs_dir / name).write_text("{}")
+                os.utime(handoffs_dir / name, (mtime, mtime))
+
+            validator = HandoffValidator(handoffs_dir / "contracts")
+
+            assert validator.find_latest_handoff(handoffs_dir, from_agent="data").name == (
+                "data-to-training-20240101-000000.yaml"
+            )
+            assert validator.find_latest_handoff(handoffs_dir).name == (
+                "training-to-evaluation-20240102-000000.yaml"
+            )
+            assert validator.find_latest_handoff(handoffs_dir, to_agent="deployment") is None
+            assert validator.find_latest_handoff(handoffs_dir / "missing") is None
+
 
 class TestConvenienceFunctions:
     """Test convenience functions for common handoffs."""
@@ -320,3 +639,41 @@ class TestConvenienceFunctions:
             )
 
             assert handoff_path.exists()
+
+    def test_data_handoff_validated_once_against_full_schema(self, monkeypatch):
+        """Test the helper validates once, with the full compiled schema."""
+        import shutil
+
+        repo_root = Path(__file__).resolve().parent.parent
+        with tempfile.TemporaryDirectory() as tmpdir:
+            contracts_dir = Path(tmpdir) / "contracts"
+            contracts_dir.mkdir()
+            shutil.copy(
+                repo_root / "installer" / "templates" / "contracts" / "data-handoff.schema.yaml",
+                contracts_dir,
+            )
+            handoffs_dir = Path(tmpdir) / "handoffs"
+
+            validator = HandoffValidator(contracts_dir)
+            calls = []
+            validate = validator.validate
+            monkeypatch.setattr(
+                validator, "validate", lambda *a, **kw: calls.append(a[0]) or validate(*a, **kw),
+            )
+
+            kwargs = dict(
+                validator=validator,
+                dataset_path="/path/to/dataset",
+                data_yaml_path="/path/to/data.yaml",
+                splits={"train": 800, "val": 150, "test": 50},
+                classes=["cat", "dog"],
+                statistics={"total_images": 1000},
+                validation_passed=True,
+                handoffs_dir=handoffs_dir,
+            )
+            assert create_data_handoff(format="yolo", **kwargs).exists()
+            assert calls == ["data-handoff"]
+
+            # Constraints beyond required fields and types still apply
+            with pytest.raises(ContractValidationError):
+                create_data_handoff(format="csv", **kwargs)
@@ -91,6 +91,49 @@ class TestDataValidator:
                    or "format" in str(e).lower() or "error" in str(e).lower()
                    for e in all_messages)
 
+    def test_parallel_image_checks_match_serial(self, monkeypatch):
+        """Test sharding image checks across processes gives the serial result."""
+        import concurrent.futures
+
+        import croak.data.scanner as scanner
+
+        self._create_dataset_structure(num_images=6, num_labels=6)
+        (self.dataset_dir / "raw" / "broken.jpg").write_bytes(b"not an image")
+        monkeypatch.setattr(scanner, "PARALLEL_MIN_IMAGES", 2)
+        start_methods = []
+
+        class RecordingPool(concurrent.futures.ProcessPoolExecutor):
+            def __init__(self, max_workers, mp_context):
+                start_methods.append(mp_context.get_start_method())
+                super().__init__(max_workers=max_workers, mp_context=mp_context)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", RecordingPool)
+
+        serial = DataValidator(self.dataset_dir, workers=1).validate_all()
+        parallel = DataValidator(self.dataset_dir, workers=2).validate_all()
+
+        assert parallel.statistics["images"] == serial.statistics["images"]
+        assert parallel.statistics["images"]["total_images"] == 6
+        assert len(parallel.statistics["images"]["corrupt"]) == 1
+        assert parallel.warnings == serial.warnings
+        assert start_methods == ["spawn"]  # Never forks a threaded process
+
+    def test_class_distribution_counts(self):
+        """Test class counts skip malformed lines and list the most frequent first."""
+        self._create_dataset_structure(num_images=3, num_labels=3)
+        labels_dir = self.dataset_dir / "annotations"
+        (labels_dir / "img_0000.txt").write_text("1 0.5 0.5 0.1 0.1\n\nx 0.5 0.5 0.1 0.1\n")
+        (labels_dir / "img_0001.txt").write_text("2 0.5 0.5 0.1 0.1\n2 0.4 0.4 0.1 0.1\n")
+        (labels_dir / "img_0002.txt").write_text("  2 0.5 0.5 0.1 0.1\n0 0.5 0.5 0.1 0.1\n")
+
+        result = DataValidator(self.dataset_dir).validate_all()
+
+        distribution = result.statistics["class_distribution"]
+        assert type(distribution) is dict
+        assert distribution == {2: 3, 1: 1, 0: 1}
+        assert next(iter(distribution)) == 2
+        assert result.statistics["num_classes"] == 3
+
     def test_validation_result_structure(self):
         """Test ValidationResult structure."""
         result = ValidationResult(
@@ -197,6 +240,58 @@ class TestDatasetSplitter:
         total = result["train"] + result["val"] + result["test"]
         assert total == 100
 
+    def test_split_stratified_keeps_class_proportions(self):
+        """Test each class is carved by ratio and global random state is untouched."""
+        import random
+
+        self._create_dataset(60)
+        random.seed(7)
+        expected_next = random.random()
+        random.seed(7)
+
+        result = DatasetSplitter(self.dataset_dir).split(
+            train_ratio=0.5, val_ratio=0.25, test_ratio=0.25, stratify=True
+        )
+
+        assert random.random() == expected_next
+        assert (result["train"], result["val"], result["test"]) == (30, 15, 15)
+        labels_dir = Path(result["output_dir"]) / "labels" / "train"
+        first_classes = sorted(p.read_text()[0] for p in labels_dir.iterdir())
+        assert first_classes == sorted("012" * 10)
+
+    def test_failed_data_yaml_write_keeps_previous_file(self):
+        """Test a data.yaml that fails to serialize leaves the old one in place."""
+        import yaml
+
+        self._create_dataset(20)
+        splitter = DatasetSplitter(self.dataset_dir)
+        data_yaml = Path(splitter.split(class_names=["frog"])["data_yaml"])
+        before = data_yaml.read_text()
+
+        with pytest.raises(yaml.YAMLError):
+            splitter.split(class_names=[object()])
+
+        assert data_yaml.read_text() == before
+        assert yaml.safe_load(before)["names"] == {0: "frog"}
+        assert [p.name for p in data_yaml.parent.glob(".*.tmp")] == []
+
+    def test_same_stem_images_copy_label_once(self, monkeypatch):
+        """Test images sharing a stem do not copy onto one label destination twice."""
+        self._create_dataset(5)
+        Image.new("RGB", (64, 64)).save(self.dataset_dir / "raw" / "img_0000.png")
+        copied = []
+        real_copy2 = shutil.copy2
+
+        def tracking_copy2(src, dst):
+            copied.append(dst)
+            return real_copy2(src, dst)
+
+        monkeypatch.setattr(shutil, "copy2", tracking_copy2)
+        DatasetSplitter(self.dataset_dir).split(train_ratio=1.0, val_ratio=0.0, test_ratio=0.0, stratify=False)
+
+        assert len(copied) == len(set(copied)) == 11
+        assert (self.dataset_dir / "processed" / "labels" / "train" / "img_0000.txt").exists()
+
     def test_split_invalid_ratios(self):
         """Test that invalid ratios are rejected."""
         self._create_dataset(100)
@@ -208,3 +303,129 @@ class TestDatasetSplitter:
                 val_ratio=0.5,
                 test_ratio=0.5,  # Sum > 1
             )
+
+    def test_split_with_shared_index(self):
+        """Test validator and splitter can share one pre-built index."""
+        from croak.data.index import DatasetIndex
+
+        self._create_dataset(20)
+        index = DatasetIndex.from_dir(self.dataset_dir)
+
+        assert len(index.images) == 20
+        assert index.images == sorted(index.images)
+        assert set(index.labels) == {f"img_{i:04d}" for i in range(20)}
+
+        result = DataValidator(self.dataset_dir, index=index).validate_all()
+        assert result.statistics["images"]["total_images"] == 20
+        assert result.statistics["annotation_coverage"] == 1.0
+
+        split = DatasetSplitter(self.dataset_dir, index=index).split(stratify=False)
+        assert split["total"] == 20
+
+    def test_shared_index_reads_labels_once(self, monkeypatch):
+        """Test class counts and stratification share one parse of the labels."""
+        import builtins
+
+        from croak.data.index import DatasetIndex
+
+        self._create_dataset(30)
+        index = DatasetIndex.from_dir(self.dataset_dir)
+        DataValidator(self.dataset_dir, index=index).validate_all()
+
+        real_open = builtins.open
+        reopened = []
+
+        def tracking_open(file, mode="r", *args, **kwargs):
+            # Copies open labels in binary mode; only text-mode parses count
+            if str(file).endswith(".txt") and "b" not in mode:
+                reopened.append(file)
+            return real_open(file, mode, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", tracking_open)
+        split = DatasetSplitter(self.dataset_dir, index=index).split(stratify=True)
+
+        assert split["total"] == 30
+        assert reopened == []
+        assert index.label_class_ids()["img_0004"] == [1]
+
+
+    def test_unstratified_split_parses_only_sampled_labels(self, monkeypatch):
+        """Test class names are inferred from the sampled labels without reading the rest."""
+        import builtins
+
+        self._create_dataset(150)
+        real_open = builtins.open
+        parsed = []
+
+        def tracking_open(file, mode="r", *args, **kwargs):
+            if str(file).endswith(".txt") and "b" not in mode:
+                parsed.append(file)
+            return real_open(file, mode, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", tracking_open)
+        split = DatasetSplitter(self.dataset_dir).split(stratify=False)
+
+        assert split["classes"] == ["class_0", "class_1", "class_2"]
+        assert len(parsed) == 100
+
+
+class TestScanner:
+    """Test directory scanning."""
+
+    def test_scan_nested_directory(self, tmp_path):
+        """Test images in nested folders are found and YOLO labels detected."""
+        from croak.data.scanner import scan_directory
+
+        for i, sub in enumerate(["", "a", "a/b", "c"]):
+            folder = tmp_path / sub
+            folder.mkdir(parents=True, exist_ok=True)
+            Image.new("RGB", (32, 16)).save(folder / f"img{i}.png")
+            (folder / f"img{i}.txt").write_text("0 0.5 0.5 0.1 0.1\n")
+        (tmp_path / "a" / "fake.jpg").mkdir()
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+        result = scan_directory(tmp_path)
+
+        assert result["total_images"] == 4
+        assert result["images"] == sorted(result["images"])
+        assert result["formats"] == {".png": 4}
+        assert result["has_annotations"] and result["annotation_format"] == "yolo"
+
+    def test_detect_coco_annotations(self, tmp_path):
+        """Test a nested COCO annotation file is detected."""
+        from croak.data.scanner import scan_directory
+
+        Image.new("RGB", (32, 32)).save(tmp_path / "img.jpg")
+        (tmp_path / "labels").mkdir()
+        (tmp_path / "labels" / "instances_train.json").write_text("{}")
+
+        result = scan_directory(tmp_path)
+
+        assert result["annotation_format"] == "coco"
+
+    def test_walk_files_skips_symlinked_dirs(self, tmp_path):
+        """Test the walk lists symlinked files but does not descend symlinked dirs."""
+        from croak.data.scanner import walk_files
+
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "a.txt").write_text("")
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+        (tmp_path / "link.txt").symlink_to(tmp_path / "real" / "a.txt")
+
+        names = sorted(entry.name for entry in walk_files(tmp_path))
+
+        assert names == ["a.txt", "link.txt", "loop"]
+        assert list(walk_files(tmp_path / "real" / "a.txt")) == []
+
+    def test_threaded_walk_matches_serial(self, tmp_path):
+        """Test walking on a thread pool finds the same files as the serial walk."""
+        from croak.data.scanner import walk_files
+
+        for name in ["a.txt", "x/b.txt", "x/y/c.txt", "z/d.txt"]:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text("")
+
+        serial = sorted(entry.path for entry in walk_files(tmp_path))
+        threaded = sorted(entry.path for entry in walk_files(tmp_path, workers=4))
+
+        assert len(serial) == 4 and threaded == serial
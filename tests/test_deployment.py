@@ -0,0 +1,116 @@
+"""Tests for CROAK model deployment."""
+
+from pathlib import Path
+
+import pytest
+
+from croak.core.state import PipelineState
+from croak.deployment import deployer as deployer_module
+from croak.deployment.deployer import ModelDeployer
+
+
+class FakeYOLO:
+    """Stand-in for ultralytics.YOLO that records export arguments."""
+
+    exports = []
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def export(self, **kwargs):
+        FakeYOLO.exports.append(kwargs)
+        exported = self.path.with_suffix(f".{kwargs['format']}")
+        exported.write_bytes(b"exported")
+        return str(exported)
+
+
+class TestExportPrecision:
+    """Test per-format precision defaults and INT8 export."""
+
+    @pytest.fixture
+    def deployer(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(deployer_module, "HAS_ULTRALYTICS", True)
+        monkeypatch.setattr(deployer_module, "YOLO", FakeYOLO, raising=False)
+        FakeYOLO.exports = []
+
+        (tmp_path / ".croak").mkdir()
+        (tmp_path / "best.pt").write_bytes(b"weights")
+        (tmp_path / "data.yaml").write_text("names: {0: a}\n")
+        state = PipelineState(data_yaml_path=str(tmp_path / "data.yaml"))
+        return ModelDeployer(tmp_path, state=state)
+
+    def test_half_defaults_per_format(self, deployer):
+        """Test FP16 is the default only where the runtime executes it natively."""
+        assert deployer.export_model("best.pt", "engine")["half"] is True
+        assert deployer.export_model("best.pt", "onnx")["half"] is False
+        assert deployer.export_model("best.pt", "engine", half=False)["half"] is False
+        assert [e["half"] for e in FakeYOLO.exports] == [True, False, False]
+
+    def test_int8_uses_project_data_for_calibration(self, deployer, tmp_path):
+        """Test INT8 export passes calibration data and turns off FP16."""
+        result = deployer.export_model("best.pt", "openvino", int8=True)
+
+        assert result["success"] and result["int8"] and not result["half"]
+        assert FakeYOLO.exports[-1]["int8"] is True
+        assert FakeYOLO.exports[-1]["data"] == str(tmp_path / "data.yaml")
+
+    def test_int8_rejected_for_unsupported_format(self, deployer):
+        """Test INT8 on a format without quantization support fails before exporting."""
+        result = deployer.export_model("best.pt", "onnx", int8=True)
+
+        assert not result["success"]
+        assert "INT8" in result["error"]
+        assert FakeYOLO.exports == []
+
+
+class TestDeploymentPackage:
+    """Test multi-format deployment packages."""
+
+    def test_formats_exported_from_separate_copies(self, tmp_path, monkeypatch):
+        """Test each format exports from its own weights copy, in parallel workers."""
+        import concurrent.futures
+        import json
+        import os
+        import pickle
+        import threading
+
+        monkeypatch.setattr(os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(deployer_module, "HAS_ULTRALYTICS", True)
+        monkeypatch.setattr(deployer_module, "YOLO", FakeYOLO, raising=False)
+        FakeYOLO.exports = []
+
+        # Threads stand in for spawned processes, which would not see the fake
+        # YOLO; the work is still sent through pickle as spawn would send it
+        class ThreadPool(concurrent.futures.ThreadPoolExecutor):
+            def __init__(self, max_workers, mp_context):
+                assert mp_context.get_start_method() == "spawn"
+                super().__init__(max_workers=max_workers)
+
+            def submit(self, fn, *args):
+                fn, args = pickle.loads(pickle.dumps((fn, args)))
+                return super().submit(fn, *args)
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", ThreadPool)
+        barrier = threading.Barrier(2, timeout=5)
+        real_export = FakeYOLO.export
+
+        def concurrent_export(self, **kwargs):
+            barrier.wait()  # Both formats must be exporting at the same time
+            return real_export(self, **kwargs)
+
+        monkeypatch.setattr(FakeYOLO, "export", concurrent_export)
+        (tmp_path / ".croak").mkdir()
+        (tmp_path / "best.pt").write_bytes(b"weights")
+
+        result = ModelDeployer(tmp_path, state=PipelineState()).generate_deployment_package(
+            "best.pt", include_formats=["onnx", "torchscript"], include_sample_code=False,
+        )
+
+        package = tmp_path / "deployment-package"
+        assert [e["format"] for e in result["exports"]] == ["onnx", "torchscript"]
+        assert {e["input_model"] for e in result["exports"]} == {str(tmp_path / "best.pt")}
+        assert sorted(p.name for p in (package / "exports").iterdir()) == ["best.onnx", "best.torchscript"]
+        assert not (package / ".build").exists()
+        records = sorted((tmp_path / ".croak" / "exports").glob("export-*.json"))
+        assert len(records) == 2
+        assert {json.loads(r.read_text())["input_model"] for r in records} == {str(tmp_path / "best.pt")}
@@ -0,0 +1,197 @@
+"""Tests for CROAK model evaluation."""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from croak.evaluation import evaluator as evaluator_module
+from croak.core.state import PipelineState
+from croak.evaluation.evaluator import ModelEvaluator
+
+
+class FakeYOLO:
+    """Stand-in for ultralytics.YOLO that counts validation runs."""
+
+    runs = 0
+
+    def __init__(self, path):
+        self.path = path
+
+    def val(self, **kwargs):
+        FakeYOLO.runs += 1
+        box = SimpleNamespace(map50=0.8, map=0.6, mp=0.7, mr=0.5)
+        return SimpleNamespace(box=box)
+
+    def predict(self, source, **kwargs):
+        FakeYOLO.predict_calls.append((list(source), kwargs))
+        return [FakeYOLO.predictions[Path(p).name] for p in source]
+
+
+class FakeTensor(list):
+    """List with the tensor tolist() the evaluator calls."""
+
+    def tolist(self):
+        return list(self)
+
+
+def fake_result(*boxes):
+    """Prediction result with (class, xywhn) boxes."""
+    return SimpleNamespace(boxes=SimpleNamespace(
+        cls=FakeTensor(float(c) for c, _ in boxes),
+        xywhn=FakeTensor(list(b) for _, b in boxes),
+    ))
+
+
+class TestEvaluationCache:
+    """Test reuse of the last evaluation result."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(evaluator_module, "HAS_ULTRALYTICS", True)
+        monkeypatch.setattr(evaluator_module, "YOLO", FakeYOLO, raising=False)
+        FakeYOLO.runs = 0
+
+        (tmp_path / ".croak").mkdir()
+        (tmp_path / "best.pt").write_bytes(b"weights")
+        (tmp_path / "data.yaml").write_text("names: {0: a}\n")
+        return tmp_path
+
+    def test_evaluate_always_runs_and_saves_result(self, project):
+        """Test evaluate re-runs validation and keeps the latest result for report."""
+        evaluator = ModelEvaluator(project)
+
+        first = evaluator.evaluate("best.pt", data_yaml="data.yaml")
+        assert first["success"] and FakeYOLO.runs == 1
+        assert (project / ".croak" / "evaluations" / "last.json").exists()
+
+        second = evaluator.evaluate("best.pt", data_yaml="data.yaml", split="val")
+        assert FakeYOLO.runs == 2
+        assert evaluator.last_result("best.pt", data_yaml="data.yaml", split="val") == second
+
+    def test_last_result_reused_only_for_same_inputs(self, project):
+        """Test report reuses an evaluation only if it ran with the same data, thresholds and split."""
+        from croak.core.state import PipelineState
+
+        evaluator = ModelEvaluator(project, state=PipelineState(data_yaml_path=str(project / "data.yaml")))
+        assert evaluator.last_result("best.pt") is None
+
+        # Non-default split or thresholds are not what report would run
+        evaluator.evaluate("best.pt", split="val")
+        assert evaluator.last_result("best.pt") is None
+        assert evaluator.last_result("best.pt", split="val") is not None
+        evaluator.evaluate("best.pt", conf_threshold=0.4)
+        assert evaluator.last_result("best.pt") is None
+
+        result = evaluator.evaluate("best.pt")
+        assert evaluator.last_result("best.pt") == result
+
+        # Different data.yaml or model
+        (project / "other.yaml").write_text("names: {0: a}\n")
+        assert evaluator.last_result("best.pt", data_yaml="other.yaml") is None
+        (project / "other.pt").write_bytes(b"weights")
+        assert evaluator.last_result("other.pt") is None
+
+        os.utime(project / "best.pt", ns=(0, 0))
+        assert evaluator.last_result("best.pt") is None
+        assert FakeYOLO.runs == 3
+
+    def test_failed_cache_write_keeps_result(self, project, monkeypatch):
+        """Test an unwritable result cache does not fail the evaluation."""
+        def fail_replace(src, dst):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        result = ModelEvaluator(project).evaluate("best.pt", data_yaml="data.yaml")
+
+        assert result["success"] and FakeYOLO.runs == 1
+        names = [p.name for p in (project / ".croak" / "evaluations").iterdir()]
+        assert "last.json" not in names and not any(n.endswith(".tmp") for n in names)
+
+    def test_uses_given_state(self, project, monkeypatch):
+        """Test a state passed in by the caller is used instead of re-reading it."""
+        from croak.core.state import PipelineState
+
+        def fail_load(root):
+            raise AssertionError("state should not be reloaded")
+
+        monkeypatch.setattr(evaluator_module, "load_state", fail_load)
+        state = PipelineState(data_yaml_path=str(project / "data.yaml"))
+
+        result = ModelEvaluator(project, state=state).evaluate("best.pt")
+
+        assert result["success"]
+        assert result["data_yaml"] == str(project / "data.yaml")
+
+
+class TestReportCommand:
+    """Test the report command's output file."""
+
+    def test_report_written_as_utf8_with_lf(self, tmp_path, monkeypatch):
+        """Test the saved report is UTF-8 with LF newlines on every platform."""
+        from click.testing import CliRunner
+
+        from croak import cli
+        from croak.core.state import pipeline_state
+
+        monkeypatch.setattr(evaluator_module, "HAS_ULTRALYTICS", True)
+        monkeypatch.setattr(evaluator_module, "YOLO", FakeYOLO, raising=False)
+        monkeypatch.chdir(tmp_path)
+
+        runner = CliRunner()
+        assert runner.invoke(cli.main, ["init", "--name", "demo"]).exit_code == 0
+        (tmp_path / "best.pt").write_bytes(b"weights")
+        (tmp_path / "data.yaml").write_text("names: {0: a}\n")
+        with pipeline_state(tmp_path) as state:
+            state.data_yaml_path = str(tmp_path / "data.yaml")
+
+        result = runner.invoke(cli.main, ["report", "--model", "best.pt"])
+
+        assert result.exit_code == 0, result.output
+        [report] = (tmp_path / "evaluation" / "reports").glob("evaluation-report-*.md")
+        content = report.read_bytes()
+        assert b"\r\n" not in content
+        text = content.decode("utf-8")
+        assert text.startswith("#") and any(mark in text for mark in ("✅", "⚠"))
+
+
+class TestErrorAnalysis:
+    """Test error analysis over a sample of validation images."""
+
+    def test_single_batched_predict_classifies_errors(self, tmp_path, monkeypatch):
+        """Test all samples go through one predict call and errors are matched to labels."""
+        monkeypatch.setattr(evaluator_module, "HAS_ULTRALYTICS", True)
+        monkeypatch.setattr(evaluator_module, "YOLO", FakeYOLO, raising=False)
+        FakeYOLO.predict_calls = []
+        box = (0.5, 0.5, 0.2, 0.2)
+        FakeYOLO.predictions = {
+            "ok.jpg": fake_result((0, box)),
+            "wrong_class.jpg": fake_result((1, box)),
+            "offset.jpg": fake_result((0, (0.58, 0.5, 0.2, 0.2))),
+            "spurious.jpg": fake_result((0, box), (2, (0.1, 0.1, 0.05, 0.05))),
+            "missed.jpg": fake_result(),
+        }
+
+        (tmp_path / "best.pt").write_bytes(b"weights")
+        for split in ["images/val", "labels/val"]:
+            (tmp_path / "data" / split).mkdir(parents=True)
+        for name in FakeYOLO.predictions:
+            (tmp_path / "data" / "images" / "val" / name).write_bytes(b"")
+            (tmp_path / "data" / "labels" / "val" / name.replace(".jpg", ".txt")).write_text("0 0.5 0.5 0.2 0.2\n")
+        (tmp_path / "data" / "data.yaml").write_text("path: .\nval: images/val\nnames: {0: a}\n")
+
+        result = ModelEvaluator(tmp_path, state=PipelineState()).analyze_errors(
+            "best.pt", "data/data.yaml", num_samples=20,
+        )
+
+        assert result["success"] and result["images_analyzed"] == 5
+        assert len(FakeYOLO.predict_calls) == 1
+        assert FakeYOLO.predict_calls[0][1]["batch"] == 5
+        patterns = {k: [Path(e["image"]).name for e in v] for k, v in result["error_patterns"].items()}
+        assert patterns == {
+            "false_positives": ["spurious.jpg"],
+            "false_negatives": ["missed.jpg"],
+            "misclassifications": ["wrong_class.jpg"],
+            "localization_errors": ["offset.jpg"],
+        }
@@ -173,3 +173,18 @@ class TestSecureRunner:
                 )
                 resolved_tmpdir = str(Path(tmpdir).resolve())
                 assert tmpdir in result.stdout or resolved_tmpdir in result.stdout
+
+    def test_run_vfrog_parses_json_output(self):
+        """Test vfrog stdout is parsed when it is JSON and kept raw otherwise."""
+        import subprocess
+
+        def fake_run(stdout):
+            return subprocess.CompletedProcess(["vfrog"], 0, stdout=stdout, stderr="")
+
+        with patch.object(SecureRunner, "run", return_value=fake_run('{"items": [1, 2]}')):
+            result = SecureRunner.run_vfrog(["projects", "list"])
+        assert result["output"] == {"items": [1, 2]}
+
+        with patch.object(SecureRunner, "run", return_value=fake_run("not json")):
+            result = SecureRunner.run_vfrog(["projects", "list"])
+        assert result["output"] == "not json"
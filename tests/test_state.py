@@ -4,7 +4,14 @@ import pytest
 from pathlib import Path
 import tempfile
 
-from croak.core.state import PipelineState, Experiment, DatasetArtifact
+from croak.core.state import PipelineState, Experiment, DatasetArtifact, pipeline_state
+
+
+class _Explodes:
+    """Object whose unpickling fails the test."""
+
+    def __reduce__(self):
+        return (pytest.fail, ("sidecar was unpickled",))
 
 
 class TestPipelineState:
@@ -19,6 +26,16 @@ class TestPipelineState:
         assert state.stages_completed == []
         assert state.experiments == []
 
+    def test_package_level_export(self):
+        """Test PipelineState is reachable lazily from the croak package."""
+        import croak
+        import croak.core
+
+        assert croak.PipelineState is PipelineState
+        assert croak.core.PipelineState is PipelineState
+        with pytest.raises(AttributeError):
+            croak.NotAThing
+
     def test_save_and_load(self):
         """Test saving and loading state."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -36,6 +53,143 @@ class TestPipelineState:
             assert loaded.current_stage == "training"
             assert "data_preparation" in loaded.stages_completed
 
+    def test_load_uses_sidecar_until_file_changes(self):
+        """Test the pickle sidecar is used while the YAML is unchanged."""
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.yaml"
+            sidecar = Path(tmpdir) / "cache" / "state.yaml.pkl"
+
+            PipelineState(current_stage="training").save(state_path)
+            assert sidecar.exists()
+            assert PipelineState.load(state_path).current_stage == "training"
+
+            state_path.write_text(state_path.read_text().replace("training", "evaluation"))
+            os.utime(state_path, ns=(0, 0))
+
+            assert PipelineState.load(state_path).current_stage == "evaluation"
+
+    def test_stale_sidecar_never_unpickled(self):
+        """Test a sidecar whose header does not match the file is not loaded."""
+        import pickle
+
+        from croak.core import _yaml
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.yaml"
+            PipelineState(current_stage="training").save(state_path)
+            sidecar = Path(tmpdir) / "cache" / "state.yaml.pkl"
+            assert (Path(tmpdir) / "cache" / ".gitignore").read_text() == "*\n"
+
+            # E.g. committed to a repo; the payload would run code if unpickled
+            sidecar.write_bytes(
+                _yaml._SIDECAR_HEADER.pack(1, 2) + pickle.dumps(_Explodes())
+            )
+
+            assert PipelineState.load(state_path).current_stage == "training"
+
+    def test_saves_json_and_loads_legacy_yaml(self):
+        """Test state is written as JSON and old YAML state files still load."""
+        import json
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.yaml"
+
+            PipelineState(current_stage="training").save(state_path)
+            assert json.loads(state_path.read_text())["current_stage"] == "training"
+
+            legacy_path = Path(tmpdir) / "legacy.yaml"
+            legacy_path.write_text(
+                "current_stage: evaluation\nstages_completed:\n- data_preparation\n"
+            )
+            loaded = PipelineState.load(legacy_path)
+            assert loaded.current_stage == "evaluation"
+            assert loaded.stages_completed == ["data_preparation"]
+
+    def test_failed_save_keeps_previous_file(self):
+        """Test an interrupted save leaves the old state file intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.yaml"
+            PipelineState(current_stage="training").save(state_path)
+            before = state_path.read_text()
+
+            state = PipelineState(current_stage="evaluation")
+            state.workflow_artifacts["bad"] = {"obj": object()}
+            with pytest.raises(TypeError):
+                state.save(state_path)
+
+            assert state_path.read_text() == before
+            assert sorted(p.name for p in Path(tmpdir).iterdir()) == ["cache", "state.yaml"]
+
+    def test_save_defaults_to_loaded_path(self):
+        """Test a loaded state saves back to its file and the path is not serialized."""
+        import json
+
+        from croak.core.state import load_state, state_path
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            with pytest.raises(ValueError):
+                PipelineState().save()
+
+            state = load_state(root)
+            state.current_stage = "training"
+            state.save()
+
+            data = json.loads(state_path(root).read_text())
+            assert data["current_stage"] == "training"
+            assert "_path" not in data and "path" not in data
+            assert load_state(root).current_stage == "training"
+
+    def test_pipeline_state_context_saves_on_success_only(self):
+        """Test pipeline_state writes once on exit and skips the write on error."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+
+            with pipeline_state(root) as state:
+                state.current_stage = "training"
+                state.stages_completed.append("data_preparation")
+            assert PipelineState.load(root / ".croak" / "pipeline-state.yaml").current_stage == "training"
+
+            with pytest.raises(RuntimeError):
+                with pipeline_state(root) as state:
+                    state.current_stage = "evaluation"
+                    raise RuntimeError("command failed")
+            assert PipelineState.load(root / ".croak" / "pipeline-state.yaml").current_stage == "training"
+
+    def test_saved_as_utf8_under_ascii_locale(self, tmp_path):
+        """Test non-ASCII state is written as UTF-8 whatever the locale encoding."""
+        import json
+        import os
+        import subprocess
+        import sys
+
+        src_dir = Path(__file__).resolve().parent.parent / "src"
+        code = (
+            "import sys; from pathlib import Path; "
+            "from croak.core.state import PipelineState; "
+            "s = PipelineState(); s.add_warning('Donn\\u00e9es floues'); "
+            "s.save(Path(sys.argv[1]))"
+        )
+        subprocess.run(
+            [sys.executable, "-X", "utf8=0", "-c", code, str(tmp_path / "state.yaml")],
+            env={**os.environ, "PYTHONPATH": str(src_dir), "LC_ALL": "C", "PYTHONCOERCECLOCALE": "0"},
+            check=True,
+        )
+
+        data = json.loads((tmp_path / "state.yaml").read_bytes().decode("utf-8"))
+        assert data["warnings"] == ["Données floues"]
+
+    def test_save_sets_utc_timestamp(self):
+        """Test save stamps last_updated in UTC to the second."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state = PipelineState()
+            state.save(Path(tmpdir) / "state.yaml")
+
+            assert state.last_updated.endswith("+00:00")
+            assert "." not in state.last_updated
+
     def test_complete_stage(self):
         """Test completing stages."""
         state = PipelineState()
@@ -56,6 +210,19 @@ class TestPipelineState:
 
         assert state.stages_completed.count("data_scan") == 1
 
+    def test_repeated_stages_dropped_on_load(self):
+        """Test state files bloated by repeated runs load without duplicates."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "state.yaml"
+            state_path.write_text(
+                "stages_completed:\n- data_preparation\n- training\n- evaluation\n"
+                "- training\n- evaluation\n- evaluation\n"
+            )
+
+            loaded = PipelineState.load(state_path)
+
+            assert loaded.stages_completed == ["data_preparation", "training", "evaluation"]
+
     def test_add_warning(self):
         """Test adding warnings."""
         state = PipelineState()
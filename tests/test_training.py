@@ -0,0 +1,94 @@
+"""Tests for CROAK training orchestration."""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from croak.core.config import CroakConfig
+from croak.training.trainer import TrainingOrchestrator
+
+
+class InterruptedYOLO:
+    """Stand-in for ultralytics.YOLO whose training dies after one checkpoint."""
+
+    def __init__(self, model_file):
+        self.model_file = model_file
+
+    def train(self, project, name, **kwargs):
+        weights = Path(project) / name / "weights"
+        weights.mkdir(parents=True, exist_ok=True)
+        (weights / "last.pt").write_bytes(b"epoch 1")
+        raise RuntimeError("CUDA out of memory")
+
+
+class TestCheckpointIndex:
+    """Test the checkpoint index used by resume."""
+
+    def test_interrupted_run_is_resumable(self, tmp_path, monkeypatch):
+        """Test a run that fails mid-training is found via the index."""
+        monkeypatch.setitem(sys.modules, "ultralytics", SimpleNamespace(YOLO=InterruptedYOLO))
+        (tmp_path / ".croak").mkdir()
+        CroakConfig().save(tmp_path / ".croak" / "config.yaml")
+        orchestrator = TrainingOrchestrator(tmp_path)
+        assert orchestrator.latest_checkpoint() is None
+
+        experiments = tmp_path / "training" / "experiments"
+        for exp_id in ["exp-a", "exp-b"]:
+            result = orchestrator.train_local({
+                "architecture": "yolov8n", "data_yaml": "data.yaml", "epochs": 1,
+                "batch_size": 1, "image_size": 32, "seed": 42, "patience": 1,
+                "experiment_id": exp_id, "output_dir": str(experiments / exp_id),
+            })
+            assert not result["success"]
+
+        # The older experiment was written to last, e.g. by a manual resume
+        newest = experiments / "exp-a" / "weights" / "last.pt"
+        os.utime(experiments / "exp-b" / "weights" / "last.pt", (100, 100))
+        os.utime(newest, (200, 200))
+        assert orchestrator.latest_checkpoint() == str(newest)
+
+        # Deleted experiments are skipped
+        newest.unlink()
+        assert orchestrator.latest_checkpoint() == str(experiments / "exp-b" / "weights" / "last.pt")
+
+    def test_index_keyed_by_path_and_write_failure_ignored(self, tmp_path, monkeypatch):
+        """Test re-runs replace their entry and an unwritable index does not abort training."""
+        import json
+
+        (tmp_path / ".croak").mkdir()
+        CroakConfig().save(tmp_path / ".croak" / "config.yaml")
+        orchestrator = TrainingOrchestrator(tmp_path)
+        config = {"experiment_id": "exp-a", "output_dir": str(tmp_path / "exp-a")}
+
+        orchestrator._record_checkpoint(config)
+        orchestrator._record_checkpoint(config)
+        orchestrator._record_checkpoint({"experiment_id": "exp-b", "output_dir": str(tmp_path / "exp-b")})
+
+        index_path = tmp_path / ".croak" / "checkpoints.json"
+        entries = json.loads(index_path.read_text())
+        assert [e["experiment"] for e in entries] == ["exp-a", "exp-b"]
+
+        def fail_replace(src, dst):
+            raise PermissionError("read-only")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        orchestrator._record_checkpoint({"experiment_id": "exp-c", "output_dir": str(tmp_path / "exp-c")})
+
+        assert json.loads(index_path.read_text()) == entries
+        assert sorted(p.name for p in (tmp_path / ".croak").iterdir()) == ["cache", "checkpoints.json", "config.yaml"]
+
+    def test_uses_given_state(self, tmp_path, monkeypatch):
+        """Test a state passed in by the caller is used instead of re-reading it."""
+        from croak.core.state import PipelineState
+
+        (tmp_path / ".croak").mkdir()
+        CroakConfig().save(tmp_path / ".croak" / "config.yaml")
+
+        def fail_load(path):
+            raise AssertionError("state should not be reloaded")
+
+        monkeypatch.setattr(PipelineState, "load", fail_load)
+        state = PipelineState(current_stage="training")
+
+        assert TrainingOrchestrator(tmp_path, state=state).state is state
@@ -50,6 +50,12 @@ class TestVfrogCLICheckAuthenticated:
         mock_run.return_value = {"success": True, "output": "some string"}
         assert VfrogCLI.check_authenticated() is False
 
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_reuses_given_config_result(self, mock_run):
+        config_result = {"success": True, "output": {"authenticated": True}}
+        assert VfrogCLI.check_authenticated(config_result) is True
+        mock_run.assert_not_called()
+
 
 class TestVfrogCLIGetConfig:
     """Test get_config method."""
@@ -69,6 +75,69 @@ class TestVfrogCLIGetConfig:
         mock_run.assert_called_once_with(["config", "show"])
 
 
+class TestVfrogCLIConfigCache:
+    """Test get_config_cached method."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.delenv("CROAK_VFROG_CACHE", raising=False)
+        VfrogCLI.clear_config_cache()
+        yield
+        VfrogCLI.clear_config_cache()
+
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_reuses_result_in_process_and_on_disk(self, mock_run, tmp_path):
+        mock_run.return_value = {"success": True, "output": {"authenticated": True}}
+
+        assert VfrogCLI.get_config_cached() == mock_run.return_value
+        assert VfrogCLI.get_config_cached() == mock_run.return_value
+        assert mock_run.call_count == 1
+        assert (tmp_path / ".croak" / "vfrog-config-cache.json").exists()
+
+        # A fresh process finds the on-disk copy
+        from croak.integrations import vfrog
+        vfrog._clear_config_memo()
+        assert VfrogCLI.get_config_cached()["output"] == {"authenticated": True}
+        assert mock_run.call_count == 1
+
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_expired_disk_entry_is_refreshed(self, mock_run, monkeypatch):
+        from croak.integrations import vfrog
+
+        mock_run.return_value = {"success": True, "output": {"authenticated": True}}
+        VfrogCLI.get_config_cached()
+        vfrog._clear_config_memo()
+
+        now = vfrog.time.time()
+        monkeypatch.setattr(vfrog.time, "time", lambda: now + vfrog.CONFIG_CACHE_TTL + 1)
+        VfrogCLI.get_config_cached()
+        assert mock_run.call_count == 2
+
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_failures_are_not_cached(self, mock_run):
+        mock_run.return_value = {"success": False, "output": None, "error": "boom"}
+        VfrogCLI.get_config_cached()
+        VfrogCLI.get_config_cached()
+        assert mock_run.call_count == 2
+
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_context_change_clears_cache(self, mock_run):
+        mock_run.return_value = {"success": True, "output": {"project_id": "p1"}}
+        VfrogCLI.get_config_cached()
+        VfrogCLI.set_project("p2")
+        VfrogCLI.get_config_cached()
+        assert mock_run.call_count == 3
+
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_disabled_by_env(self, mock_run, monkeypatch):
+        monkeypatch.setenv("CROAK_VFROG_CACHE", "0")
+        mock_run.return_value = {"success": True, "output": {}}
+        VfrogCLI.get_config_cached()
+        VfrogCLI.get_config_cached()
+        assert mock_run.call_count == 2
+
+
 class TestVfrogCLIContextSetters:
     """Test context setter methods."""
 
@@ -141,6 +210,41 @@ class TestVfrogCLIDatasetImages:
         VfrogCLI.list_dataset_images()
         mock_run.assert_called_once_with(["dataset_images", "list"])
 
+    @patch("croak.integrations.vfrog._pagination_supported", True)
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_count_dataset_images_reads_pagination_total(self, mock_run):
+        mock_run.return_value = {
+            "success": True,
+            "output": {"data": [{"id": "a"}], "pagination": {"page": 1, "total": 12000}},
+        }
+        assert VfrogCLI.count_dataset_images() == 12000
+        mock_run.assert_called_once_with(["dataset_images", "list", "--limit", "1", "--page", "1"])
+
+    @patch("croak.integrations.vfrog._pagination_supported", True)
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_count_dataset_images_ignored_flags_count_the_list(self, mock_run):
+        mock_run.return_value = {"success": True, "output": [{"id": "a"}, {"id": "b"}]}
+        assert VfrogCLI.count_dataset_images() == 2
+        assert mock_run.call_count == 1
+
+    @patch("croak.integrations.vfrog._pagination_supported", True)
+    @patch("croak.core.commands.SecureRunner.run_vfrog")
+    def test_count_dataset_images_falls_back_to_list(self, mock_run):
+        import croak.integrations.vfrog as vfrog
+
+        mock_run.side_effect = [
+            {"success": False, "output": None, "error": "unknown flag: --limit"},
+            {"success": True, "output": [{"id": "a"}, {"id": "b"}]},
+            {"success": False, "output": None, "error": "boom"},
+        ]
+        assert VfrogCLI.count_dataset_images() == 2
+        assert mock_run.call_args_list[-1].args == (["dataset_images", "list"],)
+        assert vfrog._pagination_supported is False
+
+        # Not probed again; a failed listing counts as 0
+        assert VfrogCLI.count_dataset_images() == 0
+        assert mock_run.call_args_list[-1].args == (["dataset_images", "list"],)
+
     @patch("croak.core.commands.SecureRunner.run_vfrog")
     def test_delete_dataset_image(self, mock_run):
         mock_run.return_value = {"success": True, "output": {}}
@@ -235,6 +339,13 @@ class TestVfrogCLIIterations:
             ["iterations", "halo", "--iteration_id", "iter-123"]
         )
 
+    def test_extract_halo_url(self):
+        url = "https://halo.vfrog.ai/review/iter-123"
+        assert VfrogCLI.extract_halo_url({"success": True, "output": {"url": url}}) == url
+        assert VfrogCLI.extract_halo_url({"success": True, "output": {"halo_url": url}}) == url
+        assert VfrogCLI.extract_halo_url({"success": True, "output": url}) == url
+        assert VfrogCLI.extract_halo_url({"success": True, "output": None, "raw": url}) == url
+
     @patch("croak.core.commands.SecureRunner.run_vfrog")
     def test_next_iteration(self, mock_run):
         mock_run.return_value = {"success": True, "output": {"id": "iter-2"}}